@@ -0,0 +1,237 @@
+#!/usr/bin/env python
+"""
+Synthetic dataset generator for benchmarks.
+
+Builds deterministic source/comparison file pairs: the same spec and seed
+always produce byte-identical files, so benchmark runs are comparable
+across releases.
+
+Usage:
+    python benchmarks/generate_datasets.py --rows 1000000 --columns 20
+    python benchmarks/generate_datasets.py --rows 50000 --format xlsx --duplicate-rate 0.05
+"""
+
+import random
+from dataclasses import dataclass, asdict
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple
+import click
+import polars as pl
+from rich.console import Console
+
+
+console = Console()
+
+
+# Column types cycled through for each type mix
+TYPE_MIXES = {
+    "mixed": ["int", "float", "string", "date", "bool"],
+    "numeric": ["int", "float"],
+    "string": ["string"]
+}
+
+# Words used to build string values
+WORDS = [
+    "alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf", "hotel",
+    "india", "juliet", "kilo", "lima", "mike", "november", "oscar", "papa"
+]
+
+BASE_DATE = date(2020, 1, 1)
+
+
+@dataclass
+class DatasetSpec:
+    """Parameters of a generated source/comparison pair."""
+
+    rows: int = 100000
+    columns: int = 10                    # Non-key columns
+    key_cardinality: Optional[int] = None  # Distinct keys (None = one per row)
+    duplicate_rate: float = 0.0          # Share of rows reusing an already used key
+    mutation_rate: float = 0.01          # Share of rows with one modified cell
+    churn_rate: float = 0.001            # Share of rows removed (and as many added)
+    null_rate: float = 0.0               # Share of null cells
+    type_mix: Literal["mixed", "numeric", "string"] = "mixed"
+    file_format: Literal["csv", "xlsx"] = "csv"
+    seed: int = 42
+
+    def name(self) -> str:
+        """Short, filesystem-safe name identifying the spec."""
+        cardinality = self.key_cardinality if self.key_cardinality is not None else "all"
+        return (
+            f"r{self.rows}_c{self.columns}_k{cardinality}_d{self.duplicate_rate:g}"
+            f"_m{self.mutation_rate:g}_ch{self.churn_rate:g}_n{self.null_rate:g}"
+            f"_{self.type_mix}_s{self.seed}"
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return asdict(self)
+
+
+class DatasetGenerator:
+    """
+    Generate source/comparison file pairs from a DatasetSpec.
+    All randomness comes from one random.Random seeded by the spec.
+    """
+
+    KEY_COLUMN = "ID"
+
+    def __init__(self, spec: DatasetSpec):
+        """
+        Initialize dataset generator.
+
+        Args:
+            spec: Dataset parameters
+        """
+        self.spec = spec
+        self.random = random.Random(spec.seed)
+        self.column_types = [
+            TYPE_MIXES[spec.type_mix][i % len(TYPE_MIXES[spec.type_mix])]
+            for i in range(spec.columns)
+        ]
+        self.column_names = [f"{col_type}_{i}" for i, col_type in enumerate(self.column_types)]
+        self.generators: Dict[str, Callable[[], Any]] = {
+            "int": lambda: self.random.randrange(1_000_000),
+            "float": lambda: round(self.random.uniform(0, 100_000), 2),
+            "string": lambda: f"{self.random.choice(WORDS)} {self.random.choice(WORDS)} {self.random.randrange(1000)}",
+            "date": lambda: BASE_DATE + timedelta(days=self.random.randrange(3650)),
+            "bool": lambda: self.random.random() < 0.5
+        }
+
+    def generate(self, output_dir: Path) -> Tuple[Path, Path]:
+        """
+        Write the source and comparison files (skipped if they already exist).
+
+        Args:
+            output_dir: Directory for generated files
+
+        Returns:
+            Tuple of (source file, comparison file)
+        """
+        output_dir.mkdir(parents=True, exist_ok=True)
+        extension = self.spec.file_format
+        source_file = output_dir / f"{self.spec.name()}_source.{extension}"
+        comparison_file = output_dir / f"{self.spec.name()}_comparison.{extension}"
+
+        if source_file.exists() and comparison_file.exists():
+            return source_file, comparison_file
+
+        source = self._build_source()
+        comparison = self._build_comparison(source)
+
+        self._write(pl.DataFrame(source, schema=self._schema(), orient="row"), source_file)
+        self._write(pl.DataFrame(comparison, schema=self._schema(), orient="row"), comparison_file)
+
+        return source_file, comparison_file
+
+    def _schema(self) -> Dict[str, pl.DataType]:
+        """Schema of generated rows."""
+        dtypes = {
+            "int": pl.Int64,
+            "float": pl.Float64,
+            "string": pl.String,
+            "date": pl.Date,
+            "bool": pl.Boolean
+        }
+        return {
+            self.KEY_COLUMN: pl.Int64,
+            **{name: dtypes[col_type] for name, col_type in zip(self.column_names, self.column_types)}
+        }
+
+    def _build_source(self) -> List[List[Any]]:
+        """Generate source rows."""
+        cardinality = self.spec.key_cardinality or self.spec.rows
+        rows = []
+
+        for i in range(self.spec.rows):
+            if i > 0 and self.random.random() < self.spec.duplicate_rate:
+                key = rows[self.random.randrange(i)][0]
+            else:
+                key = i % cardinality
+            rows.append([key] + [self._value(col_type) for col_type in self.column_types])
+
+        return rows
+
+    def _build_comparison(self, source: List[List[Any]]) -> List[List[Any]]:
+        """Derive comparison rows: modify cells, drop rows and append new keys."""
+        comparison = []
+
+        for row in source:
+            if self.random.random() < self.spec.churn_rate:
+                continue
+
+            row = list(row)
+            if self.column_types and self.random.random() < self.spec.mutation_rate:
+                column = self.random.randrange(len(self.column_types))
+                row[column + 1] = self._mutate(self.column_types[column], row[column + 1])
+            comparison.append(row)
+
+        # Replace removed rows with rows under new keys
+        next_key = (self.spec.key_cardinality or self.spec.rows) + 1
+        for offset in range(len(source) - len(comparison)):
+            comparison.append([next_key + offset] + [self._value(col_type) for col_type in self.column_types])
+
+        return comparison
+
+    def _value(self, col_type: str) -> Any:
+        """Generate one cell value."""
+        if self.random.random() < self.spec.null_rate:
+            return None
+        return self.generators[col_type]()
+
+    def _mutate(self, col_type: str, value: Any) -> Any:
+        """Return a value guaranteed to differ from the given one."""
+        new_value = self.generators[col_type]()
+        while new_value == value:
+            new_value = self.generators[col_type]()
+        return new_value
+
+    def _write(self, df: pl.DataFrame, filepath: Path):
+        """Write a generated frame in the spec's format."""
+        if self.spec.file_format == "xlsx":
+            df.write_excel(filepath, worksheet="Data")
+        else:
+            df.write_csv(filepath)
+
+
+def dataset_options(command: Callable) -> Callable:
+    """Add the DatasetSpec options to a click command."""
+    options = [
+        click.option('--rows', type=int, default=100000, help='Rows in the source file (default: 100000)'),
+        click.option('--columns', type=int, default=10, help='Non-key columns (default: 10)'),
+        click.option('--key-cardinality', type=int, help='Distinct keys (default: one per row)'),
+        click.option('--duplicate-rate', type=float, default=0.0, help='Share of rows reusing an existing key (default: 0)'),
+        click.option('--mutation-rate', type=float, default=0.01, help='Share of rows with a modified cell (default: 0.01)'),
+        click.option('--churn-rate', type=float, default=0.001, help='Share of rows removed and replaced by new keys (default: 0.001)'),
+        click.option('--null-rate', type=float, default=0.0, help='Share of null cells (default: 0)'),
+        click.option('--type-mix', type=click.Choice(list(TYPE_MIXES)), default='mixed', help='Column types (default: mixed)'),
+        click.option('--format', 'file_format', type=click.Choice(['csv', 'xlsx']), default='csv', help='File format (default: csv)'),
+        click.option('--seed', type=int, default=42, help='Random seed (default: 42)')
+    ]
+    for option in reversed(options):
+        command = option(command)
+    return command
+
+
+@click.command()
+@dataset_options
+@click.option(
+    '--output-dir', '-o',
+    type=click.Path(file_okay=False, path_type=Path),
+    default=Path('benchmarks/data'),
+    help='Output directory (default: benchmarks/data)'
+)
+def main(output_dir: Path, **spec_options):
+    """Generate a deterministic source/comparison file pair."""
+    spec = DatasetSpec(**spec_options)
+
+    console.print(f"[yellow]Generating {spec.name()}...[/yellow]")
+    source_file, comparison_file = DatasetGenerator(spec).generate(output_dir)
+
+    console.print(f"[green]Source:[/green]     {source_file}")
+    console.print(f"[green]Comparison:[/green] {comparison_file}")
+
+
+if __name__ == "__main__":
+    main()
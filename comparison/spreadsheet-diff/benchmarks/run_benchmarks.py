@@ -0,0 +1,380 @@
+#!/usr/bin/env python
+"""
+Benchmark runner for FileComparer.
+
+Generates (or reuses) a deterministic dataset pair, runs every requested
+comparison engine on it in a fresh process, and writes rows/sec, peak RSS
+and per-phase timings as JSON so regressions can be tracked between releases.
+The run fails when engines report different differences for the same data,
+or when the columnar and per-row row hashes disagree on a generated file.
+
+Usage:
+    python benchmarks/run_benchmarks.py --rows 1000000
+    python benchmarks/run_benchmarks.py --rows 200000 --engines vectorized,two-phase --repeat 3
+    python benchmarks/run_benchmarks.py --rows 50000 --format xlsx --duplicate-rate 0.05
+    python benchmarks/run_benchmarks.py --rows 20000 --null-rate 0.05 --engines vectorized,index
+    python benchmarks/run_benchmarks.py --rows 20000 --duplicate-rate 0.1 --null-rate 0.1 --sort-by int_0
+"""
+
+import contextlib
+import hashlib
+import io
+import json
+import multiprocessing
+import os
+import platform
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import click
+import polars as pl
+from rich.console import Console
+from rich.table import Table
+
+# Add tool root and benchmarks directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from generate_datasets import DatasetGenerator, DatasetSpec, dataset_options
+from src.config.settings import ComparisonSettings
+from src.core.comparer import FileComparer
+from src.core.hash_engine import RowHashEngine
+from src.io.readers import FileReader
+from src.utils.performance import PerformanceMonitor
+
+try:
+    import resource
+    HAS_RESOURCE = True
+except ImportError:
+    HAS_RESOURCE = False
+
+
+console = Console()
+
+
+ENGINES = ["vectorized", "index", "two-phase", "sort-merge", "partitioned"]
+
+# Rows per file checked for columnar/per-row hash agreement (the per-row path is slow)
+HASH_CHECK_ROWS = 100_000
+
+
+def _peak_rss_mb(who: int) -> Optional[float]:
+    """
+    Peak resident set size reported by the OS.
+
+    Args:
+        who: resource.RUSAGE_SELF or resource.RUSAGE_CHILDREN
+
+    Returns:
+        Peak RSS in MB, or None where unavailable
+    """
+    if not HAS_RESOURCE:
+        return None
+
+    max_rss = resource.getrusage(who).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and kilobytes elsewhere
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return max_rss / divisor
+
+
+def _run_comparison(
+    settings_data: Dict[str, Any],
+    source_file: Path,
+    comparison_file: Path,
+    key_column: str
+) -> Dict[str, Any]:
+    """
+    Run one comparison (process pool entry point, so peak RSS is per run).
+
+    Args:
+        settings_data: ComparisonSettings as a dictionary
+        source_file: Path to source file
+        comparison_file: Path to comparison file
+        key_column: Key column
+
+    Returns:
+        Dictionary of measurements
+    """
+    settings = ComparisonSettings.from_dict(settings_data)
+    comparer = FileComparer(settings)
+    monitor = PerformanceMonitor("Benchmark")
+
+    # Keep the comparer's console output out of the benchmark report
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        success = comparer.compare_files(source_file, comparison_file, key_column)
+    seconds = time.perf_counter() - start
+    monitor.complete()
+
+    summary = comparer.diff_tracker.get_summary().to_dict() if comparer.diff_tracker else {}
+    rows = summary.get("total_source_rows", 0) + summary.get("total_comparison_rows", 0)
+
+    # Read peak RSS before the report is loaded for the digest
+    peak_rss_mb = _peak_rss_mb(resource.RUSAGE_SELF) if HAS_RESOURCE else monitor.metrics.peak_memory_mb
+    peak_child_rss_mb = _peak_rss_mb(resource.RUSAGE_CHILDREN) if HAS_RESOURCE else None
+
+    return {
+        "success": success,
+        "engine": comparer.engine,
+        "plan": comparer.plan.to_dict() if comparer.plan else None,
+        "seconds": seconds,
+        "rows": rows,
+        "rows_per_sec": rows / seconds if seconds > 0 else 0.0,
+        "peak_rss_mb": peak_rss_mb,
+        "peak_child_rss_mb": peak_child_rss_mb,
+        "phase_timings": comparer.phase_timings,
+        "summary": summary,
+        "differences_digest": _differences_digest(settings.output_dir) if success else None
+    }
+
+
+def _differences_digest(output_dir: Path) -> str:
+    """
+    Digest of a run's CSV report, independent of the order engines emit differences in.
+    (Spilled differences are deleted once compare_files returns, so the report is read.)
+
+    Args:
+        output_dir: The run's output directory
+
+    Returns:
+        MD5 hex digest of the sorted differences as CSV (empty when nothing was reported)
+    """
+    reports = sorted(output_dir.glob("differences_*.csv"))
+    if not reports:
+        return hashlib.md5(b"").hexdigest()
+
+    differences = pl.read_csv(reports[-1], infer_schema_length=0)
+    differences = differences.sort(differences.columns)
+    return hashlib.md5(differences.write_csv().encode("utf-8")).hexdigest()
+
+
+def engine_mismatches(report: Dict[str, Any]) -> List[str]:
+    """
+    Find engines whose differences disagree with the first successful run.
+
+    Args:
+        report: Benchmark report
+
+    Returns:
+        Descriptions of the mismatching runs (empty when all engines agree)
+    """
+    runs = [result for result in report["results"] if result["success"]]
+    if not runs:
+        return []
+
+    reference = runs[0]
+    return [
+        f"{result['requested_engine']} (run {result['run']}): "
+        f"{result['summary'].get('field_differences', 0):,} differences, digest {result['differences_digest']} "
+        f"!= {reference['requested_engine']} digest {reference['differences_digest']}"
+        for result in runs[1:]
+        if result["differences_digest"] != reference["differences_digest"]
+    ]
+
+
+def check_hash_consistency(settings: ComparisonSettings, files: List[Path]) -> Dict[str, bool]:
+    """
+    Check that the columnar and per-row hash paths group rows identically.
+    Files are read the way the engines read them, so mixed types, nulls,
+    NaN and float precision in the generated data are all exercised.
+
+    Args:
+        settings: Settings for reading and hashing
+        files: Files to check (the first HASH_CHECK_ROWS rows of each)
+
+    Returns:
+        Mapping of file path to whether both hash paths agree
+    """
+    reader = FileReader(settings)
+    hash_engine = RowHashEngine(settings.use_fast_hash, settings.use_columnar_hash)
+
+    results = {}
+    for filepath in files:
+        df = next(reader.read_chunked(filepath, HASH_CHECK_ROWS), pl.DataFrame())
+        results[str(filepath)] = hash_engine.verify_hash_consistency(df)
+    return results
+
+
+def run_benchmarks(
+    spec: DatasetSpec,
+    engines: List[str],
+    repeat: int,
+    hardware: str,
+    data_dir: Path,
+    sort_columns: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Benchmark each engine on the dataset described by spec.
+
+    Args:
+        spec: Dataset parameters
+        engines: Comparison engines to run
+        repeat: Runs per engine
+        hardware: Hardware profile for ComparisonSettings
+        data_dir: Directory for generated datasets
+        sort_columns: Columns ordering duplicate keys (comma-separated, None = file order)
+
+    Returns:
+        Benchmark report (environment, dataset and per-run results)
+    """
+    console.print(f"[yellow]Preparing dataset {spec.name()}...[/yellow]")
+    source_file, comparison_file = DatasetGenerator(spec).generate(data_dir)
+
+    hash_consistency = check_hash_consistency(
+        ComparisonSettings.from_hardware_profile(hardware, key_column=DatasetGenerator.KEY_COLUMN),
+        [source_file, comparison_file]
+    )
+
+    results = []
+    # spawn gives every run a fresh process (clean peak RSS, no forked Polars threads)
+    context = multiprocessing.get_context("spawn")
+
+    with tempfile.TemporaryDirectory(prefix="spreadsheet-diff-bench-") as output_dir:
+        for engine in engines:
+            for run in range(1, repeat + 1):
+                settings = ComparisonSettings.from_hardware_profile(
+                    hardware,
+                    key_column=DatasetGenerator.KEY_COLUMN,
+                    comparison_engine=engine,
+                    sort_columns=sort_columns,
+                    output_dir=Path(output_dir) / f"{engine}_{run}",
+                    output_format="csv",
+                    generate_html_report=False,
+                    show_progress=False
+                )
+
+                console.print(f"[cyan]Running {engine} (run {run}/{repeat})...[/cyan]")
+                # Pool workers must not be daemonic: the partitioned engine starts its own processes
+                with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                    result = executor.submit(
+                        _run_comparison,
+                        settings.model_dump(),
+                        source_file,
+                        comparison_file,
+                        DatasetGenerator.KEY_COLUMN
+                    ).result()
+
+                result.update({"requested_engine": engine, "run": run})
+                results.append(result)
+
+    return {
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "environment": {
+            "python": platform.python_version(),
+            "polars": pl.__version__,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "hardware_profile": hardware,
+            "sort_columns": sort_columns
+        },
+        "dataset": {
+            **spec.to_dict(),
+            "source_file": str(source_file),
+            "comparison_file": str(comparison_file),
+            "source_size_bytes": source_file.stat().st_size,
+            "comparison_size_bytes": comparison_file.stat().st_size
+        },
+        "hash_consistency": hash_consistency,
+        "results": results
+    }
+
+
+def print_report(report: Dict[str, Any]):
+    """Print benchmark results as a table."""
+    table = Table(title=f"Benchmark: {report['dataset']['rows']:,} rows")
+    table.add_column("Engine")
+    table.add_column("Run", justify="right")
+    table.add_column("Seconds", justify="right")
+    table.add_column("Rows/sec", justify="right")
+    table.add_column("Peak RSS (MB)", justify="right")
+    table.add_column("Differences", justify="right")
+
+    for result in report["results"]:
+        table.add_row(
+            result["requested_engine"] if result["success"] else f"[red]{result['requested_engine']} (failed)[/red]",
+            str(result["run"]),
+            f"{result['seconds']:.2f}",
+            f"{result['rows_per_sec']:,.0f}",
+            f"{result['peak_rss_mb']:,.0f}" if result["peak_rss_mb"] is not None else "-",
+            f"{result['summary'].get('field_differences', 0):,}"
+        )
+
+    console.print(table)
+
+
+@click.command()
+@dataset_options
+@click.option(
+    '--engines',
+    type=str,
+    default=",".join(ENGINES),
+    help=f'Comma-separated engines to run (default: {",".join(ENGINES)})'
+)
+@click.option('--repeat', type=int, default=1, help='Runs per engine (default: 1)')
+@click.option(
+    '--hardware',
+    type=click.Choice(['high-end', 'standard', 'low-tier'], case_sensitive=False),
+    default='high-end',
+    help='Hardware profile for the comparisons (default: high-end)'
+)
+@click.option(
+    '--data-dir',
+    type=click.Path(file_okay=False, path_type=Path),
+    default=Path('benchmarks/data'),
+    help='Directory for generated datasets, reused across runs (default: benchmarks/data)'
+)
+@click.option(
+    '--sort-by',
+    help='Columns ordering rows within duplicate key groups, e.g. int_0 (comma-separated)'
+)
+@click.option(
+    '--output', '-o',
+    type=click.Path(dir_okay=False, path_type=Path),
+    help='JSON report path (default: benchmarks/results/benchmark_<timestamp>.json)'
+)
+def main(
+    engines: str,
+    repeat: int,
+    hardware: str,
+    data_dir: Path,
+    sort_by: Optional[str],
+    output: Optional[Path],
+    **spec_options
+):
+    """Benchmark comparison engines on a generated dataset."""
+    engine_list = [engine.strip().lower() for engine in engines.split(",") if engine.strip()]
+    unknown = [engine for engine in engine_list if engine not in ENGINES]
+    if unknown:
+        raise click.BadParameter(f"Unknown engine(s): {', '.join(unknown)}", param_hint="--engines")
+
+    report = run_benchmarks(DatasetSpec(**spec_options), engine_list, repeat, hardware.lower(), data_dir, sort_by)
+    print_report(report)
+
+    if output is None:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output = Path("benchmarks/results") / f"benchmark_{timestamp}.json"
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2, default=str), encoding="utf-8")
+    console.print(f"[green]Report saved:[/green] {output}")
+
+    failed = False
+    for filepath, consistent in report["hash_consistency"].items():
+        if not consistent:
+            console.print(f"[red]Hash mismatch:[/red] columnar and per-row hashes group rows differently in {filepath}")
+            failed = True
+
+    mismatches = engine_mismatches(report)
+    for mismatch in mismatches:
+        console.print(f"[red]Engine mismatch:[/red] {mismatch}")
+
+    if failed or mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
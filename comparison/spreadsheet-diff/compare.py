@@ -56,6 +56,11 @@ logger = setup_logger(__name__)
     type=str,
     help='Columns to exclude from comparison (comma-separated: "LastModified,UpdatedAt")'
 )
+@click.option(
+    '--columns',
+    type=str,
+    help='Only compare these columns; other columns are not read (comma-separated: "Price,Quantity")'
+)
 @click.option(
     '--output-dir', '-o',
     type=click.Path(path_type=Path),
@@ -64,9 +69,20 @@ logger = setup_logger(__name__)
 )
 @click.option(
     '--format', '-f',
-    type=click.Choice(['csv', 'excel', 'both'], case_sensitive=False),
+    type=click.Choice(['csv', 'excel', 'both', 'parquet', 'arrow'], case_sensitive=False),
     default='excel',
-    help='Output format (default: excel)'
+    help='Output format: csv, excel, both (csv and excel), parquet or arrow (typed columns for Polars/DuckDB). Default: excel'
+)
+@click.option(
+    '--compression',
+    type=click.Choice(['zstd', 'lz4', 'snappy', 'gzip', 'uncompressed'], case_sensitive=False),
+    default='zstd',
+    help='Compression of parquet and arrow output (arrow: zstd, lz4 or uncompressed). Default: zstd'
+)
+@click.option(
+    '--excel-rows-per-workbook',
+    type=int,
+    help='Split Excel output into workbooks of at most this many differences, written in parallel (default: one workbook; rows beyond the sheet limit continue on extra sheets)'
 )
 @click.option(
     '--chunk-size', '-c',
@@ -74,11 +90,39 @@ logger = setup_logger(__name__)
     default=100000,
     help='Number of rows to process at once (default: 100000)'
 )
+@click.option(
+    '--engine',
+    type=click.Choice(['auto', 'vectorized', 'index', 'two-phase', 'sort-merge', 'partitioned'], case_sensitive=False),
+    default='auto',
+    help='Comparison engine: auto, vectorized (in-memory join), index (chunked), two-phase (hashes first, re-reads only changed rows), sort-merge (out-of-core, bounded by profile memory), partitioned (key-hash buckets compared in parallel processes). Default: auto'
+)
+@click.option(
+    '--row-count',
+    type=click.Choice(['exact', 'quoted', 'estimate'], case_sensitive=False),
+    default='exact',
+    help='How CSV rows are counted for engine selection and progress: exact (line breaks), quoted (skips line breaks inside quoted fields, slower), estimate (from the first rows). Default: exact'
+)
+@click.option(
+    '--temp-dir',
+    type=click.Path(file_okay=False, path_type=Path),
+    help='Directory for temporary spill files (default: system temp directory)'
+)
+@click.option(
+    '--cache-dir',
+    type=click.Path(file_okay=False, path_type=Path),
+    help='Cache source row fingerprints here and reuse them on later runs against the same source (index and two-phase engines)'
+)
 @click.option(
     '--no-html',
     is_flag=True,
     help='Skip HTML report generation'
 )
+@click.option(
+    '--html-mode',
+    type=click.Choice(['auto', 'inline', 'paged'], case_sensitive=False),
+    default='auto',
+    help='HTML report layout: inline (rows embedded in the page, up to 50,000), paged (all rows in compressed data chunks next to the page, loaded incrementally) or auto (paged above 50,000 differences). Default: auto'
+)
 @click.option(
     '--enable-search-panes/--no-search-panes',
     default=True,
@@ -111,25 +155,57 @@ logger = setup_logger(__name__)
     default='high-end',
     help='Hardware profile: high-end (24GB+ RAM, 8+ cores), standard (8-16GB, 4-8 cores), low-tier (4-8GB, 2-4 cores). Default: high-end'
 )
+@click.option(
+    '--trace',
+    type=click.Path(dir_okay=False, path_type=Path),
+    help='Write a JSON trace of per-phase timings, CPU time, rows and peak memory here, plus a Chrome trace (<name>.chrome.json)'
+)
+@click.option(
+    '--profile',
+    is_flag=True,
+    help='Capture a cProfile profile (<trace name>.prof, viewable with snakeviz or pstats)'
+)
+@click.option(
+    '--trace-memory',
+    is_flag=True,
+    help='Record top Python allocation sites with tracemalloc in the trace (slows processing)'
+)
+@click.option(
+    '--explain',
+    is_flag=True,
+    help='Print the optimized Polars query plan of the vectorized engine (shows projection and predicate pushdown)'
+)
 def main(
     source_file: Path,
     comparison_file: Path,
     key: Optional[str],
     sort_by: Optional[str],
     exclude: Optional[str],
+    columns: Optional[str],
     output_dir: Path,
     format: str,
+    compression: str,
+    excel_rows_per_workbook: Optional[int],
     chunk_size: int,
+    engine: str,
+    row_count: str,
+    temp_dir: Optional[Path],
+    cache_dir: Optional[Path],
     no_html: bool,
+    html_mode: str,
     enable_search_panes: bool,
     filter_columns: Optional[str],
     case_insensitive: bool,
     ignore_whitespace: bool,
     log_level: str,
-    hardware: str
+    hardware: str,
+    trace: Optional[Path],
+    profile: bool,
+    trace_memory: bool,
+    explain: bool
 ):
     """
-    Compare two files (CSV or Excel) and generate difference report.
+    Compare two files (CSV, Excel, Parquet or Arrow) and generate difference report.
 
     SOURCE_FILE: Path to source/reference file (the "truth")
     COMPARISON_FILE: Path to file to compare against source
@@ -151,8 +227,35 @@ def main(
         Custom output:
         $ python compare.py file1.csv file2.csv -o ./output -f both
 
+        Typed differences for Polars/DuckDB jobs:
+        $ python compare.py file1.csv file2.csv --key ID -f parquet --no-html
+
+        Very large diff sets as Excel, one workbook per 500k differences:
+        $ python compare.py large1.csv large2.csv --key ID --excel-rows-per-workbook 500000
+
         Large files (10M+ rows):
         $ python compare.py large1.csv large2.csv --chunk-size 50000
+
+        Files larger than RAM:
+        $ python compare.py huge1.csv huge2.csv --key ID --engine sort-merge
+
+        Parallel comparison on many cores:
+        $ python compare.py large1.csv large2.csv --key ID --engine partitioned
+
+        Mostly identical large files (keeps only row hashes in memory):
+        $ python compare.py large1.csv large2.csv --key ID --engine two-phase
+
+        Parquet, Arrow IPC and compressed CSV inputs:
+        $ python compare.py extract.parquet today.csv.gz --key ID
+
+        Same source against many files (reuses source fingerprints):
+        $ python compare.py golden.csv today.csv --key ID --cache-dir ~/.cache/spreadsheet-diff
+
+        Inspect the vectorized engine's query plan:
+        $ python compare.py file1.parquet file2.parquet --key ID --engine vectorized --explain
+
+        Find where a slow run spends its time:
+        $ python compare.py large1.csv large2.csv --key ID --trace trace.json --profile
     """
 
     # Display header
@@ -170,14 +273,26 @@ def main(
         key_column=key,
         sort_columns=sort_by,
         exclude_columns=exclude,
+        compare_columns=columns,
         output_dir=output_dir,
         output_format=format.lower(),
+        output_compression=compression.lower(),
+        excel_rows_per_workbook=excel_rows_per_workbook,
+        comparison_engine=engine.lower(),
+        row_count_mode=row_count.lower(),
+        temp_dir=temp_dir,
+        fingerprint_cache_dir=cache_dir,
         generate_html_report=not no_html,
+        html_report_mode=html_mode.lower(),
         enable_search_panes=enable_search_panes,
         search_panes_columns=filter_columns,
         case_sensitive=not case_insensitive,
         ignore_whitespace=ignore_whitespace,
-        log_level=log_level.upper()
+        log_level=log_level.upper(),
+        trace_file=trace,
+        profile_cpu=profile,
+        trace_memory=trace_memory,
+        explain_plan=explain
     )
 
     # Allow chunk_size override if explicitly provided
@@ -195,10 +310,21 @@ def main(
         console.print(f"  Key column:       [yellow]Auto-detect[/yellow]")
     if exclude:
         console.print(f"  Excluding:        [yellow]{exclude}[/yellow]")
+    if columns:
+        console.print(f"  Comparing:        [green]{columns}[/green]")
     console.print(f"  Output directory: [blue]{output_dir}[/blue]")
     console.print(f"  Output format:    {format}")
     console.print(f"  Chunk size:       {settings.chunk_size:,} rows")
-    console.print(f"  HTML report:      {'No' if no_html else 'Yes'}")
+    console.print(f"  Engine:           {settings.comparison_engine}")
+    if cache_dir:
+        console.print(f"  Cache directory:  [blue]{cache_dir}[/blue]")
+    console.print(f"  HTML report:      {'No' if no_html else f'Yes ({html_mode.lower()})'}")
+    if trace or profile or trace_memory:
+        profiling = ", ".join(
+            name for name, enabled in (("spans", True), ("cProfile", profile), ("tracemalloc", trace_memory))
+            if enabled
+        )
+        console.print(f"  Tracing:          [blue]{trace or output_dir}[/blue] ({profiling})")
 
     # Estimate file sizes
     source_size_mb = source_file.stat().st_size / (1024 * 1024)
@@ -89,11 +89,46 @@ class ComparisonSettings(BaseModel):
         description="Skip chunking and load entire file if row count below this threshold"
     )
 
+    row_count_mode: Literal["exact", "quoted", "estimate"] = Field(
+        default="exact",
+        description="How CSV rows are counted: exact (line breaks), quoted (line breaks outside quoted fields) or estimate (from the first rows)"
+    )
+
     enable_polars_parallel: bool = Field(
         default=True,
         description="Enable Polars parallel processing (uses all CPU cores)"
     )
 
+    comparison_engine: Literal["auto", "vectorized", "index", "two-phase", "sort-merge", "partitioned"] = Field(
+        default="auto",
+        description="Comparison strategy (auto = fastest engine whose estimated peak memory fits max_memory_mb)"
+    )
+
+    streaming_join: bool = Field(
+        default=True,
+        description="Run the vectorized engine's lazy join plan with Polars' streaming engine"
+    )
+
+    temp_dir: Optional[Path] = Field(
+        default=None,
+        description="Directory for temporary spill files (None = system temp directory)"
+    )
+
+    diff_spill_threshold_rows: int = Field(
+        default=1000000,
+        description="Differences held in memory before they are spilled to a temporary file (0 = never spill)"
+    )
+
+    fingerprint_cache_dir: Optional[Path] = Field(
+        default=None,
+        description="Directory for cached source row fingerprints reused across runs (None = no caching)"
+    )
+
+    fingerprint_cache_max_mb: int = Field(
+        default=2048,
+        description="Size limit for the fingerprint cache; least recently used entries are evicted"
+    )
+
     # Comparison settings
     key_column: Optional[str] = Field(
         default=None,
@@ -110,6 +145,11 @@ class ComparisonSettings(BaseModel):
         description="Columns to exclude from comparison (comma-separated)"
     )
 
+    compare_columns: Optional[str] = Field(
+        default=None,
+        description="Only compare these columns (comma-separated); other columns are not read. None = all columns"
+    )
+
     case_sensitive: bool = Field(
         default=True,
         description="Case-sensitive string comparison"
@@ -121,9 +161,24 @@ class ComparisonSettings(BaseModel):
     )
 
     # Output settings
-    output_format: Literal["csv", "excel", "both"] = Field(
+    output_format: Literal["csv", "excel", "both", "parquet", "arrow"] = Field(
         default="excel",
-        description="Output format for difference reports"
+        description="Output format for difference reports (parquet and arrow keep the key columns' types)"
+    )
+
+    output_compression: Literal["zstd", "lz4", "snappy", "gzip", "uncompressed"] = Field(
+        default="zstd",
+        description="Compression codec of Parquet and Arrow IPC output (Arrow supports zstd, lz4 and uncompressed)"
+    )
+
+    parallel_writers: bool = Field(
+        default=True,
+        description="Write the output formats concurrently (Excel in its own process for large difference sets)"
+    )
+
+    excel_rows_per_workbook: Optional[int] = Field(
+        default=None,
+        description="Split Excel output into workbooks of at most this many differences, written in parallel. None = one workbook (differences beyond a sheet's row limit continue on Differences_2, Differences_3, ... sheets)"
     )
 
     output_dir: Path = Field(
@@ -141,6 +196,11 @@ class ComparisonSettings(BaseModel):
         description="Generate interactive HTML report"
     )
 
+    html_report_mode: Literal["auto", "inline", "paged"] = Field(
+        default="auto",
+        description="HTML report layout: inline (rows embedded in the page, up to 50,000), paged (all rows in compressed data chunks next to the page, loaded incrementally) or auto (paged above 50,000 differences)"
+    )
+
     # HTML Report - SearchPanes (Column Filtering)
     enable_search_panes: bool = Field(
         default=True,
@@ -184,6 +244,11 @@ class ComparisonSettings(BaseModel):
         description="Use xxhash (faster) instead of hashlib (falls back if unavailable)"
     )
 
+    use_columnar_hash: bool = Field(
+        default=True,
+        description="Hash rows with vectorized Polars expressions (falls back to per-row Python hashing)"
+    )
+
     # Logging
     log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR"] = Field(
         default="INFO",
@@ -195,6 +260,27 @@ class ComparisonSettings(BaseModel):
         description="Show progress bars during processing"
     )
 
+    # Profiling
+    trace_file: Optional[Path] = Field(
+        default=None,
+        description="Write a JSON trace of per-phase spans here, plus a Chrome trace (<name>.chrome.json) next to it"
+    )
+
+    profile_cpu: bool = Field(
+        default=False,
+        description="Capture a cProfile profile of the comparison (<trace name>.prof)"
+    )
+
+    trace_memory: bool = Field(
+        default=False,
+        description="Record top Python allocation sites with tracemalloc in the trace (slows processing)"
+    )
+
+    explain_plan: bool = Field(
+        default=False,
+        description="Print the optimized Polars query plan of the vectorized engine before running it"
+    )
+
     # Validation
     @field_validator('chunk_size')
     @classmethod
@@ -214,6 +300,14 @@ class ComparisonSettings(BaseModel):
             raise ValueError("Maximum memory must be at least 512 MB")
         return v
 
+    @field_validator('excel_rows_per_workbook')
+    @classmethod
+    def validate_excel_rows_per_workbook(cls, v):
+        """Validate workbook split size."""
+        if v is not None and v < 1000:
+            raise ValueError("Rows per Excel workbook must be at least 1000")
+        return v
+
     @field_validator('output_dir')
     @classmethod
     def validate_output_dir(cls, v):
@@ -273,6 +367,17 @@ class ComparisonSettings(BaseModel):
             return []
         return [col.strip() for col in self.exclude_columns.split(',') if col.strip()]
 
+    def get_compare_columns(self) -> list[str]:
+        """
+        Parse compare_columns into list of column names.
+
+        Returns:
+            List of columns to compare (empty = all columns)
+        """
+        if not self.compare_columns:
+            return []
+        return [col.strip() for col in self.compare_columns.split(',') if col.strip()]
+
     def get_search_panes_filter_columns(self) -> Optional[list[str]]:
         """
         Parse search_panes_columns into list of column names.
@@ -375,6 +480,8 @@ class FileFormat:
 
     CSV = "csv"
     EXCEL = "excel"
+    PARQUET = "parquet"
+    ARROW = "arrow"
 
     # Excel limitations
     EXCEL_MAX_ROWS = 1048576
@@ -383,17 +490,59 @@ class FileFormat:
     # File extensions
     CSV_EXTENSIONS = {".csv", ".txt", ".tsv"}
     EXCEL_EXTENSIONS = {".xlsx", ".xls", ".xlsm", ".xlsb"}
+    PARQUET_EXTENSIONS = {".parquet", ".pq"}
+    ARROW_EXTENSIONS = {".arrow", ".feather", ".ipc"}
+
+    # Compression suffixes accepted after a CSV extension (e.g. data.csv.gz)
+    CSV_COMPRESSIONS = {".gz": "gzip", ".zst": "zstd"}
 
     @classmethod
     def is_csv(cls, filepath: Path) -> bool:
-        """Check if file is CSV format."""
-        return filepath.suffix.lower() in cls.CSV_EXTENSIONS
+        """Check if file is CSV format (plain or compressed)."""
+        return filepath.suffix.lower() in cls.CSV_EXTENSIONS or cls.get_compression(filepath) is not None
+
+    @classmethod
+    def get_compression(cls, filepath: Path) -> Optional[str]:
+        """
+        Get the compression codec of a compressed CSV file.
+
+        Args:
+            filepath: Path to file
+
+        Returns:
+            "gzip" or "zstd", or None if the file is not a compressed CSV
+        """
+        codec = cls.CSV_COMPRESSIONS.get(filepath.suffix.lower())
+        if codec is None or Path(filepath.stem).suffix.lower() not in cls.CSV_EXTENSIONS:
+            return None
+        return codec
 
     @classmethod
     def is_excel(cls, filepath: Path) -> bool:
         """Check if file is Excel format."""
         return filepath.suffix.lower() in cls.EXCEL_EXTENSIONS
 
+    @classmethod
+    def is_parquet(cls, filepath: Path) -> bool:
+        """Check if file is Parquet format."""
+        return filepath.suffix.lower() in cls.PARQUET_EXTENSIONS
+
+    @classmethod
+    def is_arrow(cls, filepath: Path) -> bool:
+        """Check if file is Arrow IPC / Feather format."""
+        return filepath.suffix.lower() in cls.ARROW_EXTENSIONS
+
+    @classmethod
+    def describe_supported(cls) -> str:
+        """List supported formats and their extensions for error messages."""
+        compressed = ", ".join(f"{ext}{suffix}" for ext in sorted(cls.CSV_EXTENSIONS) for suffix in cls.CSV_COMPRESSIONS)
+        return (
+            f"CSV ({', '.join(sorted(cls.CSV_EXTENSIONS))}, compressed: {compressed}), "
+            f"Excel ({', '.join(sorted(cls.EXCEL_EXTENSIONS))}), "
+            f"Parquet ({', '.join(sorted(cls.PARQUET_EXTENSIONS))}) "
+            f"or Arrow IPC ({', '.join(sorted(cls.ARROW_EXTENSIONS))})"
+        )
+
 
 class DefaultConstants:
     """Default constants and error messages."""
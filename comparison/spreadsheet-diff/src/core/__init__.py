@@ -3,5 +3,22 @@
 from .comparer import FileComparer
 from .hash_engine import RowHashEngine
 from .diff_tracker import DifferenceTracker
+from .normalization import ValueNormalizer, CellNormalizer, NormalizerCompiler
+from .sort_merge import ExternalSortMerger
+from .partitioner import HashPartitioner
+from .fingerprint_cache import FingerprintCache
+from .planner import EnginePlanner, EnginePlan
 
-__all__ = ["FileComparer", "RowHashEngine", "DifferenceTracker"]
+__all__ = [
+    "FileComparer",
+    "RowHashEngine",
+    "DifferenceTracker",
+    "ValueNormalizer",
+    "CellNormalizer",
+    "NormalizerCompiler",
+    "ExternalSortMerger",
+    "HashPartitioner",
+    "FingerprintCache",
+    "EnginePlanner",
+    "EnginePlan"
+]
@@ -3,12 +3,15 @@ Main file comparison engine.
 Handles large-scale comparisons (10M+ rows) using chunked processing.
 """
 
+import tempfile
+import multiprocessing
+from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Callable, Tuple
 from rich.console import Console
 from rich.progress import Progress, TextColumn, BarColumn, TaskProgressColumn
 import polars as pl
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 
 from ..config.settings import ComparisonSettings
 from ..io.readers import FileReader
@@ -19,6 +22,11 @@ from ..utils.performance import PerformanceMonitor
 from ..utils.logger import get_logger
 from .hash_engine import RowHashEngine
 from .diff_tracker import DifferenceTracker
+from .normalization import ValueNormalizer, CellNormalizer, NormalizerCompiler
+from .sort_merge import ExternalSortMerger
+from .partitioner import HashPartitioner
+from .fingerprint_cache import FingerprintCache, CachedFingerprints
+from .planner import EnginePlanner, EnginePlan
 
 
 console = Console()
@@ -38,6 +46,18 @@ class FileComparer:
     EMPTY_DISPLAY = "(empty)"
     MAX_CELL_LENGTH = 32000  # Excel limit is 32,767, leaving some buffer
 
+    # Internal columns used by the vectorized join comparison
+    COMPARISON_SUFFIX = "_comparison"
+    SOURCE_MARKER = "_in_source"
+    COMPARISON_MARKER = "_in_comparison"
+    DIFF_KEY_COLUMN = "_diff_key"
+    DIFF_ROW_COLUMN = "_diff_row"
+    DIFF_FIELD_ORDER_COLUMN = "_diff_field_order"
+
+    # Internal columns used by the two-phase comparison
+    ORDINAL_COLUMN = "_ordinal"
+    HASH_MATCH_COLUMN = "_hash_match"
+
     def __init__(self, settings: Optional[ComparisonSettings] = None):
         """
         Initialize file comparer.
@@ -50,29 +70,52 @@ class FileComparer:
         self.writer = ResultWriter(self.settings)
         self.format_detector = FormatDetector()
         self.validator = FileValidator()
-        self.hash_engine = RowHashEngine(self.settings.use_fast_hash)
+        self.hash_engine = RowHashEngine(
+            self.settings.use_fast_hash,
+            self.settings.use_columnar_hash
+        )
+
+        self.fingerprint_cache = (
+            FingerprintCache(self.settings.fingerprint_cache_dir, self.settings.fingerprint_cache_max_mb)
+            if self.settings.fingerprint_cache_dir
+            else None
+        )
 
         self.key_column: Optional[str] = None
         self.diff_tracker: Optional[DifferenceTracker] = None
+        self.engine: Optional[str] = None
+        self.plan: Optional[EnginePlan] = None
+        self._mixed_sort_warned = False
+
+        # Records spans of work done outside compare_files (e.g. in partition
+        # workers); compare_files replaces it with a sampling monitor per run
+        self.monitor = PerformanceMonitor("File Comparison", sample_interval=None)
 
-    def _should_use_vectorized_path(self, source_file: Path, comparison_file: Path) -> bool:
+        # Wall time in seconds of each compare_files phase (for benchmarks)
+        self.phase_timings: Dict[str, float] = {}
+
+    def _select_engine(self, source_file: Path, comparison_file: Path) -> str:
         """
-        Determine if vectorized comparison path should be used.
+        Resolve the comparison engine to use.
+        In auto mode the planner picks the fastest engine whose estimated peak
+        memory fits max_memory_mb; an explicit engine is kept, with a warning
+        if it is expected to exceed the budget.
 
         Args:
             source_file: Path to source file
             comparison_file: Path to comparison file
 
         Returns:
-            True if vectorized path should be used
+            Engine name: 'vectorized', 'index', 'two-phase', 'sort-merge' or 'partitioned'
         """
-        # Estimate total rows
-        source_rows = self.reader.estimate_rows(source_file)
-        comparison_rows = self.reader.estimate_rows(comparison_file)
-        total_rows = source_rows + comparison_rows
+        self.plan = EnginePlanner(self.settings, self.reader).plan(source_file, comparison_file)
+
+        engine = self.settings.comparison_engine
+        if engine == "auto":
+            engine = self.plan.engine
 
-        # Use vectorized path for files below chunking threshold
-        return total_rows < self.settings.skip_chunking_threshold
+        EnginePlanner.log_plan(self.plan, engine)
+        return engine
 
     def _load_full_dataframe(self, filepath: Path) -> pl.DataFrame:
         """Load entire file into DataFrame."""
@@ -89,7 +132,8 @@ class FileComparer:
     ) -> bool:
         """
         Vectorized comparison for small-to-medium files.
-        Loads both files entirely and uses Polars joins for comparison.
+        Both files are scanned lazily and compared by one Polars query plan
+        (see _collect_join_plan), so only the rows that differ are materialized.
 
         Args:
             source_file: Path to source file
@@ -105,139 +149,386 @@ class FileComparer:
             key_columns = [self.key_column]
         exclude_columns = self.settings.get_exclude_columns()
 
-        # Load both files in parallel
-        console.print("[yellow]Loading files...[/yellow]")
+        # Scan both files in parallel (Excel workbooks are read whole)
+        console.print("[yellow]Scanning files...[/yellow]")
         with ThreadPoolExecutor(max_workers=2) as executor:
-            future_source = executor.submit(self._load_full_dataframe, source_file)
-            future_comparison = executor.submit(self._load_full_dataframe, comparison_file)
+            future_source = executor.submit(self.reader.scan_file, source_file)
+            future_comparison = executor.submit(self.reader.scan_file, comparison_file)
 
-            source_df = future_source.result()
-            comparison_df = future_comparison.result()
+            source = future_source.result()
+            comparison = future_comparison.result()
 
-        console.print(f"[green]Loaded {len(source_df):,} source rows, {len(comparison_df):,} comparison rows[/green]")
+        try:
+            changed, stats = self._collect_join_plan(source, comparison, key_columns, exclude_columns)
+        except pl.exceptions.ComputeError as e:
+            # A type conflict past the scan's inference window; read_file falls back to strings
+            logger.debug(f"Lazy scan failed: {e}")
+            console.print("[yellow]Warning: Mixed data types detected, loading files into memory[/yellow]")
+            source = self._load_full_dataframe(source_file).lazy()
+            comparison = self._load_full_dataframe(comparison_file).lazy()
+            changed, stats = self._collect_join_plan(source, comparison, key_columns, exclude_columns)
 
-        # Update summary
-        self.diff_tracker.summary.total_source_rows = len(source_df)
-        self.diff_tracker.summary.total_comparison_rows = len(comparison_df)
+        console.print(
+            f"[green]Scanned {stats['source_rows']:,} source rows, "
+            f"{stats['comparison_rows']:,} comparison rows[/green]"
+        )
 
-        # Check for duplicate keys
-        source_key_counts = source_df.select(key_columns).n_unique()
-        has_duplicates = source_key_counts < len(source_df)
+        # Update summary
+        self.diff_tracker.summary.total_source_rows = stats["source_rows"]
+        self.diff_tracker.summary.total_comparison_rows = stats["comparison_rows"]
 
-        if has_duplicates:
-            console.print("[yellow]Duplicate keys detected, using row-by-row comparison[/yellow]")
-            # Fall back to index-based comparison for duplicates
-            return self._compare_with_index_method(source_file, comparison_file)
+        suffix = self.COMPARISON_SUFFIX
+        in_source = pl.col(self.SOURCE_MARKER).is_not_null()
+        in_comparison = pl.col(self.COMPARISON_MARKER).is_not_null()
 
-        # For unique keys, use optimized join-based comparison
-        console.print("[green]Keys are unique, using optimized join comparison[/green]")
+        only_in_source = changed.filter(~in_comparison).select(stats["source_columns"])
+        only_in_comparison = changed.filter(~in_source).select(
+            col if col in key_columns else f"{col}{suffix}" for col in stats["comparison_columns"]
+        ).rename({
+            f"{col}{suffix}": col for col in stats["comparison_columns"] if col not in key_columns
+        })
+        matched = changed.filter(in_source & in_comparison).drop(self.SOURCE_MARKER, self.COMPARISON_MARKER)
 
-        # Perform join on key columns
-        join_keys = key_columns if len(key_columns) > 1 else key_columns[0]
+        self.diff_tracker.summary.only_in_source = len(only_in_source)
+        self.diff_tracker.summary.only_in_comparison = len(only_in_comparison)
 
-        merged = source_df.join(
-            comparison_df,
-            on=join_keys,
-            how="outer",
-            suffix="_comparison"
+        # Matched rows left out of the plan's result compared equal
+        self.diff_tracker.summary.exact_matches += (
+            stats["matched_source_rows"] - len(only_in_source) - len(matched)
         )
 
-        # Find rows only in source or comparison
-        # For rows only in source: comparison columns will be null
-        # For rows only in comparison: source columns will be null
-        first_non_key_col = source_df.columns[0] if source_df.columns[0] != join_keys else source_df.columns[1]
-        only_in_source = merged.filter(pl.col(f"{first_non_key_col}_comparison").is_null())
-        only_in_comparison = merged.filter(pl.col(first_non_key_col).is_null())
+        with self.monitor.span("diff") as span:
+            # Add rows only in source to detailed output
+            for row_dict in only_in_source.iter_rows(named=True):
+                self._add_row_difference(
+                    row_dict=row_dict,
+                    key_columns=key_columns,
+                    key_value=self._extract_key_value(row_dict, key_columns),
+                    exclude_columns=exclude_columns,
+                    diff_type="removed"
+                )
 
-        self.diff_tracker.summary.only_in_source = len(only_in_source)
-        self.diff_tracker.summary.only_in_comparison = len(only_in_comparison)
+            # Add rows only in comparison to detailed output
+            for row_dict in only_in_comparison.iter_rows(named=True):
+                self._add_row_difference(
+                    row_dict=row_dict,
+                    key_columns=key_columns,
+                    key_value=self._extract_key_value(row_dict, key_columns),
+                    exclude_columns=exclude_columns,
+                    diff_type="added"
+                )
 
-        # Add rows only in source to detailed output
-        for row_dict in only_in_source.iter_rows(named=True):
-            key_value = self._extract_key_value(row_dict, key_columns)
+            # Compare field values of matched rows that differ
+            console.print("[yellow]Comparing field values...[/yellow]")
+            try:
+                self._compare_rows_vectorized(matched, key_columns, stats["compare_columns"])
+            except (pl.exceptions.InvalidOperationError, pl.exceptions.ComputeError) as e:
+                logger.warning(f"Columnar field comparison failed ({e}), comparing row by row")
+                self._compare_rows_python(matched, key_columns, stats["compare_columns"])
 
-            # Extract source columns (without _comparison suffix)
-            source_row_dict = {
-                col: row_dict[col]
-                for col in row_dict.keys()
-                if not col.endswith("_comparison")
-            }
-
-            self._add_row_difference(
-                row_dict=source_row_dict,
-                key_columns=key_columns,
-                key_value=key_value,
-                exclude_columns=exclude_columns,
-                diff_type="removed"
-            )
+            span.update_rows(len(changed))
 
-        # Add rows only in comparison to detailed output
-        for row_dict in only_in_comparison.iter_rows(named=True):
-            key_value = self._extract_key_value(row_dict, key_columns)
+        console.print(f"[green]Found {self.diff_tracker.get_difference_count():,} differences[/green]")
 
-            # Extract comparison columns and remove _comparison suffix
-            comparison_row_dict = {
-                col[:-11]: row_dict[col]  # Remove "_comparison" suffix
-                for col in row_dict.keys()
-                if col.endswith("_comparison")
-            }
-            # Add key columns
-            for col in key_columns:
-                if col in row_dict:
-                    comparison_row_dict[col] = row_dict[col]
-
-            self._add_row_difference(
-                row_dict=comparison_row_dict,
-                key_columns=key_columns,
-                key_value=key_value,
-                exclude_columns=exclude_columns,
-                diff_type="added"
+        return True
+
+    def _collect_join_plan(
+        self,
+        source: pl.LazyFrame,
+        comparison: pl.LazyFrame,
+        key_columns: List[str],
+        exclude_columns: List[str]
+    ) -> Tuple[pl.DataFrame, Dict[str, Any]]:
+        """
+        Run the vectorized comparison as a lazy query plan.
+        A first query reads only the key columns to count rows and detect
+        duplicate keys. The main plan full-joins both files on the key (plus
+        a per-key ordinal when keys repeat) and keeps only rows missing from
+        one file or with a differing value. Rows with a null key part are
+        counted but not compared, as in the other engines. It runs on Polars'
+        streaming engine when streaming_join is enabled.
+
+        Args:
+            source: Lazy source file
+            comparison: Lazy comparison file
+            key_columns: Key column names
+            exclude_columns: Columns to exclude from comparison
+
+        Returns:
+            Tuple of (changed rows with SOURCE_MARKER/COMPARISON_MARKER and suffixed
+            comparison columns, statistics: row counts, the matched source row count,
+            the columns of each file and the compared columns)
+        """
+        streaming = self.settings.streaming_join
+        source_schema = source.collect_schema()
+        comparison_schema = comparison.collect_schema()
+
+        keyed = pl.all_horizontal(pl.col(key_columns).is_not_null())
+
+        with self.monitor.span("read") as span:
+            def key_stats(frame: pl.LazyFrame) -> pl.LazyFrame:
+                return frame.select(
+                    pl.len().alias("rows"),
+                    pl.struct(key_columns).filter(keyed).n_unique().alias("keys"),
+                    keyed.sum().alias("keyed_rows")
+                )
+
+            source_stats, comparison_stats = (
+                frame.row(0, named=True)
+                for frame in pl.collect_all([key_stats(source), key_stats(comparison)], streaming=streaming)
             )
+            span.update_rows(source_stats["rows"] + comparison_stats["rows"])
 
-        # Compare field values for matching keys
-        console.print("[yellow]Comparing field values...[/yellow]")
-        self._compare_rows_vectorized(merged, key_columns, exclude_columns)
+        # Duplicate keys (in either file) are matched by position within their key group
+        has_duplicates = (
+            source_stats["keys"] < source_stats["keyed_rows"]
+            or comparison_stats["keys"] < comparison_stats["keyed_rows"]
+        )
 
-        console.print(f"[green]Found {len(self.diff_tracker.differences):,} differences[/green]")
+        # Rows with a null key part cannot be matched; they only count towards the totals
+        source = source.filter(keyed)
+        comparison = comparison.filter(keyed)
 
-        return True
+        join_columns = key_columns
+        if has_duplicates:
+            console.print("[yellow]Duplicate keys detected, matching duplicates by position within each key[/yellow]")
+            source = self._with_key_ordinal(source, key_columns)
+            comparison = self._with_key_ordinal(comparison, key_columns)
+            join_columns = key_columns + [self.ORDINAL_COLUMN]
+        else:
+            console.print("[green]Keys are unique, using optimized join comparison[/green]")
+
+        # Key columns must share a dtype to join; fall back to their text form
+        key_casts = [
+            pl.col(col).cast(pl.String)
+            for col in key_columns
+            if source_schema[col] != comparison_schema[col]
+        ]
+        if key_casts:
+            source = source.with_columns(key_casts)
+            comparison = comparison.with_columns(key_casts)
+
+        # Suffix comparison columns explicitly and tag each side, so rows present
+        # in only one file are identified by marker rather than by null values
+        suffix = self.COMPARISON_SUFFIX
+        comparison = comparison.rename({
+            col: f"{col}{suffix}" for col in comparison_schema.names() if col not in key_columns
+        })
+
+        # The full outer join is split into a left join and an anti join: both
+        # run on the streaming engine, whose full join is not reliable
+        source = source.with_columns(pl.lit(True).alias(self.SOURCE_MARKER))
+        comparison = comparison.with_columns(pl.lit(True).alias(self.COMPARISON_MARKER))
+        merged = source.join(comparison, on=join_columns, how="left")
+        only_in_comparison = comparison.join(source.select(join_columns), on=join_columns, how="anti")
+        if has_duplicates:
+            merged = merged.drop(self.ORDINAL_COLUMN)
+            only_in_comparison = only_in_comparison.drop(self.ORDINAL_COLUMN)
+
+        compare_columns = [
+            col for col in dict.fromkeys(source_schema.names() + comparison_schema.names())
+            if col not in key_columns and col not in exclude_columns
+        ]
+        # Matched rows are kept when a raw value differs; _compare_rows_vectorized
+        # then normalizes just these rows and counts those that still match
+        mismatches = self._mismatch_exprs(merged.collect_schema(), compare_columns, prefilter=True)
+
+        changed_source_rows = pl.col(self.COMPARISON_MARKER).is_null()
+        if mismatches:
+            changed_source_rows = changed_source_rows | pl.any_horizontal(mismatches)
+        # Each side is collected as its own plan; a union of the two would not stream
+        plans = {
+            "Source rows (left join)": merged.filter(changed_source_rows),
+            "Rows only in comparison (anti join)": only_in_comparison
+        }
+
+        if self.settings.explain_plan:
+            for title, plan in plans.items():
+                console.print(f"\n[bold]Query plan - {title}:[/bold]")
+                console.print(plan.explain(streaming=streaming), markup=False, highlight=False)
+
+        with self.monitor.span("join") as span:
+            try:
+                frames = pl.collect_all(plans.values(), streaming=streaming)
+            except (pl.exceptions.InvalidOperationError, pl.exceptions.ComputeError) as e:
+                # Columns the columnar normalizer cannot handle are compared row by row later
+                # (a scan error raises again here and is handled by the caller)
+                logger.debug(f"Columnar mismatch filter failed: {e}")
+                frames = pl.collect_all([merged, only_in_comparison], streaming=streaming)
+            changed = pl.concat(frames, how="diagonal_relaxed")
+            span.update_rows(len(changed))
+
+        stats = {
+            "source_rows": source_stats["rows"],
+            "comparison_rows": comparison_stats["rows"],
+            "matched_source_rows": source_stats["keyed_rows"],
+            "source_columns": source_schema.names(),
+            "comparison_columns": comparison_schema.names(),
+            "compare_columns": compare_columns
+        }
+
+        return changed, stats
+
+    def _with_key_ordinal(self, frame: pl.LazyFrame, key_columns: List[str]) -> pl.LazyFrame:
+        """
+        Number the rows of each key group, so duplicate keys can be joined by position.
+        Rows are ranked by the sort columns (ties and no sort columns keep file
+        order), as in the index-based comparison. Rows keep file order.
+
+        Args:
+            frame: Lazy file
+            key_columns: Key column names
+
+        Returns:
+            LazyFrame with an ORDINAL_COLUMN
+        """
+        columns = frame.collect_schema().names()
+        sort_columns = [col for col in self.settings.get_sort_columns() if col in columns]
+
+        if sort_columns:
+            # Position of each row in its group once sorted (stable, nulls first, as _sort_rows)
+            ordinal = pl.arg_sort_by(sort_columns, nulls_last=False, maintain_order=True).arg_sort()
+        else:
+            ordinal = pl.int_range(pl.len())
+
+        return frame.with_columns(
+            ordinal.cast(pl.UInt64).over(key_columns).alias(self.ORDINAL_COLUMN)
+        )
 
     def _compare_rows_vectorized(
         self,
-        merged_df: pl.DataFrame,
+        matched_df: pl.DataFrame,
         key_columns: List[str],
-        exclude_columns: List[str]
+        compare_columns: List[str]
     ):
         """
-        Compare rows using vectorized operations.
+        Compare matched rows column by column using Polars expressions.
+        Each column is normalized once (see ValueNormalizer) and only the
+        mismatching cells are rendered and handed to the tracker.
 
         Args:
-            merged_df: Merged DataFrame with both source and comparison data
+            matched_df: Joined DataFrame of rows present in both files
+                (comparison columns carry COMPARISON_SUFFIX)
             key_columns: List of key column names
-            exclude_columns: Columns to exclude from comparison
+            compare_columns: Columns to compare (union of both files, minus keys/excludes)
         """
-        # Get all column names from source (without _comparison suffix)
-        source_columns = [col for col in merged_df.columns if not col.endswith("_comparison") and col not in key_columns]
+        schema = matched_df.schema
+        normalizer = ValueNormalizer(self.settings.case_sensitive)
 
-        exclude_set = set(exclude_columns)
+        if not compare_columns or len(matched_df) == 0:
+            self.diff_tracker.summary.exact_matches += len(matched_df)
+            return
 
-        # Iterate through rows and find differences
-        for row_dict in merged_df.iter_rows(named=True):
-            key_value = tuple(row_dict[col] for col in key_columns) if len(key_columns) > 1 else row_dict[key_columns[0]]
+        def side(column: str) -> pl.Expr:
+            return self._side_expr(normalizer, schema, column, canonical=False)
+
+        flag_columns = [f"_mismatch_{i}" for i in range(len(compare_columns))]
+        flagged = matched_df.with_columns(
+            normalizer.key_display_expr(key_columns, schema).alias(self.DIFF_KEY_COLUMN),
+            pl.int_range(pl.len()).alias(self.DIFF_ROW_COLUMN),
+            *[
+                mismatch.alias(flag)
+                for mismatch, flag in zip(self._mismatch_exprs(schema, compare_columns), flag_columns)
+            ]
+        )
 
-            has_differences = False
-            for col in source_columns:
-                if col in exclude_set:
-                    continue
+        modified_rows = flagged.select(pl.any_horizontal(flag_columns).sum()).item()
+        self.diff_tracker.summary.modified_rows += modified_rows
+        self.diff_tracker.summary.exact_matches += len(flagged) - modified_rows
+
+        if modified_rows == 0:
+            return
+
+        # Render only the mismatching cells, then restore row-then-field order
+        lazy = flagged.lazy()
+        differences = pl.concat([
+            lazy.filter(pl.col(flag)).select(
+                pl.col(self.DIFF_ROW_COLUMN),
+                pl.lit(position).alias(self.DIFF_FIELD_ORDER_COLUMN),
+                pl.col(self.DIFF_KEY_COLUMN).alias("key"),
+                pl.lit(col).alias("field"),
+                side(col).alias("source_value"),
+                side(f"{col}{self.COMPARISON_SUFFIX}").alias("comparison_value"),
+                pl.lit("modified").alias("type")
+            )
+            for position, (col, flag) in enumerate(zip(compare_columns, flag_columns))
+        ]).sort(self.DIFF_ROW_COLUMN, self.DIFF_FIELD_ORDER_COLUMN).collect()
+
+        self.diff_tracker.add_differences(differences)
+
+    def _mismatch_exprs(
+        self,
+        schema: pl.Schema,
+        compare_columns: List[str],
+        prefilter: bool = False
+    ) -> List[pl.Expr]:
+        """
+        Build one expression per compared column that is true where the
+        normalized source and comparison values differ.
+
+        Args:
+            schema: Schema of the joined rows (comparison columns carry COMPARISON_SUFFIX)
+            compare_columns: Columns to compare
+            prefilter: Compare columns of the same dtype on both sides by raw value.
+                Equal raw values normalize equally, so this cheap test flags a
+                superset of the mismatching cells
+
+        Returns:
+            List of boolean expressions, in compare_columns order
+        """
+        normalizer = ValueNormalizer(self.settings.case_sensitive)
+        mismatches = []
+
+        for col in compare_columns:
+            other = f"{col}{self.COMPARISON_SUFFIX}"
+            if prefilter and col in schema and other in schema and schema[col] == schema[other]:
+                mismatches.append(pl.col(col).ne_missing(pl.col(other)))
+            else:
+                mismatches.append(
+                    self._side_expr(normalizer, schema, col, canonical=True).ne_missing(
+                        self._side_expr(normalizer, schema, other, canonical=True)
+                    )
+                )
+
+        return mismatches
 
+    @staticmethod
+    def _side_expr(normalizer: ValueNormalizer, schema: pl.Schema, column: str, canonical: bool) -> pl.Expr:
+        """Canonical or display form of one side of a compared column."""
+        # A column missing from one file compares as null on that side
+        if column not in schema:
+            return pl.lit(None, dtype=pl.String)
+        if canonical:
+            return normalizer.canonical_expr(column, schema[column])
+        return normalizer.display_expr(column, schema[column])
+
+    def _compare_rows_python(
+        self,
+        matched_df: pl.DataFrame,
+        key_columns: List[str],
+        compare_columns: List[str]
+    ):
+        """
+        Compare matched rows one at a time (fallback for dtypes the columnar
+        normalizer cannot handle).
+
+        Args:
+            matched_df: Joined DataFrame of rows present in both files
+            key_columns: List of key column names
+            compare_columns: Columns to compare
+        """
+        normalizers = [self.diff_tracker.normalizer_for(col) for col in compare_columns]
+
+        for row_dict in matched_df.iter_rows(named=True):
+            key_value = self._extract_key_value(row_dict, key_columns)
+
+            has_differences = False
+            for col, normalize in zip(compare_columns, normalizers):
                 source_val = row_dict.get(col)
-                comparison_val = row_dict.get(f"{col}_comparison")
+                comparison_val = row_dict.get(f"{col}{self.COMPARISON_SUFFIX}")
 
                 # Normalize for comparison
-                source_norm = self.diff_tracker._normalize_for_comparison(source_val)
-                comparison_norm = self.diff_tracker._normalize_for_comparison(comparison_val)
-
-                if source_norm != comparison_norm:
+                if normalize(source_val) != normalize(comparison_val):
                     self.diff_tracker.add_field_difference(
                         key_value=key_value,
                         field_name=col,
@@ -387,6 +678,472 @@ class FileComparer:
 
         return True
 
+    def _compare_with_sort_merge(
+        self,
+        source_file: Path,
+        comparison_file: Path
+    ) -> bool:
+        """
+        External sort-merge comparison for files larger than RAM.
+        Both files are spilled to key-sorted runs on disk and merge-joined,
+        so memory use is bounded by max_memory_mb rather than file size.
+
+        Args:
+            source_file: Path to source file
+            comparison_file: Path to comparison file
+
+        Returns:
+            True if successful
+        """
+        key_columns = self.settings.get_key_columns() or [self.key_column]
+        sort_columns = self.settings.get_sort_columns()
+        exclude_columns = self.settings.get_exclude_columns()
+        exact_matches = 0
+
+        if sort_columns:
+            console.print(f"[yellow]Sorting duplicate keys by: {', '.join(sort_columns)}[/yellow]")
+
+        with tempfile.TemporaryDirectory(
+            prefix="spreadsheet-diff-",
+            dir=self.settings.temp_dir
+        ) as temp_dir:
+            merger = ExternalSortMerger(
+                self.settings,
+                self.reader,
+                self.hash_engine,
+                Path(temp_dir)
+            )
+
+            console.print("\n[bold cyan]Spilling sorted runs...[/bold cyan]")
+            with self.monitor.span("spill", file="Source") as span:
+                source_spill = merger.spill_runs(source_file, key_columns, "Source")
+                span.update_rows(source_spill.total_rows)
+            with self.monitor.span("spill", file="Comparison") as span:
+                comparison_spill = merger.spill_runs(comparison_file, key_columns, "Comparison")
+                span.update_rows(comparison_spill.total_rows)
+
+            self.diff_tracker.summary.total_source_rows = source_spill.total_rows
+            self.diff_tracker.summary.total_comparison_rows = comparison_spill.total_rows
+
+            console.print("\n[bold cyan]Merging sorted runs...[/bold cyan]")
+            with self.monitor.span("diff") as span:
+                for source_rows, comparison_rows in merger.merge_join(source_spill, comparison_spill):
+                    key_value = self._extract_key_value(
+                        merger.first_row(source_rows, comparison_rows),
+                        key_columns
+                    )
+
+                    # Sort rows within each key group if sort columns specified
+                    if sort_columns:
+                        if len(source_rows) > 1:
+                            source_rows = self._sort_rows(source_rows, sort_columns)
+                        if len(comparison_rows) > 1:
+                            comparison_rows = self._sort_rows(comparison_rows, sort_columns)
+
+                    exact_matches += self._compare_key_group(
+                        key_value,
+                        source_rows,
+                        comparison_rows,
+                        key_columns,
+                        exclude_columns
+                    )
+                span.update_rows(source_spill.total_rows + comparison_spill.total_rows)
+
+        self.diff_tracker.summary.exact_matches = exact_matches
+
+        console.print(f"[green]OK: Comparison complete[/green]")
+        console.print(f"  Exact matches: {exact_matches:,}")
+        console.print(f"  Differences found: {self.diff_tracker.get_difference_count():,}")
+
+        return True
+
+    def _compare_two_phase(
+        self,
+        source_file: Path,
+        comparison_file: Path
+    ) -> bool:
+        """
+        Hash-first comparison that materializes only mismatched rows.
+        Phase one streams both files keeping just (key, row hash, row number)
+        and matches rows by key and position within duplicate key groups.
+        Phase two re-reads only the rows that differ or have no match.
+
+        Args:
+            source_file: Path to source file
+            comparison_file: Path to comparison file
+
+        Returns:
+            True if successful
+        """
+        key_columns = self.settings.get_key_columns() or [self.key_column]
+        exclude_columns = self.settings.get_exclude_columns()
+
+        console.print("\n[bold cyan]Phase 1: Fingerprinting files...[/bold cyan]")
+        source_fingerprints, source_rows = self._fingerprint_file(source_file, "Source", use_cache=True)
+        comparison_fingerprints, comparison_rows = self._fingerprint_file(comparison_file, "Comparison")
+
+        self.diff_tracker.summary.total_source_rows = source_rows
+        self.diff_tracker.summary.total_comparison_rows = comparison_rows
+
+        with self.monitor.span("join") as span:
+            pairs = self._match_fingerprints(source_fingerprints, comparison_fingerprints, key_columns)
+            span.update_rows(len(pairs))
+        del source_fingerprints, comparison_fingerprints
+
+        source_row_nr = FingerprintCache.ROW_NUMBER_COLUMN
+        comparison_row_nr = f"{source_row_nr}{self.COMPARISON_SUFFIX}"
+        exact = (
+            pl.col(source_row_nr).is_not_null()
+            & pl.col(comparison_row_nr).is_not_null()
+            & pl.col(self.HASH_MATCH_COLUMN)
+        )
+
+        exact_matches = pairs.select(exact.sum()).item()
+        changed = pairs.filter(~exact).select(source_row_nr, comparison_row_nr)
+        del pairs
+
+        console.print(
+            f"[green]OK: {exact_matches:,} rows match exactly, "
+            f"{len(changed):,} rows need field-level comparison[/green]"
+        )
+
+        # Phase 2: load only the rows that differ
+        console.print("\n[bold cyan]Phase 2: Comparing changed rows...[/bold cyan]")
+        source_data = self._read_changed_rows(source_file, changed[source_row_nr])
+        comparison_data = self._read_changed_rows(comparison_file, changed[comparison_row_nr])
+
+        with self.monitor.span("diff") as span:
+            for source_nr, comparison_nr in changed.iter_rows():
+                source_row = source_data.get(source_nr)
+                comparison_row = comparison_data.get(comparison_nr)
+
+                if source_row is not None and comparison_row is not None:
+                    key_value = self._get_composite_key(source_row)
+                    diff_count = self.diff_tracker.compare_rows(
+                        key_value,
+                        source_row,
+                        comparison_row,
+                        ignore_columns=exclude_columns
+                    )
+                    if diff_count > 0:
+                        self.diff_tracker.summary.modified_rows += 1
+                    else:
+                        # Hashes differ only in ways normalization ignores
+                        exact_matches += 1
+
+                elif source_row is not None:
+                    self.diff_tracker.summary.only_in_source += 1
+                    self._add_row_difference(
+                        row_dict=source_row,
+                        key_columns=key_columns,
+                        key_value=self._get_composite_key(source_row),
+                        exclude_columns=exclude_columns,
+                        diff_type="removed"
+                    )
+
+                else:
+                    self.diff_tracker.summary.only_in_comparison += 1
+                    self._add_row_difference(
+                        row_dict=comparison_row,
+                        key_columns=key_columns,
+                        key_value=self._get_composite_key(comparison_row),
+                        exclude_columns=exclude_columns,
+                        diff_type="added"
+                    )
+
+            span.update_rows(len(changed))
+
+        self.diff_tracker.summary.exact_matches = exact_matches
+
+        console.print(f"[green]OK: Comparison complete[/green]")
+        console.print(f"  Exact matches: {exact_matches:,}")
+        console.print(f"  Differences found: {self.diff_tracker.get_difference_count():,}")
+
+        return True
+
+    def _fingerprint_file(
+        self,
+        filepath: Path,
+        label: str,
+        use_cache: bool = False
+    ) -> Tuple[pl.DataFrame, int]:
+        """
+        Stream a file keeping only key columns, sort columns, row hashes and row numbers.
+
+        Args:
+            filepath: Path to file
+            label: Label for progress display
+            use_cache: Load from / store in the fingerprint cache when enabled
+
+        Returns:
+            Tuple of (fingerprints, rows read including rows with null keys)
+        """
+        key_columns = self.settings.get_key_columns() or [self.key_column]
+        sort_columns = self.settings.get_sort_columns()
+
+        cache_key = None
+        if use_cache and self.fingerprint_cache is not None:
+            cache_key = self.fingerprint_cache.cache_key(filepath, key_columns, self.settings)
+            cached = self.fingerprint_cache.get(cache_key)
+            if cached is not None:
+                console.print(f"[green]OK: Loaded {len(cached.fingerprints):,} cached fingerprints from {label} file[/green]")
+                return cached.fingerprints, cached.total_rows
+
+        fingerprint_parts = []
+        total_rows = 0
+
+        with Progress(
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TaskProgressColumn(),
+            console=console,
+            transient=False
+        ) as progress:
+
+            task = progress.add_task(f"Fingerprinting {label} file...", total=self.reader.progress_total(filepath))
+
+            for chunk in self.monitor.timed_iter(self.reader.read_chunked(filepath), "read", file=label):
+                with self.monitor.span("hash", file=label) as span:
+                    row_hashes = self.hash_engine.hash_dataframe_rows(chunk)
+                    fingerprint_parts.append(FingerprintCache.fingerprint_chunk(
+                        chunk, row_hashes, key_columns, sort_columns, total_rows
+                    ))
+                    span.update_rows(len(chunk))
+                total_rows += len(chunk)
+                progress.update(task, advance=len(chunk))
+
+            progress.update(task, total=total_rows, completed=total_rows, description=f"{label} file fingerprinted")
+
+        if not fingerprint_parts:
+            return pl.DataFrame(schema={
+                **{col: pl.String for col in key_columns},
+                FingerprintCache.ROW_HASH_COLUMN: pl.UInt64,
+                FingerprintCache.ROW_NUMBER_COLUMN: pl.UInt64
+            }), total_rows
+
+        fingerprints = pl.concat(fingerprint_parts, how="vertical_relaxed")
+        console.print(f"[green]OK: Fingerprinted {total_rows:,} rows from {label} file[/green]")
+
+        if cache_key is not None:
+            self.fingerprint_cache.put(cache_key, filepath, fingerprints, total_rows)
+
+        return fingerprints, total_rows
+
+    def _match_fingerprints(
+        self,
+        source_fingerprints: pl.DataFrame,
+        comparison_fingerprints: pl.DataFrame,
+        key_columns: List[str]
+    ) -> pl.DataFrame:
+        """
+        Pair rows of both files by key and position within their key group.
+        Duplicate keys are ordered by the sort columns (nulls first, then file
+        order), as _sort_rows orders them for the index-based comparison.
+
+        Args:
+            source_fingerprints: Source fingerprints
+            comparison_fingerprints: Comparison fingerprints
+            key_columns: Key column names
+
+        Returns:
+            DataFrame with the source and comparison row numbers of each pair
+            (null when the row has no counterpart) and a hash match flag
+        """
+        row_hash = FingerprintCache.ROW_HASH_COLUMN
+        row_nr = FingerprintCache.ROW_NUMBER_COLUMN
+        suffix = self.COMPARISON_SUFFIX
+        sort_columns = self.settings.get_sort_columns()
+
+        def with_ordinal(fingerprints: pl.DataFrame) -> pl.DataFrame:
+            order = [col for col in sort_columns if col in fingerprints.columns] + [row_nr]
+            return fingerprints.sort(order, nulls_last=False).select(
+                *key_columns,
+                pl.int_range(pl.len(), dtype=pl.UInt64).over(key_columns).alias(self.ORDINAL_COLUMN),
+                row_hash,
+                row_nr
+            )
+
+        source = with_ordinal(source_fingerprints)
+        comparison = with_ordinal(comparison_fingerprints).rename({
+            row_hash: f"{row_hash}{suffix}",
+            row_nr: f"{row_nr}{suffix}"
+        })
+
+        # Key columns must share a dtype to join; fall back to their text form
+        key_casts = [
+            pl.col(col).cast(pl.String)
+            for col in key_columns
+            if source.schema[col] != comparison.schema[col]
+        ]
+        if key_casts:
+            source = source.with_columns(key_casts)
+            comparison = comparison.with_columns(key_casts)
+
+        # Hashes of different types (columnar vs per-row fallback) never match
+        hash_match = (
+            pl.col(row_hash) == pl.col(f"{row_hash}{suffix}")
+            if source.schema[row_hash] == comparison.schema[f"{row_hash}{suffix}"]
+            else pl.lit(False)
+        )
+
+        return source.join(
+            comparison,
+            on=key_columns + [self.ORDINAL_COLUMN],
+            how="full",
+            coalesce=True
+        ).select(
+            row_nr,
+            f"{row_nr}{suffix}",
+            hash_match.fill_null(False).alias(self.HASH_MATCH_COLUMN)
+        )
+
+    def _read_changed_rows(self, filepath: Path, row_numbers: pl.Series) -> Dict[int, Dict[str, Any]]:
+        """
+        Read the given rows of a file.
+
+        Args:
+            filepath: Path to file
+            row_numbers: Row numbers to read (nulls are ignored)
+
+        Returns:
+            Dictionary mapping row number to row data
+        """
+        rows = {}
+        row_nr = FingerprintCache.ROW_NUMBER_COLUMN
+
+        chunks = self.reader.read_rows(filepath, row_numbers.drop_nulls(), row_nr)
+        for chunk in self.monitor.timed_iter(chunks, "read", file=filepath.name):
+            for row_dict in chunk.iter_rows(named=True):
+                rows[row_dict.pop(row_nr)] = row_dict
+
+        return rows
+
+    def _compare_partitioned(
+        self,
+        source_file: Path,
+        comparison_file: Path
+    ) -> bool:
+        """
+        Hash-partitioned parallel comparison.
+        Both files are split by key hash into parallel_workers buckets on disk,
+        each bucket pair is compared in its own process, and the per-bucket
+        differences and summary counters are merged in bucket order.
+
+        Args:
+            source_file: Path to source file
+            comparison_file: Path to comparison file
+
+        Returns:
+            True if successful
+        """
+        key_columns = self.settings.get_key_columns() or [self.key_column]
+        num_workers = self.settings.get_effective_workers()
+
+        with tempfile.TemporaryDirectory(
+            prefix="spreadsheet-diff-",
+            dir=self.settings.temp_dir
+        ) as temp_dir:
+            partitioner = HashPartitioner(
+                self.settings,
+                self.reader,
+                Path(temp_dir),
+                num_workers
+            )
+
+            console.print("\n[bold cyan]Partitioning files by key...[/bold cyan]")
+            with self.monitor.span("partition", file="Source"):
+                source_parts = partitioner.partition_file(source_file, key_columns, "Source")
+            with self.monitor.span("partition", file="Comparison"):
+                comparison_parts = partitioner.partition_file(comparison_file, key_columns, "Comparison")
+
+            # Workers rebuild settings from a plain dict and report without progress bars
+            worker_settings = self.settings.model_dump()
+            worker_settings["show_progress"] = False
+
+            console.print("\n[bold cyan]Comparing partitions...[/bold cyan]")
+            with Progress(
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TaskProgressColumn(),
+                console=console,
+                transient=False
+            ) as progress:
+
+                task = progress.add_task("Comparing partitions...", total=num_workers)
+
+                # spawn avoids forking a process that already runs Polars threads
+                with self.monitor.span("diff", workers=num_workers) as span:
+                    with ProcessPoolExecutor(
+                        max_workers=num_workers,
+                        mp_context=multiprocessing.get_context("spawn")
+                    ) as executor:
+                        futures = [
+                            executor.submit(
+                                _compare_partition_worker,
+                                worker_settings,
+                                self.key_column,
+                                source_parts.buckets[bucket],
+                                comparison_parts.buckets[bucket],
+                                self.diff_tracker.normalizers
+                            )
+                            for bucket in range(num_workers)
+                        ]
+
+                        # Merge in partition order so the differences come out the same every run
+                        for future in futures:
+                            self.diff_tracker.merge(future.result())
+                            progress.update(task, advance=1)
+
+                    span.update_rows(
+                        self.diff_tracker.summary.total_source_rows
+                        + self.diff_tracker.summary.total_comparison_rows
+                    )
+
+                progress.update(task, completed=True, description="Partitions compared")
+
+        console.print(f"[green]OK: Comparison complete[/green]")
+        console.print(f"  Exact matches: {self.diff_tracker.summary.exact_matches:,}")
+        console.print(f"  Differences found: {self.diff_tracker.get_difference_count():,}")
+
+        return True
+
+    def _compare_partition(
+        self,
+        source_parts: List[Path],
+        comparison_parts: List[Path]
+    ):
+        """
+        Compare one bucket pair in memory (runs inside a worker process).
+
+        Args:
+            source_parts: Source part files for the bucket, in file order
+            comparison_parts: Comparison part files for the bucket, in file order
+        """
+        sort_columns = self.settings.get_sort_columns()
+        source_index = {}
+        comparison_index = {}
+
+        for part in source_parts:
+            self.diff_tracker.summary.total_source_rows += self._index_chunk(
+                pl.read_ipc(part),
+                source_index
+            )
+
+        for part in comparison_parts:
+            self.diff_tracker.summary.total_comparison_rows += self._index_chunk(
+                pl.read_ipc(part),
+                comparison_index
+            )
+
+        if sort_columns:
+            self._sort_index_groups(source_index, sort_columns)
+            self._sort_index_groups(comparison_index, sort_columns)
+
+        self.diff_tracker.summary.exact_matches = self._compare_indexes(
+            source_index,
+            comparison_index
+        )
+
     def compare_files(
         self,
         source_file: Path,
@@ -404,51 +1161,108 @@ class FileComparer:
         Returns:
             True if comparison completed successfully
         """
-        monitor = PerformanceMonitor("File Comparison")
+        monitor = PerformanceMonitor(
+            "File Comparison",
+            profile_cpu=self.settings.profile_cpu,
+            trace_memory=self.settings.trace_memory
+        )
+        self.monitor = monitor
+        self.phase_timings = {}
 
         try:
             # Step 1: Validate files
             console.print("\n[bold cyan]Step 1: Validating files...[/bold cyan]")
-            self._validate_files(source_file, comparison_file)
+            with monitor.span("validate"):
+                self._validate_files(source_file, comparison_file)
 
             # Step 2: Determine key column
             console.print("\n[bold cyan]Step 2: Determining key column...[/bold cyan]")
-            self.key_column = self._determine_key_column(source_file, key_column)
+            with monitor.span("detect_key"):
+                self.key_column = self._determine_key_column(source_file, key_column)
             console.print(f"Using key column: [green]{self.key_column}[/green]")
+            self.reader.key_columns = self.settings.get_key_columns() or [self.key_column]
 
             # Display excluded columns if any
             exclude_columns = self.settings.get_exclude_columns()
             if exclude_columns:
                 console.print(f"Excluding columns: [yellow]{', '.join(exclude_columns)}[/yellow]")
 
+            # Display compared columns if restricted
+            compare_columns = self.settings.get_compare_columns()
+            if compare_columns:
+                self._check_compare_columns(source_file, comparison_file, compare_columns)
+                console.print(f"Comparing columns: [green]{', '.join(compare_columns)}[/green]")
+
             # Initialize diff tracker
-            self.diff_tracker = DifferenceTracker(self.key_column)
+            self.diff_tracker = DifferenceTracker(
+                self.key_column,
+                self.settings.case_sensitive,
+                spill_threshold_rows=self.settings.diff_spill_threshold_rows,
+                temp_dir=self.settings.temp_dir,
+                normalizers=self._compile_normalizers(source_file, comparison_file)
+            )
 
             # Step 3: Choose comparison strategy
             console.print("\n[bold cyan]Step 3: Analyzing file size and choosing strategy...[/bold cyan]")
-            use_vectorized = self._should_use_vectorized_path(source_file, comparison_file)
-
-            if use_vectorized:
-                # Fast path: vectorized comparison for small-to-medium files
-                console.print("[cyan]Files are small enough for vectorized comparison[/cyan]")
-                self._compare_vectorized(source_file, comparison_file)
-            else:
-                # Chunked path: index-based comparison for large files
-                console.print("[cyan]Using chunked comparison for large files[/cyan]")
+            with monitor.span("select_engine") as span:
+                engine = self._select_engine(source_file, comparison_file)
+                span.attributes.update(
+                    engine=engine,
+                    estimated_peak_mb=round(self.plan.peak_mb.get(engine, 0)),
+                    budget_mb=self.plan.budget_mb
+                )
+            self.engine = engine
+
+            with monitor.span("compare", engine=engine):
+                if engine == "vectorized":
+                    # Fast path: vectorized comparison for small-to-medium files
+                    console.print("[cyan]Files are small enough for vectorized comparison[/cyan]")
+                    self._compare_vectorized(source_file, comparison_file)
+                elif engine == "sort-merge":
+                    # Out-of-core path: sorted runs on disk, merge-joined within max_memory_mb
+                    console.print("[cyan]Using external sort-merge comparison[/cyan]")
+                    self._compare_with_sort_merge(source_file, comparison_file)
+                    monitor.update_rows(
+                        self.diff_tracker.summary.total_source_rows
+                        + self.diff_tracker.summary.total_comparison_rows
+                    )
+                elif engine == "two-phase":
+                    # Hash-first path: compare fingerprints, then re-read only changed rows
+                    console.print("[cyan]Using two-phase hash-first comparison[/cyan]")
+                    self._compare_two_phase(source_file, comparison_file)
+                    monitor.update_rows(
+                        self.diff_tracker.summary.total_source_rows
+                        + self.diff_tracker.summary.total_comparison_rows
+                    )
+                elif engine == "partitioned":
+                    # Parallel path: key-hash buckets compared in worker processes
+                    console.print(
+                        f"[cyan]Using partitioned comparison across "
+                        f"{self.settings.get_effective_workers()} workers[/cyan]"
+                    )
+                    self._compare_partitioned(source_file, comparison_file)
+                    monitor.update_rows(
+                        self.diff_tracker.summary.total_source_rows
+                        + self.diff_tracker.summary.total_comparison_rows
+                    )
+                else:
+                    # Chunked path: index-based comparison for large files
+                    console.print("[cyan]Using chunked comparison for large files[/cyan]")
 
-                # Build source index
-                console.print("\n[bold cyan]Step 3a: Building source file index...[/bold cyan]")
-                source_index = self._build_file_index(source_file, "Source")
-                monitor.update_rows(len(source_index))
+                    # Build source index
+                    console.print("\n[bold cyan]Step 3a: Building source file index...[/bold cyan]")
+                    source_index = self._build_source_index(source_file)
+                    monitor.update_rows(len(source_index))
 
-                # Compare with comparison file
-                console.print("\n[bold cyan]Step 3b: Comparing files...[/bold cyan]")
-                self._compare_against_index(comparison_file, source_index)
-                monitor.update_rows(self.diff_tracker.summary.total_comparison_rows)
+                    # Compare with comparison file
+                    console.print("\n[bold cyan]Step 3b: Comparing files...[/bold cyan]")
+                    self._compare_against_index(comparison_file, source_index, source_file)
+                    monitor.update_rows(self.diff_tracker.summary.total_comparison_rows)
 
             # Step 5: Generate reports
             console.print("\n[bold cyan]Step 5: Generating reports...[/bold cyan]")
-            self._generate_reports(source_file, comparison_file)
+            with monitor.span("reports"):
+                self._generate_reports(source_file, comparison_file)
 
             # Complete
             monitor.complete()
@@ -460,7 +1274,7 @@ class FileComparer:
             if not self.diff_tracker.has_differences():
                 console.print("\n[bold green]No differences found! Files are identical.[/bold green]")
             else:
-                console.print(f"\n[bold yellow]Found {len(self.diff_tracker.differences):,} differences.[/bold yellow]")
+                console.print(f"\n[bold yellow]Found {self.diff_tracker.get_difference_count():,} differences.[/bold yellow]")
 
             return True
 
@@ -469,6 +1283,82 @@ class FileComparer:
             logger.exception("Comparison error")
             return False
 
+        finally:
+            monitor.complete()
+            self.phase_timings = monitor.get_phase_timings()
+            self._write_trace(monitor)
+
+            # The reports are written, so spilled differences are no longer needed
+            if self.diff_tracker is not None:
+                self.diff_tracker.cleanup()
+
+    def _key_dtypes(self, source_file: Path) -> Dict[str, pl.DataType]:
+        """
+        Get the key columns' data types from the source file's probe.
+
+        Args:
+            source_file: Path to source file
+
+        Returns:
+            Dictionary mapping key column name to its data type
+        """
+        schema = self.reader.probe(source_file).schema
+        key_columns = self.settings.get_key_columns() or [self.key_column]
+        return {col: schema[col] for col in key_columns if col in schema}
+
+    def _compile_normalizers(self, source_file: Path, comparison_file: Path) -> Dict[str, CellNormalizer]:
+        """
+        Choose a normalizer per text column from both files' probe samples.
+
+        Args:
+            source_file: Path to source file
+            comparison_file: Path to comparison file
+
+        Returns:
+            Dictionary mapping column name to its normalizer
+        """
+        compiler = NormalizerCompiler(self.settings.case_sensitive)
+        normalizers = compiler.compile(
+            self.reader.probe(filepath).sample for filepath in (source_file, comparison_file)
+        )
+
+        logger.debug(
+            "Column normalizers: "
+            + ", ".join(f"{col}={normalizer.rule}" for col, normalizer in normalizers.items())
+        )
+        return normalizers
+
+    def _write_trace(self, monitor: PerformanceMonitor):
+        """
+        Write the trace, Chrome trace and profile files requested in settings.
+        Without trace_file they go to the output directory as trace_<timestamp>.*
+
+        Args:
+            monitor: Completed monitor of the run
+        """
+        if not (self.settings.trace_file or self.settings.profile_cpu or self.settings.trace_memory):
+            return
+
+        trace_file = self.settings.trace_file
+        if trace_file is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            trace_file = self.settings.output_dir / f"trace_{timestamp}.json"
+
+        try:
+            written = [
+                monitor.write_trace(trace_file),
+                monitor.write_chrome_trace(trace_file.with_suffix(".chrome.json")),
+                monitor.write_profile(trace_file.with_suffix(".prof"))
+            ]
+        except OSError as e:
+            console.print(f"[yellow]Warning: Could not write trace files: {e}[/yellow]")
+            return
+
+        console.print("\n[bold]Trace files:[/bold]")
+        for file in written:
+            if file is not None:
+                console.print(f"  [blue]{file}[/blue]")
+
     def _validate_files(self, source_file: Path, comparison_file: Path):
         """Validate input files."""
         # Check source file
@@ -532,7 +1422,32 @@ class FileComparer:
         )
         return first_col
 
-    def _build_file_index(self, filepath: Path, label: str) -> Dict[Any, List[Dict[str, Any]]]:
+    def _check_compare_columns(self, source_file: Path, comparison_file: Path, compare_columns: List[str]):
+        """
+        Check that the compared columns exist (headers only, no data is read).
+
+        Args:
+            source_file: Path to source file
+            comparison_file: Path to comparison file
+            compare_columns: Columns to compare
+
+        Raises:
+            ValueError: If none of the columns exist in either file
+        """
+        available = set(self.reader.get_columns(source_file)) | set(self.reader.get_columns(comparison_file))
+        missing = [col for col in compare_columns if col not in available]
+
+        if len(missing) == len(compare_columns):
+            raise ValueError(f"None of the columns to compare were found: {', '.join(missing)}")
+        if missing:
+            console.print(f"[yellow]Warning: Columns to compare not found in either file: {', '.join(missing)}[/yellow]")
+
+    def _build_file_index(
+        self,
+        filepath: Path,
+        label: str,
+        fingerprint_parts: Optional[List[pl.DataFrame]] = None
+    ) -> Dict[Any, List[Dict[str, Any]]]:
         """
         Build an index of file contents (key -> list of rows).
         Supports multiple rows per key (duplicates).
@@ -540,13 +1455,16 @@ class FileComparer:
         Args:
             filepath: Path to file
             label: Label for progress display
+            fingerprint_parts: Optional list that receives per-chunk fingerprints for caching
 
         Returns:
             Dictionary mapping key values to list of row data (supports duplicates)
         """
         index = {}
         total_rows = 0
+        rows_read = 0
         sort_columns = self.settings.get_sort_columns()
+        key_columns = self.settings.get_key_columns() or [self.key_column]
 
         with Progress(
             TextColumn("[progress.description]{task.description}"),
@@ -556,36 +1474,29 @@ class FileComparer:
             transient=False
         ) as progress:
 
-            task = progress.add_task(f"Reading {label} file...", total=None)
-
-            for chunk in self.reader.read_chunked(filepath):
-                for row_dict in chunk.iter_rows(named=True):
-                    key_value = self._get_composite_key(row_dict)
-
-                    if key_value is not None:
-                        # Store row with its hash in a list (supports duplicates)
-                        row_hash = self.hash_engine.hash_row(row_dict)
-                        row_entry = {
-                            "hash": row_hash,
-                            "data": row_dict
-                        }
-
-                        if key_value not in index:
-                            index[key_value] = []
-                        index[key_value].append(row_entry)
-
-                    total_rows += 1
-
+            task = progress.add_task(f"Reading {label} file...", total=self.reader.progress_total(filepath))
+
+            for chunk in self.monitor.timed_iter(self.reader.read_chunked(filepath), "read", file=label):
+                with self.monitor.span("hash", file=label) as span:
+                    row_hashes = self.hash_engine.hash_dataframe_rows(chunk)
+                    if fingerprint_parts is not None:
+                        fingerprint_parts.append(FingerprintCache.fingerprint_chunk(
+                            chunk, row_hashes, key_columns, sort_columns, total_rows
+                        ))
+                    span.update_rows(len(chunk))
+
+                with self.monitor.span("index", file=label) as span:
+                    span.update_rows(self._index_chunk(chunk, index, row_hashes))
+                total_rows += span.rows
+                rows_read += len(chunk)
                 progress.update(task, advance=len(chunk))
 
-            progress.update(task, completed=True, description=f"{label} file indexed")
+            progress.update(task, total=rows_read, completed=rows_read, description=f"{label} file indexed")
 
         # Sort rows within each key group if sort columns specified
         if sort_columns:
             console.print(f"[yellow]Sorting duplicate keys by: {', '.join(sort_columns)}[/yellow]")
-            for key_value in index:
-                if len(index[key_value]) > 1:
-                    index[key_value] = self._sort_rows(index[key_value], sort_columns)
+            self._sort_index_groups(index, sort_columns)
 
         console.print(f"[green]OK: Indexed {total_rows:,} rows from {label} file[/green]")
 
@@ -602,10 +1513,165 @@ class FileComparer:
 
         return index
 
+    def _index_chunk(
+        self,
+        chunk: pl.DataFrame,
+        index: Dict[Any, List[Dict[str, Any]]],
+        row_hashes: Optional[pl.Series] = None
+    ) -> int:
+        """
+        Add the rows of one chunk to a key index.
+
+        Args:
+            chunk: DataFrame chunk
+            index: Index to update in place (key -> list of row entries)
+            row_hashes: Precomputed row hashes (computed here if None)
+
+        Returns:
+            Number of rows read from the chunk (including rows with null keys)
+        """
+        # Hash the whole chunk at once (columnar when enabled)
+        if row_hashes is None:
+            row_hashes = self.hash_engine.hash_dataframe_rows(chunk)
+
+        for row_dict, row_hash in zip(chunk.iter_rows(named=True), row_hashes):
+            key_value = self._get_composite_key(row_dict)
+
+            if key_value is not None:
+                # Store row with its hash in a list (supports duplicates)
+                row_entry = {
+                    "hash": row_hash,
+                    "data": row_dict
+                }
+
+                if key_value not in index:
+                    index[key_value] = []
+                index[key_value].append(row_entry)
+
+        return len(chunk)
+
+    def _build_source_index(self, source_file: Path) -> Dict[Any, List[Dict[str, Any]]]:
+        """
+        Build the source index, using the fingerprint cache when enabled.
+        On a cache hit the index holds row hashes only; rows whose hashes
+        differ are re-read later by _fetch_source_rows.
+
+        Args:
+            source_file: Path to source file
+
+        Returns:
+            Dictionary mapping key values to list of row entries
+        """
+        if self.fingerprint_cache is None:
+            return self._build_file_index(source_file, "Source")
+
+        key_columns = self.settings.get_key_columns() or [self.key_column]
+        cache_key = self.fingerprint_cache.cache_key(source_file, key_columns, self.settings)
+
+        cached = self.fingerprint_cache.get(cache_key)
+        if cached is not None:
+            console.print(f"[green]Using cached fingerprints for Source file[/green]")
+            return self._index_fingerprints(cached)
+
+        fingerprint_parts = []
+        index = self._build_file_index(source_file, "Source", fingerprint_parts)
+
+        if fingerprint_parts:
+            self.fingerprint_cache.put(
+                cache_key,
+                source_file,
+                pl.concat(fingerprint_parts, how="vertical_relaxed"),
+                self.diff_tracker.summary.total_source_rows
+            )
+
+        return index
+
+    def _index_fingerprints(self, cached: CachedFingerprints) -> Dict[Any, List[Dict[str, Any]]]:
+        """
+        Build a hash-only source index from cached fingerprints.
+        Entries carry their row number, and only sort column values as data.
+
+        Args:
+            cached: Cached fingerprints of the source file
+
+        Returns:
+            Dictionary mapping key values to list of row entries
+        """
+        index = {}
+        sort_columns = self.settings.get_sort_columns()
+
+        for row_dict in cached.fingerprints.iter_rows(named=True):
+            key_value = self._get_composite_key(row_dict)
+
+            if key_value not in index:
+                index[key_value] = []
+            index[key_value].append({
+                "hash": row_dict[FingerprintCache.ROW_HASH_COLUMN],
+                "row_nr": row_dict[FingerprintCache.ROW_NUMBER_COLUMN],
+                "data": {col: row_dict.get(col) for col in sort_columns}
+            })
+
+        if sort_columns:
+            self._sort_index_groups(index, sort_columns)
+
+        self.diff_tracker.summary.total_source_rows = cached.total_rows
+        console.print(f"[green]OK: Loaded {len(cached.fingerprints):,} cached fingerprints from Source file[/green]")
+
+        return index
+
+    def _fetch_source_rows(
+        self,
+        source_file: Path,
+        source_index: Dict[Any, List[Dict[str, Any]]],
+        comparison_index: Dict[Any, List[Dict[str, Any]]]
+    ):
+        """
+        Load full row data for hash-only source entries that need it: rows
+        whose hash differs from their positional match, or that have none.
+
+        Args:
+            source_file: Path to source file
+            source_index: Source index (hash-only entries are filled in place)
+            comparison_index: Comparison index
+        """
+        pending = {}
+        for key_value, source_rows in source_index.items():
+            comparison_rows = comparison_index.get(key_value, [])
+            for position, entry in enumerate(source_rows):
+                if "row_nr" not in entry:
+                    continue
+                if position < len(comparison_rows) and entry["hash"] == comparison_rows[position]["hash"]:
+                    continue
+                pending[entry["row_nr"]] = entry
+
+        if not pending:
+            return
+
+        console.print(f"[yellow]Re-reading {len(pending):,} changed rows from Source file...[/yellow]")
+
+        row_numbers = pl.Series(list(pending), dtype=pl.UInt64)
+        chunks = self.reader.read_rows(source_file, row_numbers, FingerprintCache.ROW_NUMBER_COLUMN)
+        for rows in self.monitor.timed_iter(chunks, "read", file="Source"):
+            for row_dict in rows.iter_rows(named=True):
+                pending[row_dict.pop(FingerprintCache.ROW_NUMBER_COLUMN)]["data"] = row_dict
+
+    def _sort_index_groups(self, index: Dict[Any, List[Dict[str, Any]]], sort_columns: List[str]):
+        """
+        Sort rows within each duplicate key group in place.
+
+        Args:
+            index: Key index (key -> list of row entries)
+            sort_columns: Columns to sort by
+        """
+        for key_value in index:
+            if len(index[key_value]) > 1:
+                index[key_value] = self._sort_rows(index[key_value], sort_columns)
+
     def _compare_against_index(
         self,
         filepath: Path,
-        source_index: Dict[Any, List[Dict[str, Any]]]
+        source_index: Dict[Any, List[Dict[str, Any]]],
+        source_file: Optional[Path] = None
     ):
         """
         Compare file against source index.
@@ -614,19 +1680,15 @@ class FileComparer:
         Args:
             filepath: Path to comparison file
             source_index: Index built from source file (key -> list of rows)
+            source_file: Path to source file (needed when the index came from the fingerprint cache)
         """
-        # Track which comparison rows we've seen for each key
-        comparison_key_counts = {}
-        comparison_keys = set()
-        exact_matches = 0
-        sort_columns = self.settings.get_sort_columns()
-        exclude_columns = self.settings.get_exclude_columns()
-        key_columns = self.settings.get_key_columns() or [self.key_column]
-
         # Build comparison index first (needed for sorting duplicates)
         console.print("[yellow]Building comparison index for duplicate handling...[/yellow]")
         comparison_index = self._build_file_index(filepath, "Comparison")
 
+        if source_file is not None:
+            self._fetch_source_rows(source_file, source_index, comparison_index)
+
         # Now compare row-by-row with position matching
         with Progress(
             TextColumn("[progress.description]{task.description}"),
@@ -638,107 +1700,139 @@ class FileComparer:
 
             task = progress.add_task("Comparing files...", total=len(comparison_index))
 
-            for key_value, comparison_rows in comparison_index.items():
-                comparison_keys.add(key_value)
-
-                if key_value in source_index:
-                    source_rows = source_index[key_value]
-
-                    # Match rows by position within key group
-                    max_rows = max(len(source_rows), len(comparison_rows))
-
-                    for i in range(max_rows):
-                        if i < len(source_rows) and i < len(comparison_rows):
-                            # Both files have this position - compare them
-                            source_row = source_rows[i]
-                            comparison_row = comparison_rows[i]
-
-                            source_hash = source_row["hash"]
-                            comparison_hash = comparison_row["hash"]
-
-                            if source_hash == comparison_hash:
-                                # Exact match
-                                exact_matches += 1
-                            else:
-                                # Row modified - find field-level differences
-                                source_data = source_row["data"]
-                                comparison_data = comparison_row["data"]
-                                diff_count = self.diff_tracker.compare_rows(
-                                    key_value,
-                                    source_data,
-                                    comparison_data,
-                                    ignore_columns=exclude_columns
-                                )
-                                if diff_count > 0:
-                                    self.diff_tracker.summary.modified_rows += 1
-
-                        elif i < len(source_rows):
-                            # Only in source (extra row in source)
-                            self.diff_tracker.summary.only_in_source += 1
-
-                            # Add to detailed output
-                            source_row = source_rows[i]
-                            self._add_row_difference(
-                                row_dict=source_row["data"],
-                                key_columns=key_columns,
-                                key_value=key_value,
-                                exclude_columns=exclude_columns,
-                                diff_type="removed"
-                            )
+            with self.monitor.span("diff") as span:
+                exact_matches = self._compare_indexes(
+                    source_index,
+                    comparison_index,
+                    on_key_compared=lambda: progress.update(task, advance=1)
+                )
+                span.update_rows(len(comparison_index))
 
-                        elif i < len(comparison_rows):
-                            # Only in comparison (extra row in comparison)
-                            self.diff_tracker.summary.only_in_comparison += 1
-
-                            # Add to detailed output
-                            comparison_row = comparison_rows[i]
-                            self._add_row_difference(
-                                row_dict=comparison_row["data"],
-                                key_columns=key_columns,
-                                key_value=key_value,
-                                exclude_columns=exclude_columns,
-                                diff_type="added"
-                            )
+            progress.update(task, completed=True, description="Comparison complete")
 
-                else:
-                    # Key only in comparison file
-                    self.diff_tracker.summary.only_in_comparison += len(comparison_rows)
+        self.diff_tracker.summary.exact_matches = exact_matches
 
-                    # Add all rows for this key to detailed output
-                    for comparison_row in comparison_rows:
-                        self._add_row_difference(
-                            row_dict=comparison_row["data"],
-                            key_columns=key_columns,
-                            key_value=key_value,
-                            exclude_columns=exclude_columns,
-                            diff_type="added"
-                        )
+        console.print(f"[green]OK: Comparison complete[/green]")
+        console.print(f"  Exact matches: {exact_matches:,}")
+        console.print(f"  Differences found: {self.diff_tracker.get_difference_count():,}")
+
+    def _compare_indexes(
+        self,
+        source_index: Dict[Any, List[Dict[str, Any]]],
+        comparison_index: Dict[Any, List[Dict[str, Any]]],
+        on_key_compared: Optional[Callable[[], None]] = None
+    ) -> int:
+        """
+        Compare two key indexes, recording differences in the diff tracker.
 
-                progress.update(task, advance=1)
+        Args:
+            source_index: Index built from source file (key -> list of rows)
+            comparison_index: Index built from comparison file (key -> list of rows)
+            on_key_compared: Optional callback after each comparison key (for progress)
 
-            progress.update(task, completed=True, description="Comparison complete")
+        Returns:
+            Number of exact matches
+        """
+        exact_matches = 0
+        exclude_columns = self.settings.get_exclude_columns()
+        key_columns = self.settings.get_key_columns() or [self.key_column]
+
+        for key_value, comparison_rows in comparison_index.items():
+            # Match rows by position within key group (empty if key only in comparison)
+            source_rows = source_index.get(key_value, [])
+            exact_matches += self._compare_key_group(
+                key_value,
+                source_rows,
+                comparison_rows,
+                key_columns,
+                exclude_columns
+            )
+
+            if on_key_compared:
+                on_key_compared()
 
         # Find keys only in source
-        source_keys = set(source_index.keys())
-        only_in_source_keys = source_keys - comparison_keys
+        only_in_source_keys = source_index.keys() - comparison_index.keys()
         for key in only_in_source_keys:
-            self.diff_tracker.summary.only_in_source += len(source_index[key])
+            self._compare_key_group(key, source_index[key], [], key_columns, exclude_columns)
+
+        return exact_matches
+
+    def _compare_key_group(
+        self,
+        key_value: Any,
+        source_rows: List[Dict[str, Any]],
+        comparison_rows: List[Dict[str, Any]],
+        key_columns: List[str],
+        exclude_columns: List[str]
+    ) -> int:
+        """
+        Compare all rows sharing one key, matching duplicates by position.
+        Either list may be empty when the key exists in only one file.
 
-            # Add all rows for this key to detailed output
-            for source_row in source_index[key]:
+        Args:
+            key_value: Key value shared by the rows
+            source_rows: Source row entries (with 'hash' and 'data' keys)
+            comparison_rows: Comparison row entries (with 'hash' and 'data' keys)
+            key_columns: List of key column names
+            exclude_columns: Columns to exclude from comparison
+
+        Returns:
+            Number of exact matches in the group
+        """
+        exact_matches = 0
+        max_rows = max(len(source_rows), len(comparison_rows))
+
+        for i in range(max_rows):
+            if i < len(source_rows) and i < len(comparison_rows):
+                # Both files have this position - compare them
+                source_row = source_rows[i]
+                comparison_row = comparison_rows[i]
+
+                if source_row["hash"] == comparison_row["hash"]:
+                    # Exact match
+                    exact_matches += 1
+                else:
+                    # Row modified - find field-level differences
+                    diff_count = self.diff_tracker.compare_rows(
+                        key_value,
+                        source_row["data"],
+                        comparison_row["data"],
+                        ignore_columns=exclude_columns
+                    )
+                    if diff_count > 0:
+                        self.diff_tracker.summary.modified_rows += 1
+                    else:
+                        # Hashes differ only in ways normalization ignores
+                        exact_matches += 1
+
+            elif i < len(source_rows):
+                # Only in source (extra row in source)
+                self.diff_tracker.summary.only_in_source += 1
+
+                # Add to detailed output
                 self._add_row_difference(
-                    row_dict=source_row["data"],
+                    row_dict=source_rows[i]["data"],
                     key_columns=key_columns,
-                    key_value=key,
+                    key_value=key_value,
                     exclude_columns=exclude_columns,
                     diff_type="removed"
                 )
 
-        self.diff_tracker.summary.exact_matches = exact_matches
+            else:
+                # Only in comparison (extra row in comparison)
+                self.diff_tracker.summary.only_in_comparison += 1
 
-        console.print(f"[green]OK: Comparison complete[/green]")
-        console.print(f"  Exact matches: {exact_matches:,}")
-        console.print(f"  Differences found: {len(self.diff_tracker.differences):,}")
+                # Add to detailed output
+                self._add_row_difference(
+                    row_dict=comparison_rows[i]["data"],
+                    key_columns=key_columns,
+                    key_value=key_value,
+                    exclude_columns=exclude_columns,
+                    diff_type="added"
+                )
+
+        return exact_matches
 
     def _get_composite_key(self, row_dict: Dict[str, Any]) -> Optional[Any]:
         """
@@ -774,6 +1868,11 @@ class FileComparer:
     ) -> List[Dict[str, Any]]:
         """
         Sort rows by specified columns.
+        Orders rows like Polars' arg_sort_by: stable, nulls first and NaN after
+        all other numbers, so every engine pairs duplicate keys the same way.
+        A sort column holding values of different types (e.g. numbers in early
+        chunks, text in later ones) is ordered by its text form, as Polars
+        orders the String column such chunks combine into.
 
         Args:
             rows: List of row entries (with 'hash' and 'data' keys)
@@ -784,14 +1883,29 @@ class FileComparer:
         """
         def sort_key(row_entry):
             row_data = row_entry["data"]
-            # Create tuple of sort column values
-            return tuple(row_data.get(col) for col in sort_columns)
+            # (not null, is NaN, value) per column: nulls never reach a comparison
+            return tuple(
+                (value is not None, value != value, value)
+                for value in (row_data.get(col) for col in sort_columns)
+            )
+
+        def text_sort_key(row_entry):
+            row_data = row_entry["data"]
+            return tuple(
+                (value is not None, "" if value is None else str(value))
+                for value in (row_data.get(col) for col in sort_columns)
+            )
 
         try:
             return sorted(rows, key=sort_key)
-        except Exception as e:
-            logger.warning(f"Failed to sort rows: {e}. Using original order.")
-            return rows
+        except TypeError:
+            if not self._mixed_sort_warned:
+                console.print(
+                    "[yellow]Warning: Sort columns mix value types within a key group, "
+                    "sorting those groups by text[/yellow]"
+                )
+                self._mixed_sort_warned = True
+            return sorted(rows, key=text_sort_key)
 
     def _generate_reports(self, source_file: Path, comparison_file: Path):
         """Generate output reports."""
@@ -799,24 +1913,58 @@ class FileComparer:
             console.print("[green]No differences to report[/green]")
             return
 
-        # Get differences as DataFrame
-        diff_df = self.diff_tracker.get_differences_dataframe()
+        # Get differences lazily so spilled differences are streamed to the writers
+        diff_df = self.diff_tracker.get_differences_lazy()
 
         # Get summary stats
         summary_stats = {
-            "total_differences": len(self.diff_tracker.differences),
-            "unique_keys": len(set(diff.key_value for diff in self.diff_tracker.differences)),
+            "total_differences": self.diff_tracker.get_difference_count(),
+            "unique_keys": self.diff_tracker.get_summary().unique_keys_with_differences,
             "exact_matches": self.diff_tracker.summary.exact_matches
         }
 
         # Write outputs
-        output_files = self.writer.write_differences(
-            diff_df,
-            source_file.name,
-            comparison_file.name,
-            summary_stats
-        )
+        with self.monitor.span("write") as span:
+            output_files = self.writer.write_differences(
+                diff_df,
+                source_file.name,
+                comparison_file.name,
+                summary_stats,
+                self.diff_tracker.get_summary().to_dict(),
+                self.monitor,
+                self._key_dtypes(source_file)
+            )
+            span.update_rows(summary_stats["total_differences"])
+            span.add_bytes(sum(file.stat().st_size for file in output_files if file.exists()))
 
         console.print(f"\n[bold green]Reports generated successfully![/bold green]")
         for file in output_files:
             console.print(f"  [blue]{file}[/blue]")
+
+
+def _compare_partition_worker(
+    settings_data: Dict[str, Any],
+    key_column: str,
+    source_parts: List[Path],
+    comparison_parts: List[Path],
+    normalizers: Dict[str, CellNormalizer]
+) -> DifferenceTracker:
+    """
+    Process pool entry point: compare one bucket pair.
+
+    Args:
+        settings_data: ComparisonSettings as a dictionary
+        key_column: Resolved key column
+        source_parts: Source part files for the bucket
+        comparison_parts: Comparison part files for the bucket
+        normalizers: Per-column normalizers compiled by the parent
+
+    Returns:
+        DifferenceTracker holding the bucket's differences and summary counters
+    """
+    comparer = FileComparer(ComparisonSettings.from_dict(settings_data))
+    comparer.key_column = key_column
+    # Bucket results go back to the parent in memory; the parent tracker spills as it merges
+    comparer.diff_tracker = DifferenceTracker(key_column, comparer.settings.case_sensitive, normalizers=normalizers)
+    comparer._compare_partition(source_parts, comparison_parts)
+    return comparer.diff_tracker
@@ -2,16 +2,22 @@
 Difference tracker for managing and storing comparison results.
 """
 
-from typing import List, Dict, Any
+import shutil
+import tempfile
+import weakref
+from pathlib import Path
+from typing import List, Dict, Any, Iterator, Optional
 from dataclasses import dataclass
 import polars as pl
 from rich.console import Console
 
+from .normalization import CellNormalizer
+
 
 console = Console()
 
 
-@dataclass
+@dataclass(slots=True)
 class DifferenceRecord:
     """Single field-level difference."""
 
@@ -58,23 +64,104 @@ class ComparisonSummary:
             "unique_keys_with_differences": self.unique_keys_with_differences
         }
 
+    def add(self, other: "ComparisonSummary"):
+        """
+        Add another summary's row counters to this one.
+        Derived counts (field differences, unique keys) are recomputed by the tracker.
+
+        Args:
+            other: Summary to add
+        """
+        self.total_source_rows += other.total_source_rows
+        self.total_comparison_rows += other.total_comparison_rows
+        self.exact_matches += other.exact_matches
+        self.modified_rows += other.modified_rows
+        self.only_in_source += other.only_in_source
+        self.only_in_comparison += other.only_in_comparison
+
 
 class DifferenceTracker:
     """
     Track and manage differences found during comparison.
+
+    Differences are stored column-wise: scalar additions are buffered in
+    per-column lists and flushed into DataFrame batches, and columnar
+    comparisons append whole batches. Every value is kept as text.
+
+    With a spill threshold, batches held in memory are written to Parquet
+    files in a private temporary directory whenever they reach the threshold,
+    so memory use does not grow with the number of differences. The files
+    are removed by cleanup() or when the tracker is garbage collected.
     """
 
-    def __init__(self, key_column: str):
+    # Schema of stored difference batches (key is rendered as text)
+    BATCH_SCHEMA = {
+        "key": pl.String,
+        "field": pl.String,
+        "source_value": pl.String,
+        "comparison_value": pl.String,
+        "type": pl.String
+    }
+
+    # Buffered scalar differences per flushed batch
+    BUFFER_ROWS = 100000
+
+    # Fast codec for short-lived spill files
+    SPILL_COMPRESSION = "lz4"
+
+    def __init__(
+        self,
+        key_column: str,
+        case_sensitive: bool = True,
+        spill_threshold_rows: int = 0,
+        temp_dir: Optional[Path] = None,
+        normalizers: Optional[Dict[str, CellNormalizer]] = None
+    ):
         """
         Initialize difference tracker.
 
         Args:
             key_column: Name of key column for grouping differences (can be comma-separated for composite keys)
+            case_sensitive: Compare text case-sensitively
+            spill_threshold_rows: In-memory differences that trigger a spill to disk (0 = never spill)
+            temp_dir: Parent directory for spill files (None = system temp directory)
+            normalizers: Per-column normalizers (see NormalizerCompiler); other columns use the generic one
         """
         self.key_column = key_column
-        self.differences: List[DifferenceRecord] = []
+        self.case_sensitive = case_sensitive
+        self.normalizers: Dict[str, CellNormalizer] = normalizers or {}
+        self._default_normalizer = CellNormalizer(case_sensitive)
+        self.spill_threshold_rows = spill_threshold_rows
+        self.temp_dir = temp_dir
+        self.difference_batches: List[pl.DataFrame] = []
+        self.spill_files: List[Path] = []
+        self._spilled_rows = 0
+        self._spill_dir: Optional[Path] = None
+        self._spill_finalizer: Optional[weakref.finalize] = None
+        self._buffer: Dict[str, List[str]] = {column: [] for column in self.BATCH_SCHEMA}
+        self._unique_keys: Optional[int] = None  # Cached by get_summary until differences change
         self.summary = ComparisonSummary()
 
+    @property
+    def differences(self) -> List[DifferenceRecord]:
+        """
+        Differences as records (built on demand; values are text).
+
+        Returns:
+            List of DifferenceRecord in insertion order
+        """
+        return [
+            DifferenceRecord(
+                key_value=row["key"],
+                field_name=row["field"],
+                source_value=row["source_value"],
+                comparison_value=row["comparison_value"],
+                difference_type=row["type"]
+            )
+            for batch in self._iter_batches()
+            for row in batch.iter_rows(named=True)
+        ]
+
     def add_field_difference(
         self,
         key_value: Any,
@@ -93,14 +180,93 @@ class DifferenceTracker:
             comparison_value: Value in comparison file
             diff_type: Type of difference (modified, added, removed)
         """
-        diff = DifferenceRecord(
-            key_value=key_value,
-            field_name=field_name,
-            source_value=source_value,
-            comparison_value=comparison_value,
-            difference_type=diff_type
+        self._unique_keys = None
+
+        # Stringify now (avoids type inference issues and holds no row objects)
+        self._buffer["key"].append(str(key_value) if key_value is not None else "")
+        self._buffer["field"].append(str(field_name))
+        self._buffer["source_value"].append(str(source_value) if source_value is not None else "")
+        self._buffer["comparison_value"].append(str(comparison_value) if comparison_value is not None else "")
+        self._buffer["type"].append(diff_type)
+
+        if len(self._buffer["key"]) >= self.BUFFER_ROWS:
+            self._flush_buffer()
+
+    def add_differences(self, differences: pl.DataFrame):
+        """
+        Add a batch of field-level differences produced by columnar comparison.
+
+        Args:
+            differences: DataFrame with BATCH_SCHEMA columns (values already rendered as text)
+        """
+        if len(differences) == 0:
+            return
+
+        # Keep insertion order relative to buffered scalar differences
+        self._flush_buffer()
+        self._append_batch(
+            differences.select(list(self.BATCH_SCHEMA)).with_columns(
+                pl.col("key", "source_value", "comparison_value").fill_null("")
+            )
         )
-        self.differences.append(diff)
+
+    def _flush_buffer(self):
+        """Move buffered scalar differences into a DataFrame batch."""
+        if not self._buffer["key"]:
+            return
+
+        batch = pl.DataFrame(self._buffer, schema=self.BATCH_SCHEMA)
+        self._buffer = {column: [] for column in self.BATCH_SCHEMA}
+        self._append_batch(batch)
+
+    def _append_batch(self, batch: pl.DataFrame):
+        """Keep a batch in memory, spilling to disk once the threshold is reached."""
+        self._unique_keys = None
+        self.difference_batches.append(batch)
+
+        if self.spill_threshold_rows > 0 and self._in_memory_rows() >= self.spill_threshold_rows:
+            self._spill()
+
+    def _in_memory_rows(self) -> int:
+        """Number of differences held in memory."""
+        return len(self._buffer["key"]) + sum(len(batch) for batch in self.difference_batches)
+
+    def _spill(self):
+        """Write the in-memory batches to a new spill file and release them."""
+        if not self.difference_batches:
+            return
+
+        if self._spill_dir is None:
+            self._spill_dir = Path(tempfile.mkdtemp(prefix="spreadsheet-diff-", dir=self.temp_dir))
+            self._spill_finalizer = weakref.finalize(self, shutil.rmtree, self._spill_dir, True)
+
+        # Parquet (rather than IPC) so spilled differences can be scanned by
+        # Polars' streaming engine, e.g. straight into sink_csv
+        spill_file = self._spill_dir / f"differences_{len(self.spill_files):05d}.parquet"
+        batch = pl.concat(self.difference_batches)
+        batch.write_parquet(spill_file, compression=self.SPILL_COMPRESSION)
+
+        self.spill_files.append(spill_file)
+        self._spilled_rows += len(batch)
+        self.difference_batches = []
+
+    def _iter_batches(self) -> Iterator[pl.DataFrame]:
+        """Yield stored batches in insertion order."""
+        self._flush_buffer()
+
+        for spill_file in self.spill_files:
+            yield pl.read_parquet(spill_file)
+
+        yield from self.difference_batches
+
+    def get_difference_count(self) -> int:
+        """
+        Get the number of recorded differences.
+
+        Returns:
+            Count of field-level differences
+        """
+        return self._spilled_rows + self._in_memory_rows()
 
     def compare_rows(
         self,
@@ -137,10 +303,9 @@ class DifferenceTracker:
             comparison_val = comparison_row.get(column)
 
             # Normalize values for comparison
-            source_normalized = self._normalize_for_comparison(source_val)
-            comparison_normalized = self._normalize_for_comparison(comparison_val)
+            normalize = self.normalizer_for(column)
 
-            if source_normalized != comparison_normalized:
+            if normalize(source_val) != normalize(comparison_val):
                 # Record the difference
                 self.add_field_difference(
                     key_value=key_value,
@@ -153,169 +318,53 @@ class DifferenceTracker:
 
         return differences_found
 
-    def _try_parse_numeric(self, value: str) -> Any:
+    def normalizer_for(self, column: str) -> CellNormalizer:
         """
-        Try to parse a string as a numeric value.
+        Get the normalizer for a column.
 
         Args:
-            value: String to parse
+            column: Column name
 
         Returns:
-            Numeric value (int or float) or original string if parsing fails
+            The column's compiled normalizer, or the generic one
         """
-        try:
-            # Try int first (handles large numbers without precision loss)
-            if '.' not in value and 'e' not in value.lower():
-                return int(value)
-            # Try float (handles scientific notation like 2.20E+09)
-            return float(value)
-        except (ValueError, AttributeError):
-            return value
-
-    def _try_parse_datetime(self, value: str):
-        """
-        Try to parse a string as a datetime.
+        return self.normalizers.get(column, self._default_normalizer)
 
-        Args:
-            value: String to parse
+    def get_differences_lazy(self) -> pl.LazyFrame:
+        """
+        Get all differences as a LazyFrame.
+        Once anything has been spilled, the remaining batches are spilled too so
+        the result is a single streaming scan over the spill files.
 
         Returns:
-            datetime object or original string if parsing fails
+            LazyFrame of all differences
         """
-        from datetime import datetime
-
-        # Common date/datetime formats
-        formats = [
-            '%Y-%m-%d %H:%M:%S',
-            '%Y-%m-%d %H:%M:%S.%f',
-            '%Y-%m-%d',
-            '%d/%m/%Y',
-            '%m/%d/%Y',
-            '%Y/%m/%d',
-            '%d-%m-%Y',
-            '%m-%d-%Y'
-        ]
+        self._flush_buffer()
 
-        for fmt in formats:
-            try:
-                return datetime.strptime(value, fmt)
-            except (ValueError, AttributeError):
-                continue
+        if not self.spill_files:
+            return self.get_differences_dataframe().lazy()
 
-        return value
-
-    def _normalize_for_comparison(self, value: Any) -> Any:
-        """
-        Normalize a value for comparison with intelligent type handling.
-
-        Args:
-            value: Value to normalize
+        self._spill()
 
-        Returns:
-            Normalized value (handles type mismatches, numeric precision, dates)
-        """
-        from datetime import datetime, date
-        import math
-        import html
-
-        # Handle None
-        if value is None:
-            return None
-
-        # Handle float NaN
-        if isinstance(value, float) and math.isnan(value):
-            return None
-
-        # Handle strings
-        if isinstance(value, str):
-            normalized = value.strip()
-
-            # Treat common null representations as None
-            if not normalized or normalized in ("None", "NULL", "null", "N/A", "nan", "NaN"):
-                return None
-
-            # Decode HTML entities
-            normalized = html.unescape(normalized)
-
-            # Try parsing as numeric (handles scientific notation, large numbers)
-            numeric_val = self._try_parse_numeric(normalized)
-            if numeric_val != normalized:
-                return numeric_val
-
-            # Try parsing as datetime
-            datetime_val = self._try_parse_datetime(normalized)
-            if datetime_val != normalized:
-                # Truncate to date only if no time component
-                if isinstance(datetime_val, datetime) and datetime_val.time().replace(microsecond=0) == datetime_val.time().min:
-                    return datetime_val.date()
-                return datetime_val
-
-            return normalized
-
-        # Handle datetime objects - truncate to date if time is midnight
-        if isinstance(value, datetime):
-            if value.time().replace(microsecond=0) == value.time().min:
-                return value.date()
-            return value
-
-        # Handle date objects
-        if isinstance(value, date):
-            return value
-
-        # Handle numeric types - normalize to comparable form
-        if isinstance(value, (int, float)):
-            # Very large integers might be stored as floats in one file and ints in another
-            # Normalize floats that are actually integers
-            if isinstance(value, float) and value.is_integer() and abs(value) < 2**53:
-                return int(value)
-            return value
-
-        return value
+        # Rename 'key' column to actual key column name
+        return pl.scan_parquet(self.spill_files).rename({"key": self.key_column})
 
     def get_differences_dataframe(self) -> pl.DataFrame:
         """
         Convert differences to Polars DataFrame.
+        Loads spilled differences into memory; use get_differences_lazy to stream them.
 
         Returns:
             DataFrame of all differences
         """
-        if not self.differences:
-            # Return empty DataFrame with correct schema
-            return pl.DataFrame({
-                self.key_column: [],
-                "field": [],
-                "source_value": [],
-                "comparison_value": [],
-                "type": []
-            })
-
-        # Convert to list of dicts with all values as strings (avoid type inference issues)
-        records = []
-        for diff in self.differences:
-            records.append({
-                "key": str(diff.key_value) if diff.key_value is not None else "",
-                "field": str(diff.field_name),
-                "source_value": str(diff.source_value) if diff.source_value is not None else "",
-                "comparison_value": str(diff.comparison_value) if diff.comparison_value is not None else "",
-                "type": diff.difference_type
-            })
-
-        # Create DataFrame with explicit schema
-        df = pl.DataFrame(
-            records,
-            schema={
-                "key": pl.String,
-                "field": pl.String,
-                "source_value": pl.String,
-                "comparison_value": pl.String,
-                "type": pl.String
-            }
-        )
+        self._flush_buffer()
 
-        # Rename 'key' column to actual key column name
-        df = df.rename({"key": self.key_column})
+        if self.spill_files:
+            return self.get_differences_lazy().collect()
 
-        return df
+        # Batches share one schema, so this only links their chunks
+        batches = self.difference_batches or [pl.DataFrame(schema=self.BATCH_SCHEMA)]
+        return pl.concat(batches, rechunk=False).rename({"key": self.key_column})
 
     def get_summary(self) -> ComparisonSummary:
         """
@@ -325,12 +374,19 @@ class DifferenceTracker:
             ComparisonSummary object
         """
         # Update field differences count
-        self.summary.field_differences = len(self.differences)
-
-        # Count unique keys with differences
-        if self.differences:
-            unique_keys = set(diff.key_value for diff in self.differences)
-            self.summary.unique_keys_with_differences = len(unique_keys)
+        self.summary.field_differences = self.get_difference_count()
+
+        # Count unique keys with differences (scans spill files, so only once
+        # per set of differences)
+        if self.has_differences():
+            if self._unique_keys is None:
+                self._unique_keys = (
+                    self.get_differences_lazy()
+                    .select(pl.col(self.key_column).n_unique())
+                    .collect()
+                    .item()
+                )
+            self.summary.unique_keys_with_differences = self._unique_keys
 
         return self.summary
 
@@ -352,6 +408,19 @@ class DifferenceTracker:
         console.print(f"[bold red]Unique records affected: {summary.unique_keys_with_differences:,}[/bold red]")
         console.print("=" * 60)
 
+    def merge(self, other: "DifferenceTracker"):
+        """
+        Merge differences and summary counters from another tracker.
+        Used to combine results of partitions compared in separate processes.
+
+        Args:
+            other: Tracker to merge into this one
+        """
+        self._flush_buffer()
+        for batch in other._iter_batches():
+            self._append_batch(batch)
+        self.summary.add(other.summary)
+
     def has_differences(self) -> bool:
         """
         Check if any differences were found.
@@ -359,9 +428,32 @@ class DifferenceTracker:
         Returns:
             True if differences exist
         """
-        return len(self.differences) > 0
+        return self.get_difference_count() > 0
+
+    def cleanup(self):
+        """
+        Remove spill files written by this tracker.
+        Spilled differences can no longer be read afterwards, but the counts
+        and the summary still include them.
+        """
+        if self.spill_files:
+            self.get_summary()  # Caches the unique-key count while the spill files exist
+        self._remove_spill_files()
+
+    def _remove_spill_files(self):
+        """Delete the spill directory."""
+        if self._spill_finalizer is not None:
+            self._spill_finalizer()
+            self._spill_finalizer = None
+
+        self._spill_dir = None
+        self.spill_files = []
 
     def clear(self):
         """Clear all tracked differences."""
-        self.differences.clear()
+        self._remove_spill_files()
+        self._spilled_rows = 0
+        self._unique_keys = None
+        self.difference_batches.clear()
+        self._buffer = {column: [] for column in self.BATCH_SCHEMA}
         self.summary = ComparisonSummary()
@@ -0,0 +1,280 @@
+"""
+Persistent fingerprint cache for repeat comparisons.
+Stores a file's key -> row hash index on disk so a source file compared
+against many files is only re-read for the rows whose hashes differ.
+"""
+
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import polars as pl
+from rich.console import Console
+
+from ..config.settings import ComparisonSettings
+
+try:
+    import xxhash
+    HAS_XXHASH = True
+except ImportError:
+    HAS_XXHASH = False
+
+
+console = Console()
+
+
+@dataclass
+class CachedFingerprints:
+    """Fingerprints loaded from the cache."""
+
+    path: Path
+    total_rows: int
+    fingerprints: pl.DataFrame  # key columns, sort columns, row hash, row number
+
+
+class FingerprintCache:
+    """
+    Cache of per-row fingerprints stored as Arrow IPC files.
+
+    Each entry holds one row per indexed row of a file: its key columns
+    (native dtypes), sort columns, row hash and row number. Entries are keyed
+    by the file's identity (path, size, mtime, sampled content digest) and
+    every setting that changes how rows are read, keyed or hashed, so a stale
+    entry is never reused. Least recently used entries are evicted once the
+    cache exceeds its size limit.
+    """
+
+    # Bump when the stored layout or hashing changes
+    FORMAT_VERSION = 1
+
+    INDEX_FILE = "cache_index.json"
+
+    # Internal columns stored with every entry
+    ROW_NUMBER_COLUMN = "_row_nr"
+    ROW_HASH_COLUMN = "_row_hash"
+
+    # Bytes read from the start and end of a file for the content digest
+    DIGEST_SAMPLE_BYTES = 1024 * 1024
+
+    # Settings that affect how rows are read, keyed or hashed
+    KEY_SETTINGS = (
+        "key_column",
+        "sort_columns",
+        "exclude_columns",
+        "compare_columns",
+        "case_sensitive",
+        "ignore_whitespace",
+        "null_equivalents",
+        "use_fast_hash",
+        "use_columnar_hash",
+        "chunk_size"
+    )
+
+    def __init__(self, cache_dir: Path, max_size_mb: int):
+        """
+        Initialize fingerprint cache.
+
+        Args:
+            cache_dir: Directory holding cache entries (created if missing)
+            max_size_mb: Total size limit for cache entries
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_size_bytes = max_size_mb * 1024 * 1024
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def cache_key(
+        self,
+        filepath: Path,
+        key_columns: List[str],
+        settings: ComparisonSettings
+    ) -> str:
+        """
+        Compute the cache key of a file under the given settings.
+
+        Args:
+            filepath: Path to file
+            key_columns: Resolved key column names
+            settings: Comparison settings
+
+        Returns:
+            Hex digest identifying the cache entry
+        """
+        stat = filepath.stat()
+        identity = {
+            "format_version": self.FORMAT_VERSION,
+            "path": str(filepath.resolve()),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "content_digest": self._content_digest(filepath, stat.st_size),
+            "key_columns": key_columns,
+            "settings": {name: getattr(settings, name) for name in self.KEY_SETTINGS},
+            "xxhash": HAS_XXHASH,
+            "polars": pl.__version__
+        }
+
+        return hashlib.sha256(json.dumps(identity, sort_keys=True, default=str).encode()).hexdigest()
+
+    def _content_digest(self, filepath: Path, size: int) -> str:
+        """
+        Digest the head and tail of a file (cheap guard against same-size edits).
+
+        Args:
+            filepath: Path to file
+            size: File size in bytes
+
+        Returns:
+            Hex digest
+        """
+        hasher = xxhash.xxh64() if HAS_XXHASH else hashlib.md5()
+
+        with open(filepath, "rb") as f:
+            hasher.update(f.read(self.DIGEST_SAMPLE_BYTES))
+            if size > self.DIGEST_SAMPLE_BYTES:
+                f.seek(max(self.DIGEST_SAMPLE_BYTES, size - self.DIGEST_SAMPLE_BYTES))
+                hasher.update(f.read(self.DIGEST_SAMPLE_BYTES))
+
+        return hasher.hexdigest()
+
+    def get(self, cache_key: str) -> Optional[CachedFingerprints]:
+        """
+        Load a cache entry (memory-mapped) and mark it as recently used.
+
+        Args:
+            cache_key: Key from cache_key()
+
+        Returns:
+            CachedFingerprints, or None on a cache miss
+        """
+        index = self._load_index()
+        entry = index.get(cache_key)
+        if entry is None:
+            return None
+
+        path = self.cache_dir / entry["file"]
+        if not path.exists():
+            del index[cache_key]
+            self._save_index(index)
+            return None
+
+        entry["last_used"] = time.time()
+        self._save_index(index)
+
+        return CachedFingerprints(
+            path=path,
+            total_rows=entry["total_rows"],
+            fingerprints=pl.read_ipc(path, memory_map=True)
+        )
+
+    def put(
+        self,
+        cache_key: str,
+        filepath: Path,
+        fingerprints: pl.DataFrame,
+        total_rows: int
+    ) -> Optional[Path]:
+        """
+        Store a cache entry and evict least recently used entries over the limit.
+
+        Args:
+            cache_key: Key from cache_key()
+            filepath: File the fingerprints were computed from
+            fingerprints: Fingerprint rows (see fingerprint_chunk)
+            total_rows: Rows read from the file (including rows with null keys)
+
+        Returns:
+            Path of the stored entry, or None if it exceeds the cache size limit
+        """
+        path = self.cache_dir / f"{cache_key}.arrow"
+        temp_path = self.cache_dir / f"{cache_key}.{os.getpid()}.tmp"
+
+        fingerprints.write_ipc(temp_path)
+        size = temp_path.stat().st_size
+
+        if size > self.max_size_bytes:
+            temp_path.unlink()
+            console.print(
+                f"[yellow]Fingerprints for {filepath.name} ({size / 1024 / 1024:,.1f} MB) "
+                f"exceed the cache limit, not cached[/yellow]"
+            )
+            return None
+
+        os.replace(temp_path, path)
+
+        index = self._load_index()
+        index[cache_key] = {
+            "file": path.name,
+            "source": str(filepath.resolve()),
+            "size": size,
+            "total_rows": total_rows,
+            "last_used": time.time()
+        }
+        self._evict(index)
+        self._save_index(index)
+
+        console.print(f"[green]OK: Cached fingerprints for {filepath.name}[/green]")
+        return path
+
+    def _evict(self, index: Dict[str, Dict[str, Any]]):
+        """Remove least recently used entries until the cache fits its limit."""
+        total_size = sum(entry["size"] for entry in index.values())
+
+        for cache_key, entry in sorted(index.items(), key=lambda item: item[1]["last_used"]):
+            if total_size <= self.max_size_bytes:
+                break
+
+            (self.cache_dir / entry["file"]).unlink(missing_ok=True)
+            total_size -= entry["size"]
+            del index[cache_key]
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        """Load the cache index (empty if missing or unreadable)."""
+        index_path = self.cache_dir / self.INDEX_FILE
+        try:
+            return json.loads(index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self, index: Dict[str, Dict[str, Any]]):
+        """Write the cache index atomically."""
+        index_path = self.cache_dir / self.INDEX_FILE
+        temp_path = self.cache_dir / f"{self.INDEX_FILE}.{os.getpid()}.tmp"
+
+        temp_path.write_text(json.dumps(index, indent=2), encoding="utf-8")
+        os.replace(temp_path, index_path)
+
+    @classmethod
+    def fingerprint_chunk(
+        cls,
+        chunk: pl.DataFrame,
+        row_hashes: pl.Series,
+        key_columns: List[str],
+        sort_columns: List[str],
+        row_offset: int
+    ) -> pl.DataFrame:
+        """
+        Build fingerprint rows for one chunk (rows with a null key part are dropped).
+
+        Args:
+            chunk: Input chunk
+            row_hashes: Row hashes of the chunk
+            key_columns: Key column names
+            sort_columns: Sort column names (kept for ordering duplicate keys)
+            row_offset: Position of the chunk's first row in the file
+
+        Returns:
+            DataFrame of key columns, sort columns, row hash and row number
+        """
+        columns = list(dict.fromkeys(key_columns + [col for col in sort_columns if col in chunk.columns]))
+
+        return (
+            chunk
+            .select(columns)
+            .with_columns(
+                row_hashes.alias(cls.ROW_HASH_COLUMN),
+                pl.int_range(pl.len(), dtype=pl.UInt64).add(row_offset).alias(cls.ROW_NUMBER_COLUMN)
+            )
+            .filter(pl.all_horizontal(pl.col(key_columns).is_not_null()))
+        )
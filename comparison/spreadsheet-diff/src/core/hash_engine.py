@@ -17,16 +17,36 @@ except ImportError:
 class RowHashEngine:
     """
     Efficiently compute row hashes for comparison.
+
+    Two hashing modes are available:
+    - Columnar (default): normalizes every column with Polars expressions and
+      combines the per-column hashes into one UInt64 per row in a single pass.
+    - Per-row: Python loop over row dicts using xxhash/md5 hex digests. Kept as
+      a fallback for dtypes the columnar path cannot normalize.
+
+    Hashes from the two modes are not interchangeable; only compare hashes
+    produced by the same mode.
     """
 
-    def __init__(self, use_fast_hash: bool = True):
+    # String values treated as NULL when hashing (mirrors _normalize_value)
+    NULL_STRINGS = ["None", "NULL", "null", "N/A", "nan", "NaN"]
+
+    # Decimal places kept for floats (mirrors the f"{value:.10f}" format)
+    FLOAT_PRECISION = 10
+
+    # Seed for Polars row hashing (fixed so hashes are stable within a run)
+    HASH_SEED = 0
+
+    def __init__(self, use_fast_hash: bool = True, use_columnar_hash: bool = True):
         """
         Initialize hash engine.
 
         Args:
             use_fast_hash: Use xxhash if available (faster than hashlib)
+            use_columnar_hash: Hash DataFrames with Polars expressions instead of per-row Python
         """
         self.use_xxhash = use_fast_hash and HAS_XXHASH
+        self.use_columnar_hash = use_columnar_hash
         self.hash_enabled = True  # Can be disabled for unique keys
 
     def should_hash(self, keys_have_duplicates: bool) -> bool:
@@ -100,27 +120,145 @@ class RowHashEngine:
         else:
             return hashlib.md5(combined.encode('utf-8')).hexdigest()
 
-    def hash_dataframe_rows(self, df: pl.DataFrame) -> pl.Series:
+    def hash_dataframe_rows(
+        self,
+        df: pl.DataFrame,
+        exclude_columns: List[str] = None
+    ) -> pl.Series:
         """
         Compute hashes for all rows in a DataFrame.
+        Uses the columnar path when enabled, falling back to per-row hashing
+        if a column cannot be normalized with Polars expressions.
 
         Args:
             df: Polars DataFrame
+            exclude_columns: Optional columns to leave out of the hash
 
         Returns:
-            Series of row hashes
+            Series of row hashes (UInt64 when columnar, hex strings otherwise)
         """
-        # Create hash for each row
-        # Use Polars native operations for speed
-        def row_hash_func(row_dict):
-            return self.hash_row(row_dict)
+        if self.use_columnar_hash:
+            try:
+                return self.hash_dataframe_rows_columnar(df, exclude_columns)
+            except (pl.exceptions.InvalidOperationError, pl.exceptions.ComputeError):
+                # Nested or otherwise uncastable dtypes - use the Python path
+                pass
+
+        return self.hash_dataframe_rows_python(df, exclude_columns)
+
+    def hash_dataframe_rows_python(
+        self,
+        df: pl.DataFrame,
+        exclude_columns: List[str] = None
+    ) -> pl.Series:
+        """
+        Compute row hashes one row at a time in Python (fallback path).
+
+        Args:
+            df: Polars DataFrame
+            exclude_columns: Optional columns to leave out of the hash
+
+        Returns:
+            Series of hex string row hashes
+        """
+        if exclude_columns:
+            df = df.select([col for col in df.columns if col not in exclude_columns])
 
-        # Convert to list of dicts and hash
         hashes = []
         for row in df.iter_rows(named=True):
             hashes.append(self.hash_row(row))
 
-        return pl.Series("_row_hash", hashes)
+        return pl.Series("_row_hash", hashes, dtype=pl.String)
+
+    def hash_dataframe_rows_columnar(
+        self,
+        df: pl.DataFrame,
+        exclude_columns: List[str] = None
+    ) -> pl.Series:
+        """
+        Compute row hashes for a whole DataFrame in one pass with Polars.
+        Each column is normalized to a string (same rules as _normalize_value),
+        then Polars combines the per-column hashes into one UInt64 per row.
+
+        Args:
+            df: Polars DataFrame
+            exclude_columns: Optional columns to leave out of the hash
+
+        Returns:
+            Series of UInt64 row hashes
+        """
+        exclude_set = set(exclude_columns or [])
+
+        # Sort columns for consistent hashing (same as hash_row)
+        hash_columns = sorted(col for col in df.columns if col not in exclude_set)
+
+        if not hash_columns:
+            return pl.Series("_row_hash", [0] * len(df), dtype=pl.UInt64)
+
+        normalized = df.select([
+            self.normalize_column_expr(col, df.schema[col]) for col in hash_columns
+        ])
+
+        return normalized.hash_rows(seed=self.HASH_SEED).alias("_row_hash")
+
+    def normalize_column_expr(self, column: str, dtype: pl.DataType) -> pl.Expr:
+        """
+        Build a Polars expression that normalizes a column for hashing.
+        Columnar equivalent of _normalize_value: nulls, NaN and null-like strings
+        become "NULL", strings are stripped, floats are rounded to a fixed precision.
+
+        Args:
+            column: Column name
+            dtype: Column data type
+
+        Returns:
+            Expression producing a String column
+        """
+        expr = pl.col(column)
+
+        if dtype.is_float():
+            expr = expr.fill_nan(None).round(self.FLOAT_PRECISION)
+        elif dtype == pl.String:
+            expr = expr.str.strip_chars()
+            expr = pl.when(
+                (expr == "") | expr.is_in(self.NULL_STRINGS)
+            ).then(None).otherwise(expr)
+
+        # Cast everything to String so hashes agree across files whose
+        # columns were inferred with different types (e.g. Int64 vs String)
+        return expr.cast(pl.String).fill_null("NULL").alias(column)
+
+    def verify_hash_consistency(
+        self,
+        df: pl.DataFrame,
+        exclude_columns: List[str] = None
+    ) -> bool:
+        """
+        Check that the columnar and per-row paths agree about which rows are equal.
+        The hash values differ between modes, but both must partition the rows
+        into the same groups of identical rows.
+
+        Args:
+            df: DataFrame to check
+            exclude_columns: Optional columns to leave out of the hash
+
+        Returns:
+            True if both paths group rows identically
+        """
+        if len(df) == 0:
+            return True
+
+        pairs = pl.DataFrame({
+            "columnar": self.hash_dataframe_rows_columnar(df, exclude_columns),
+            "python": self.hash_dataframe_rows_python(df, exclude_columns)
+        })
+
+        # Each columnar hash must map to exactly one Python hash and vice versa
+        distinct_pairs = pairs.n_unique()
+        return (
+            distinct_pairs == pairs["columnar"].n_unique()
+            and distinct_pairs == pairs["python"].n_unique()
+        )
 
     def hash_key_value(self, key_value: Any, row: Dict[str, Any]) -> str:
         """
@@ -192,6 +330,12 @@ class RowHashEngine:
         if exclude_columns is None:
             exclude_columns = []
 
+        if self.use_columnar_hash:
+            try:
+                return self._create_row_fingerprint_columnar(df, key_column, exclude_columns)
+            except (pl.exceptions.InvalidOperationError, pl.exceptions.ComputeError):
+                pass
+
         # Select columns for hashing
         hash_columns = [col for col in df.columns if col not in exclude_columns]
 
@@ -209,6 +353,38 @@ class RowHashEngine:
             pl.Series("_fingerprint", fingerprints)
         )
 
+    def _create_row_fingerprint_columnar(
+        self,
+        df: pl.DataFrame,
+        key_column: str,
+        exclude_columns: List[str]
+    ) -> pl.DataFrame:
+        """
+        Columnar version of create_row_fingerprint (UInt64 fingerprints).
+
+        Args:
+            df: DataFrame to fingerprint
+            key_column: Name of key column
+            exclude_columns: Columns to exclude from hash
+
+        Returns:
+            DataFrame with added '_fingerprint' column
+        """
+        row_hashes = self.hash_dataframe_rows_columnar(df, exclude_columns)
+
+        if key_column in df.columns:
+            key_expr = self.normalize_column_expr(key_column, df.schema[key_column])
+        else:
+            key_expr = pl.lit("NULL")
+
+        # Combine key and row hash into a single fingerprint
+        fingerprints = df.select(
+            key_expr.alias("_key"),
+            row_hashes.alias("_row_hash")
+        ).hash_rows(seed=self.HASH_SEED)
+
+        return df.with_columns(fingerprints.alias("_fingerprint"))
+
     def get_hash_stats(self) -> Dict[str, Any]:
         """
         Get information about hash engine configuration.
@@ -219,5 +395,6 @@ class RowHashEngine:
         return {
             "hash_algorithm": "xxhash64" if self.use_xxhash else "md5",
             "xxhash_available": HAS_XXHASH,
-            "using_fast_hash": self.use_xxhash
+            "using_fast_hash": self.use_xxhash,
+            "hash_mode": "columnar" if self.use_columnar_hash else "per-row"
         }
@@ -0,0 +1,523 @@
+"""
+Value normalization for field-level comparison.
+CellNormalizer applies the comparison rules to single Python values;
+NormalizerCompiler picks a specialized CellNormalizer per column from a
+sample. ValueNormalizer expresses the same rules as Polars expressions so
+whole columns can be compared without a Python loop.
+"""
+
+import html
+import math
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional
+import polars as pl
+
+
+# Strings treated as null/empty during comparison
+NULL_STRINGS = ["None", "NULL", "null", "N/A", "nan", "NaN"]
+
+# Date/datetime formats tried in order when a string is not numeric
+DATE_FORMATS = [
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%d %H:%M:%S.%f',
+    '%Y-%m-%d',
+    '%d/%m/%Y',
+    '%m/%d/%Y',
+    '%Y/%m/%d',
+    '%d-%m-%Y',
+    '%m-%d-%Y'
+]
+
+
+# Words float() parses besides numbers (case-insensitive, optionally signed)
+FLOAT_WORDS = {"inf", "infinity", "nan"}
+
+
+def _to_polars_format(fmt: str) -> str:
+    """Translate a Python strptime format to Polars (chrono) syntax."""
+    return fmt.replace(".%f", "%.f")
+
+
+def _unescape_html(series: pl.Series) -> pl.Series:
+    """
+    Decode HTML entities in a String series.
+    Only distinct values containing '&' go through html.unescape.
+    """
+    has_entity = series.str.contains("&", literal=True)
+    if not has_entity.any():
+        return series
+
+    candidates = series.filter(has_entity).unique().drop_nulls()
+    return series.replace(candidates, [html.unescape(value) for value in candidates])
+
+
+class ValueNormalizer:
+    """
+    Build Polars expressions that normalize columns for comparison.
+
+    Every value is mapped to a tagged canonical string, so two cells are equal
+    exactly when their canonical strings are equal (nulls compare equal):
+    - n:<number>  numeric values (integral floats folded to integers)
+    - d:<date>    dates and midnight datetimes (truncated to the date)
+    - t:<stamp>   datetimes with a time component
+    - s:<text>    remaining text (stripped, HTML-decoded, optionally lowercased)
+    - o:<value>   other types, compared by their string form
+    """
+
+    DATE_OUTPUT_FORMAT = "%Y-%m-%d"
+    DATETIME_OUTPUT_FORMAT = "%Y-%m-%d %H:%M:%S%.6f"
+
+    # Largest magnitude an integral float can have and still fold to Int64
+    MAX_FOLDABLE_FLOAT = 9.2e18
+
+    def __init__(self, case_sensitive: bool = True):
+        """
+        Initialize value normalizer.
+
+        Args:
+            case_sensitive: Compare text case-sensitively
+        """
+        self.case_sensitive = case_sensitive
+
+    def canonical_expr(self, column: str, dtype: pl.DataType) -> pl.Expr:
+        """
+        Build the canonical comparison form of a column.
+
+        Args:
+            column: Column name
+            dtype: Column data type
+
+        Returns:
+            Expression producing a String column (null for null-like values)
+        """
+        return self._canonical(pl.col(column), dtype).alias(column)
+
+    def _canonical(self, expr: pl.Expr, dtype: pl.DataType) -> pl.Expr:
+        """Dispatch to the canonical form for a data type."""
+        if dtype == pl.Null:
+            return pl.lit(None, dtype=pl.String)
+
+        if dtype == pl.String:
+            return self._canonical_string(expr)
+
+        if dtype == pl.Boolean:
+            # bool is an int subclass in Python, so True == 1
+            return self._tag("n:", expr.cast(pl.Int64).cast(pl.String))
+
+        if dtype.is_integer():
+            return self._tag("n:", expr.cast(pl.String))
+
+        if dtype.is_float() or dtype == pl.Decimal:
+            return self._canonical_float(expr.cast(pl.Float64))
+
+        if dtype == pl.Date:
+            return self._tag("d:", expr.dt.to_string(self.DATE_OUTPUT_FORMAT))
+
+        if dtype == pl.Datetime:
+            return self._canonical_datetime(expr)
+
+        return self._tag("o:", expr.cast(pl.String))
+
+    def display_expr(self, column: str, dtype: pl.DataType) -> pl.Expr:
+        """
+        Build the display form of a column (matches str(value) for output).
+
+        Args:
+            column: Column name
+            dtype: Column data type
+
+        Returns:
+            Expression producing a String column
+        """
+        return self._display(pl.col(column), dtype).alias(column)
+
+    def _display(self, expr: pl.Expr, dtype: pl.DataType) -> pl.Expr:
+        """Dispatch to the display form for a data type."""
+        if dtype == pl.String:
+            return expr
+
+        if dtype == pl.Boolean:
+            # Null conditions fall through to otherwise(), so nulls are handled first
+            return (
+                pl.when(expr.is_null()).then(None)
+                .when(expr).then(pl.lit("True"))
+                .otherwise(pl.lit("False"))
+            )
+
+        if dtype == pl.Datetime:
+            return (
+                pl.when(expr.dt.microsecond() == 0)
+                .then(expr.dt.to_string("%Y-%m-%d %H:%M:%S"))
+                .otherwise(expr.dt.to_string("%Y-%m-%d %H:%M:%S%.6f"))
+            )
+
+        return expr.cast(pl.String)
+
+    def key_display_expr(self, key_columns: List[str], schema: pl.Schema) -> pl.Expr:
+        """
+        Build the display form of a (possibly composite) key.
+        Composite keys are rendered like Python tuples, e.g. "(1, 'a')".
+
+        Args:
+            key_columns: Key column names
+            schema: Schema of the frame holding the key columns
+
+        Returns:
+            Expression producing a String column
+        """
+        if len(key_columns) == 1:
+            return self.display_expr(key_columns[0], schema[key_columns[0]])
+
+        parts = []
+        for col in key_columns:
+            part = self.display_expr(col, schema[col])
+            if schema[col] == pl.String:
+                part = pl.format("'{}'", part)
+            parts.append(part.fill_null("None"))
+
+        return pl.format("({})", pl.concat_str(parts, separator=", "))
+
+    def _canonical_string(self, expr: pl.Expr) -> pl.Expr:
+        """Canonical form of a String column (null-like, numeric, date, then text)."""
+        text = expr.str.strip_chars()
+        text = pl.when((text == "") | text.is_in(NULL_STRINGS)).then(None).otherwise(text)
+        text = text.map_batches(_unescape_html, return_dtype=pl.String)
+
+        # Same split as _try_parse_numeric: no '.'/'e' -> int, otherwise float
+        is_int_like = ~text.str.contains(r"[.eE]")
+        as_int = pl.when(is_int_like).then(text.cast(pl.Int64, strict=False))
+        as_float = pl.when(~is_int_like).then(text.cast(pl.Float64, strict=False))
+        number = pl.coalesce(
+            self._tag("n:", as_int.cast(pl.String)),
+            self._canonical_float(as_float)
+        )
+
+        parsed = pl.coalesce([
+            text.str.strptime(pl.Datetime("us"), _to_polars_format(fmt), strict=False)
+            for fmt in DATE_FORMATS
+        ])
+
+        if not self.case_sensitive:
+            text = text.str.to_lowercase()
+
+        return (
+            pl.when(text.is_null()).then(None)
+            .when(number.is_not_null()).then(number)
+            .when(parsed.is_not_null()).then(self._canonical_datetime(parsed))
+            .otherwise(self._tag("s:", text))
+        )
+
+    def _canonical_float(self, expr: pl.Expr) -> pl.Expr:
+        """Canonical form of a Float64 expression (NaN -> null, integral -> integer)."""
+        value = expr.fill_nan(None)
+        is_integral = (value.round(0) == value) & (value.abs() < self.MAX_FOLDABLE_FLOAT)
+
+        return self._tag(
+            "n:",
+            pl.when(is_integral)
+            .then(value.cast(pl.Int64, strict=False).cast(pl.String))
+            .otherwise(value.cast(pl.String))
+        )
+
+    def _canonical_datetime(self, expr: pl.Expr) -> pl.Expr:
+        """Canonical form of a Datetime expression (midnight truncated to the date)."""
+        is_midnight = (
+            (expr.dt.hour() == 0)
+            & (expr.dt.minute() == 0)
+            & (expr.dt.second() == 0)
+        )
+
+        return (
+            pl.when(is_midnight)
+            .then(self._tag("d:", expr.dt.to_string(self.DATE_OUTPUT_FORMAT)))
+            .otherwise(self._tag("t:", expr.dt.to_string(self.DATETIME_OUTPUT_FORMAT)))
+        )
+
+    @staticmethod
+    def _tag(prefix: str, expr: pl.Expr) -> pl.Expr:
+        """Prefix a String expression with a type tag (null stays null)."""
+        return pl.concat_str([pl.lit(prefix), expr])
+
+
+class CellNormalizer:
+    """
+    Normalize single values for comparison (used by the row-by-row engines).
+
+    Values are normalized by a cascade of rules: nulls and null-like strings,
+    then for text: HTML entities, numbers (integral floats folded to
+    integers), dates in DATE_FORMATS order (midnight datetimes truncated to
+    the date) and finally plain text. Subclasses try one rule first and fall
+    back to the full cascade, so every normalizer returns the same result for
+    a value; they differ only in speed.
+    """
+
+    NULL_STRINGS = frozenset(NULL_STRINGS)
+
+    # Rule name reported by NormalizerCompiler
+    rule = "any"
+
+    def __init__(self, case_sensitive: bool = True):
+        """
+        Initialize cell normalizer.
+
+        Args:
+            case_sensitive: Compare text case-sensitively
+        """
+        self.case_sensitive = case_sensitive
+
+    def __call__(self, value: Any) -> Any:
+        """
+        Normalize a value.
+
+        Args:
+            value: Cell value
+
+        Returns:
+            Normalized value (None for null-like values)
+        """
+        if value is None:
+            return None
+
+        if isinstance(value, str):
+            return self._normalize_text(value)
+
+        if isinstance(value, float):
+            if math.isnan(value):
+                return None
+            # Integral floats compare equal to integers stored in the other file
+            if value.is_integer() and abs(value) < 2**53:
+                return int(value)
+            return value
+
+        if isinstance(value, datetime):
+            return self._truncate_midnight(value)
+
+        return value
+
+    def _normalize_text(self, value: str) -> Any:
+        """Apply the full rule cascade to a string."""
+        text = value.strip()
+        if not text or text in self.NULL_STRINGS:
+            return None
+
+        text = html.unescape(text)
+
+        number = self._parse_number(text)
+        if number is not None:
+            return number
+
+        for fmt in DATE_FORMATS:
+            parsed = self._parse_date(text, fmt)
+            if parsed is not None:
+                return parsed
+
+        return self._fold_case(text)
+
+    def _fold_case(self, text: str) -> str:
+        """Lowercase text for case-insensitive comparison."""
+        return text if self.case_sensitive else text.lower()
+
+    @staticmethod
+    def _parse_number(text: str) -> Optional[Any]:
+        """Parse text as int (no '.'/'e') or float (e.g. 2.20E+09); None if it is not a number."""
+        try:
+            if '.' not in text and 'e' not in text.lower():
+                return int(text)
+            return float(text)
+        except ValueError:
+            return None
+
+    @classmethod
+    def _parse_date(cls, text: str, fmt: str) -> Optional[Any]:
+        """Parse text with one date format; None if it does not match."""
+        try:
+            return cls._truncate_midnight(datetime.strptime(text, fmt))
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _truncate_midnight(value: datetime) -> Any:
+        """Truncate a datetime to its date when the time (ignoring microseconds) is midnight."""
+        if value.hour == 0 and value.minute == 0 and value.second == 0:
+            return value.date()
+        return value
+
+
+class NumericCellNormalizer(CellNormalizer):
+    """Normalizer for text columns holding numbers."""
+
+    rule = "numeric"
+
+    def _normalize_text(self, value: str) -> Any:
+        """Parse a number directly; anything else takes the full cascade."""
+        text = value.strip()
+        if not text or text in self.NULL_STRINGS:
+            return None
+
+        if '&' not in text:
+            number = self._parse_number(text)
+            if number is not None:
+                return number
+
+        return super()._normalize_text(value)
+
+
+class DateCellNormalizer(CellNormalizer):
+    """Normalizer for text columns holding dates in one format."""
+
+    def __init__(self, fmt: str, case_sensitive: bool = True):
+        """
+        Initialize date normalizer.
+
+        Args:
+            fmt: Date format of the column (one of DATE_FORMATS)
+            case_sensitive: Compare text case-sensitively
+        """
+        super().__init__(case_sensitive)
+        self.rule = f"date {fmt}"
+        self.formats = self._shadowing_formats(fmt) + [fmt]
+
+    @staticmethod
+    def _shadowing_formats(fmt: str) -> List[str]:
+        """
+        Earlier DATE_FORMATS that can parse the same strings as fmt.
+        Only formats with the same layout up to day/month order overlap
+        (e.g. '%d/%m/%Y' and '%m/%d/%Y'); they must be tried first so the
+        result matches the cascade.
+        """
+        def layout(value: str) -> str:
+            return value.replace("%m", "%d")
+
+        earlier = DATE_FORMATS[:DATE_FORMATS.index(fmt)]
+        return [other for other in earlier if layout(other) == layout(fmt)]
+
+    def _normalize_text(self, value: str) -> Any:
+        """Parse the column's date format directly; anything else takes the full cascade."""
+        text = value.strip()
+        if not text or text in self.NULL_STRINGS:
+            return None
+
+        # Strings matching a date format never parse as numbers
+        if '&' not in text:
+            for fmt in self.formats:
+                parsed = self._parse_date(text, fmt)
+                if parsed is not None:
+                    return parsed
+
+        return super()._normalize_text(value)
+
+
+class TextCellNormalizer(CellNormalizer):
+    """Normalizer for text columns holding neither numbers nor dates."""
+
+    rule = "text"
+
+    def _normalize_text(self, value: str) -> Any:
+        """Keep text that cannot be a number or date as is; anything else takes the full cascade."""
+        text = value.strip()
+        if not text or text in self.NULL_STRINGS:
+            return None
+
+        if '&' not in text and not self._may_be_number_or_date(text):
+            return self._fold_case(text)
+
+        return super()._normalize_text(value)
+
+    @staticmethod
+    def _may_be_number_or_date(text: str) -> bool:
+        """
+        Cheap test for text that might parse as a number or date.
+        Numbers start with a digit, sign or '.' unless they are inf/nan words;
+        every DATE_FORMATS entry starts with a digit.
+        """
+        return text[0].isdigit() or text[0] in "+-." or text.lower() in FLOAT_WORDS
+
+
+class NormalizerCompiler:
+    """
+    Choose a specialized CellNormalizer per column from sample rows.
+
+    Text columns whose sampled values are all numbers, all dates in one
+    format, or all plain text get a normalizer that tries that rule first.
+    Other columns (including non-text columns, whose values are already
+    typed) use the generic cascade. A wrong guess costs speed, not accuracy.
+    """
+
+    def __init__(self, case_sensitive: bool = True):
+        """
+        Initialize normalizer compiler.
+
+        Args:
+            case_sensitive: Compare text case-sensitively
+        """
+        self.case_sensitive = case_sensitive
+        self._generic = CellNormalizer(case_sensitive)
+
+    def compile(self, samples: Iterable[pl.DataFrame]) -> Dict[str, CellNormalizer]:
+        """
+        Build normalizers for the text columns of the samples.
+
+        Args:
+            samples: Sample rows of the compared files (e.g. FileProbe.sample)
+
+        Returns:
+            Dictionary mapping column name to its normalizer (text columns only)
+        """
+        values: Dict[str, List[str]] = {}
+        typed_columns = set()
+
+        for sample in samples:
+            for name, dtype in sample.schema.items():
+                if dtype == pl.String:
+                    values.setdefault(name, []).extend(sample[name].drop_nulls().to_list())
+                else:
+                    typed_columns.add(name)
+
+        return {
+            name: self.compile_column(column_values)
+            for name, column_values in values.items()
+            if name not in typed_columns
+        }
+
+    def compile_column(self, values: Iterable[str]) -> CellNormalizer:
+        """
+        Build the normalizer for one text column.
+
+        Args:
+            values: Sampled string values of the column
+
+        Returns:
+            Specialized normalizer, or the generic one for mixed columns
+        """
+        rules = {self.infer_rule(value) for value in values}
+        rules.discard(None)
+
+        if rules == {"numeric"}:
+            return NumericCellNormalizer(self.case_sensitive)
+        if rules == {"text"}:
+            return TextCellNormalizer(self.case_sensitive)
+        if len(rules) == 1 and next(iter(rules)) in DATE_FORMATS:
+            return DateCellNormalizer(next(iter(rules)), self.case_sensitive)
+
+        return CellNormalizer(self.case_sensitive)
+
+    def infer_rule(self, value: str) -> Optional[str]:
+        """
+        Name the rule of the cascade that decides a string value.
+
+        Args:
+            value: String value
+
+        Returns:
+            "numeric", a date format, "text", or None for null-like values
+        """
+        normalized = self._generic(value)
+
+        if normalized is None:
+            return None
+        if isinstance(normalized, (int, float)):
+            return "numeric"
+        if isinstance(normalized, (date, datetime)):
+            text = html.unescape(value.strip())
+            return next(fmt for fmt in DATE_FORMATS if CellNormalizer._parse_date(text, fmt) is not None)
+        return "text"
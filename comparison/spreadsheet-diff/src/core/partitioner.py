@@ -0,0 +1,127 @@
+"""
+Hash partitioning of input files for parallel comparison.
+Splits both files by key hash into matching buckets on disk so each
+bucket pair can be compared independently in a worker process.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List
+import polars as pl
+from rich.console import Console
+from rich.progress import Progress, TextColumn, BarColumn, TaskProgressColumn
+
+from ..config.settings import ComparisonSettings
+from ..io.readers import FileReader
+
+
+console = Console()
+
+
+@dataclass
+class PartitionedFile:
+    """Bucket files written for one input file."""
+
+    label: str
+    buckets: List[List[Path]] = field(default_factory=list)  # bucket -> part files in file order
+    total_rows: int = 0
+
+
+class HashPartitioner:
+    """
+    Partition files into key-hash buckets stored as Arrow IPC files.
+
+    Rows with equal keys always land in the same bucket number in both files,
+    because the bucket is derived from the key's string form (so an Int64 key
+    in one file and a String key in the other still agree).
+    """
+
+    # Separator between composite key parts before hashing
+    KEY_SEPARATOR = "\x1f"
+
+    # Fixed seed so both files use the same bucket assignment
+    HASH_SEED = 0
+
+    BUCKET_COLUMN = "_bucket"
+
+    def __init__(
+        self,
+        settings: ComparisonSettings,
+        reader: FileReader,
+        temp_dir: Path,
+        num_partitions: int
+    ):
+        """
+        Initialize hash partitioner.
+
+        Args:
+            settings: Comparison settings
+            reader: File reader used to stream input chunks
+            temp_dir: Directory for bucket files (caller owns cleanup)
+            num_partitions: Number of buckets
+        """
+        self.settings = settings
+        self.reader = reader
+        self.temp_dir = temp_dir
+        self.num_partitions = max(1, num_partitions)
+
+    def partition_file(self, filepath: Path, key_columns: List[str], label: str) -> PartitionedFile:
+        """
+        Stream a file and write each chunk's rows to their key-hash buckets.
+
+        Args:
+            filepath: Path to input file
+            key_columns: Key column names
+            label: Label for progress display and bucket file names
+
+        Returns:
+            PartitionedFile listing the part files of every bucket
+        """
+        partitioned = PartitionedFile(
+            label=label,
+            buckets=[[] for _ in range(self.num_partitions)]
+        )
+
+        bucket_expr = (
+            pl.concat_str(
+                [pl.col(col).cast(pl.String) for col in key_columns],
+                separator=self.KEY_SEPARATOR
+            )
+            .hash(self.HASH_SEED)
+            .mod(self.num_partitions)
+            .alias(self.BUCKET_COLUMN)
+        )
+
+        with Progress(
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TaskProgressColumn(),
+            console=console,
+            transient=False
+        ) as progress:
+
+            task = progress.add_task(f"Partitioning {label} file...", total=self.reader.progress_total(filepath))
+
+            for chunk_number, chunk in enumerate(self.reader.read_chunked(filepath)):
+                parts = chunk.with_columns(bucket_expr).partition_by(
+                    self.BUCKET_COLUMN,
+                    as_dict=True,
+                    include_key=False
+                )
+
+                for (bucket,), part in parts.items():
+                    part_path = self.temp_dir / f"{label.lower()}_b{bucket:04d}_c{chunk_number:05d}.arrow"
+                    part.write_ipc(part_path)
+                    partitioned.buckets[bucket].append(part_path)
+
+                partitioned.total_rows += len(chunk)
+                progress.update(task, advance=len(chunk))
+
+            progress.update(task, total=partitioned.total_rows, completed=partitioned.total_rows, description=f"{label} file partitioned")
+
+        console.print(
+            f"[green]OK: Partitioned {partitioned.total_rows:,} rows from {label} file "
+            f"into {self.num_partitions} buckets[/green]"
+        )
+
+        return partitioned
@@ -0,0 +1,207 @@
+"""
+Memory-budget-aware engine selection.
+Estimates the peak memory of each comparison engine from the probed inputs
+and picks the fastest engine that fits within max_memory_mb.
+"""
+
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Any, Dict
+from rich.console import Console
+
+from ..config.settings import ComparisonSettings
+from ..io.readers import FileReader
+from ..utils.performance import estimate_memory_required
+from ..utils.logger import get_logger
+from .sort_merge import ExternalSortMerger
+
+
+console = Console()
+logger = get_logger(__name__)
+
+
+@dataclass
+class FileEstimate:
+    """Estimated in-memory (Arrow) size of one input file."""
+
+    rows: int
+    columns: int
+    memory_mb: float
+
+
+@dataclass
+class EnginePlan:
+    """Engine chosen for a comparison and the estimates behind the choice."""
+
+    engine: str
+    reason: str
+    budget_mb: int
+    source: FileEstimate
+    comparison: FileEstimate
+    peak_mb: Dict[str, float]  # Estimated peak memory by engine
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return asdict(self)
+
+
+class EnginePlanner:
+    """
+    Choose a comparison engine that fits the memory budget.
+
+    The in-memory size of each file is extrapolated from its probed sample
+    (only the columns that are read) and row count. Engine peaks are that
+    size times an overhead factor measured on mixed-type data:
+
+    - vectorized: both files, the joined frame and the comparison masks
+    - index: the source file as Python row dicts, plus one comparison chunk
+    - partitioned: both files as Python row dicts, spread over the workers
+    - sort-merge: bounded by the run size, whatever the file size
+
+    Files below skip_chunking_threshold rows are compared in memory when the
+    vectorized peak fits. Larger files use the partitioned engine on multi-core
+    systems, the index engine if the source index fits, and sort-merge otherwise.
+    """
+
+    # Peak memory relative to the Arrow size of the data held
+    VECTORIZED_OVERHEAD = 3.5
+    INDEX_OVERHEAD = 28.0
+    CHUNK_OVERHEAD = 3.0
+
+    # Rows sampled per file to measure the row size
+    SAMPLE_ROWS = 1000
+
+    def __init__(self, settings: ComparisonSettings, reader: FileReader):
+        """
+        Initialize engine planner.
+
+        Args:
+            settings: Comparison settings (max_memory_mb is the budget)
+            reader: File reader whose probes supply row counts and samples
+        """
+        self.settings = settings
+        self.reader = reader
+
+    def estimate_file(self, filepath: Path) -> FileEstimate:
+        """
+        Estimate the in-memory size of the columns read from a file.
+
+        Args:
+            filepath: Path to file
+
+        Returns:
+            FileEstimate
+        """
+        rows = self.reader.estimate_rows(filepath)
+        columns = self.reader.projected_columns(filepath)
+        sample = self.reader.read_sample(filepath, n_rows=self.SAMPLE_ROWS).select(columns)
+
+        return FileEstimate(
+            rows=rows,
+            columns=len(columns),
+            memory_mb=estimate_memory_required(rows, len(columns), sample=sample, overhead=1.0)
+        )
+
+    def estimate_peaks(self, source: FileEstimate, comparison: FileEstimate) -> Dict[str, float]:
+        """
+        Estimate the peak memory of each engine.
+
+        Args:
+            source: Source file estimate
+            comparison: Comparison file estimate
+
+        Returns:
+            Dictionary mapping engine name to estimated peak MB
+        """
+        data_mb = source.memory_mb + comparison.memory_mb
+
+        def chunk_mb(estimate: FileEstimate, chunk_rows: int) -> float:
+            if estimate.rows == 0:
+                return 0.0
+            return estimate.memory_mb * min(1.0, chunk_rows / estimate.rows) * self.CHUNK_OVERHEAD
+
+        largest = max(source, comparison, key=lambda estimate: estimate.memory_mb)
+        run_mb = self.settings.max_memory_mb * ExternalSortMerger.RUN_MEMORY_FRACTION
+
+        return {
+            "vectorized": data_mb * self.VECTORIZED_OVERHEAD,
+            "index": (
+                source.memory_mb * self.INDEX_OVERHEAD
+                + chunk_mb(comparison, self.settings.chunk_size)
+            ),
+            "partitioned": (
+                data_mb * self.INDEX_OVERHEAD
+                + chunk_mb(largest, self.settings.chunk_size)
+            ),
+            "sort-merge": min(largest.memory_mb, run_mb) * self.CHUNK_OVERHEAD
+        }
+
+    def plan(self, source_file: Path, comparison_file: Path) -> EnginePlan:
+        """
+        Choose the engine for a comparison.
+
+        Args:
+            source_file: Path to source file
+            comparison_file: Path to comparison file
+
+        Returns:
+            EnginePlan with the chosen engine, the reason and the estimates
+        """
+        source = self.estimate_file(source_file)
+        comparison = self.estimate_file(comparison_file)
+        peaks = self.estimate_peaks(source, comparison)
+        budget_mb = self.settings.max_memory_mb
+        total_rows = source.rows + comparison.rows
+
+        def make_plan(engine: str, reason: str) -> EnginePlan:
+            return EnginePlan(engine, reason, budget_mb, source, comparison, peaks)
+
+        if total_rows < self.settings.skip_chunking_threshold:
+            if peaks["vectorized"] <= budget_mb:
+                return make_plan("vectorized", f"{total_rows:,} rows fit in memory")
+            small_reason = f"{total_rows:,} rows but ~{peaks['vectorized']:,.0f} MB in memory"
+        else:
+            small_reason = f"{total_rows:,} rows"
+
+        if self.settings.get_effective_workers() > 1 and peaks["partitioned"] <= budget_mb:
+            return make_plan("partitioned", f"{small_reason}; partitions fit across workers")
+
+        if peaks["index"] <= budget_mb:
+            return make_plan("index", f"{small_reason}; source index fits in memory")
+
+        return make_plan("sort-merge", f"{small_reason}; only out-of-core sorting fits")
+
+    @staticmethod
+    def log_plan(plan: EnginePlan, engine: str):
+        """
+        Print and log the engine decision with its estimates.
+        An engine other than the planned one (set explicitly) gets a warning
+        if it is expected to exceed the budget.
+
+        Args:
+            plan: Plan computed for the inputs
+            engine: Engine that will run
+        """
+        console.print(
+            f"Data in memory: ~{plan.source.memory_mb + plan.comparison.memory_mb:,.1f} MB "
+            f"({plan.source.rows:,} + {plan.comparison.rows:,} rows, "
+            f"{max(plan.source.columns, plan.comparison.columns)} columns); "
+            f"budget {plan.budget_mb:,} MB"
+        )
+
+        if engine == plan.engine:
+            console.print(
+                f"Selected [green]{engine}[/green] engine: {plan.reason} "
+                f"(estimated peak ~{plan.peak_mb[engine]:,.1f} MB)"
+            )
+        else:
+            console.print(f"Using requested [green]{engine}[/green] engine (planner choice: {plan.engine})")
+
+            peak_mb = plan.peak_mb.get(engine)
+            if peak_mb is not None and peak_mb > plan.budget_mb:
+                console.print(
+                    f"[yellow]Warning: {engine} is estimated to need ~{peak_mb:,.0f} MB, "
+                    f"above the {plan.budget_mb:,} MB budget[/yellow]"
+                )
+
+        logger.debug(f"Engine plan: {plan.to_dict()}")
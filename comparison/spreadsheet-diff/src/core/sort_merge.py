@@ -0,0 +1,272 @@
+"""
+External sort-merge engine for comparing files larger than RAM.
+Spills key-sorted, hashed runs of each file to Arrow IPC files and
+merge-joins the two sorted streams one key group at a time.
+"""
+
+import heapq
+from dataclasses import dataclass, field
+from itertools import groupby
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import polars as pl
+from rich.console import Console
+from rich.progress import Progress, TextColumn, BarColumn, TaskProgressColumn
+
+from ..config.settings import ComparisonSettings
+from ..io.readers import FileReader
+from .hash_engine import RowHashEngine
+
+
+console = Console()
+
+
+# A key group: list of {"hash": ..., "data": row_dict} entries in file order
+KeyGroup = List[Dict[str, Any]]
+
+
+@dataclass
+class SpilledFile:
+    """Sorted runs written for one input file."""
+
+    label: str
+    runs: List[Path] = field(default_factory=list)
+    total_rows: int = 0
+
+
+class ExternalSortMerger:
+    """
+    Out-of-core comparison support using sorted runs on disk.
+
+    Each input is read in chunks sized to fit the memory budget. Every chunk
+    is hashed, sorted by a normalized string key and written to its own run
+    file. Runs are then k-way merged per file and the two files are joined on
+    the sort key, yielding matching key groups without holding either file
+    in memory.
+    """
+
+    # Internal columns added to every run
+    MERGE_KEY_COLUMN = "_merge_key"
+    ROW_NUMBER_COLUMN = "_row_nr"
+    ROW_HASH_COLUMN = "_row_hash"
+
+    # Separator between composite key parts in the merge key
+    KEY_SEPARATOR = "\x1f"
+
+    # Share of max_memory_mb a single run may use (chunk + sorted copy + hashes)
+    RUN_MEMORY_FRACTION = 0.25
+
+    # Rows materialized per run at a time while merging
+    MERGE_BATCH_ROWS = 10000
+
+    # Rows sampled to estimate the in-memory size of a row
+    SAMPLE_ROWS = 1000
+
+    def __init__(
+        self,
+        settings: ComparisonSettings,
+        reader: FileReader,
+        hash_engine: RowHashEngine,
+        temp_dir: Path
+    ):
+        """
+        Initialize external sort-merge engine.
+
+        Args:
+            settings: Comparison settings (max_memory_mb bounds run size)
+            reader: File reader used to stream input chunks
+            hash_engine: Hash engine used for row hashes
+            temp_dir: Directory for run files (caller owns cleanup)
+        """
+        self.settings = settings
+        self.reader = reader
+        self.hash_engine = hash_engine
+        self.temp_dir = temp_dir
+
+    def rows_per_run(self, filepath: Path) -> int:
+        """
+        Estimate how many rows fit in one run within the memory budget.
+
+        Args:
+            filepath: Path to input file
+
+        Returns:
+            Number of rows per run
+        """
+        sample = self.reader.read_sample(filepath, n_rows=self.SAMPLE_ROWS)
+        if len(sample) == 0:
+            return self.settings.chunk_size
+
+        bytes_per_row = max(1, sample.estimated_size() // len(sample))
+        budget_bytes = int(self.settings.max_memory_mb * 1024 * 1024 * self.RUN_MEMORY_FRACTION)
+
+        return max(self.SAMPLE_ROWS, budget_bytes // bytes_per_row)
+
+    def spill_runs(self, filepath: Path, key_columns: List[str], label: str) -> SpilledFile:
+        """
+        Read a file in budget-sized chunks and write each as a sorted run.
+        Rows with a null key part are counted but not written (same as index method).
+
+        Args:
+            filepath: Path to input file
+            key_columns: Key column names
+            label: Label for progress display and run file names
+
+        Returns:
+            SpilledFile describing the written runs
+        """
+        spilled = SpilledFile(label=label)
+        run_rows = self.rows_per_run(filepath)
+
+        with Progress(
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TaskProgressColumn(),
+            console=console,
+            transient=False,
+            disable=not self.settings.show_progress
+        ) as progress:
+
+            task = progress.add_task(f"Spilling sorted runs for {label} file...", total=self.reader.progress_total(filepath))
+
+            for chunk in self.reader.read_chunked(filepath, chunk_size=run_rows):
+                run = self._prepare_run(chunk, key_columns, spilled.total_rows)
+                spilled.total_rows += len(chunk)
+
+                if len(run) > 0:
+                    run_path = self.temp_dir / f"{label.lower()}_run_{len(spilled.runs):05d}.arrow"
+                    run.write_ipc(run_path)
+                    spilled.runs.append(run_path)
+
+                progress.update(task, advance=len(chunk))
+
+            progress.update(task, total=spilled.total_rows, completed=spilled.total_rows, description=f"{label} file spilled")
+
+        console.print(
+            f"[green]OK: Wrote {len(spilled.runs):,} sorted runs "
+            f"({spilled.total_rows:,} rows, up to {run_rows:,} rows per run) for {label} file[/green]"
+        )
+
+        return spilled
+
+    def _prepare_run(
+        self,
+        chunk: pl.DataFrame,
+        key_columns: List[str],
+        row_offset: int
+    ) -> pl.DataFrame:
+        """
+        Hash, key and sort one chunk.
+
+        Args:
+            chunk: Input chunk
+            key_columns: Key column names
+            row_offset: Position of the chunk's first row in the file
+
+        Returns:
+            Chunk with merge key, row number and row hash, sorted by merge key
+        """
+        row_hashes = self.hash_engine.hash_dataframe_rows(chunk)
+
+        merge_key = pl.concat_str(
+            [pl.col(col).cast(pl.String) for col in key_columns],
+            separator=self.KEY_SEPARATOR
+        )
+
+        return (
+            chunk
+            .with_columns(
+                merge_key.alias(self.MERGE_KEY_COLUMN),
+                pl.int_range(pl.len(), dtype=pl.UInt64).add(row_offset).alias(self.ROW_NUMBER_COLUMN),
+                row_hashes.alias(self.ROW_HASH_COLUMN)
+            )
+            .filter(pl.col(self.MERGE_KEY_COLUMN).is_not_null())
+            .sort([self.MERGE_KEY_COLUMN, self.ROW_NUMBER_COLUMN])
+        )
+
+    def _iter_run(self, run_path: Path) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate rows of a run file in small batches (memory-mapped).
+
+        Args:
+            run_path: Path to run file
+
+        Yields:
+            Row dictionaries (including internal columns)
+        """
+        run = pl.read_ipc(run_path, memory_map=True)
+
+        for offset in range(0, len(run), self.MERGE_BATCH_ROWS):
+            batch = run.slice(offset, self.MERGE_BATCH_ROWS)
+            yield from batch.iter_rows(named=True)
+
+    def iter_key_groups(self, spilled: SpilledFile) -> Iterator[Tuple[str, KeyGroup]]:
+        """
+        K-way merge a file's runs and group rows by merge key.
+        Rows within a group keep their original file order.
+
+        Args:
+            spilled: Runs written for one file
+
+        Yields:
+            Tuples of (merge_key, key group)
+        """
+        get_key = itemgetter(self.MERGE_KEY_COLUMN)
+
+        # heapq.merge is stable: equal keys come out in run order, and runs
+        # are in file order, so duplicates keep their original positions
+        merged = heapq.merge(*(self._iter_run(run) for run in spilled.runs), key=get_key)
+
+        for merge_key, rows in groupby(merged, key=get_key):
+            group = []
+            for row in rows:
+                row_hash = row.pop(self.ROW_HASH_COLUMN)
+                del row[self.MERGE_KEY_COLUMN]
+                del row[self.ROW_NUMBER_COLUMN]
+                group.append({"hash": row_hash, "data": row})
+            yield merge_key, group
+
+    def merge_join(
+        self,
+        source: SpilledFile,
+        comparison: SpilledFile
+    ) -> Iterator[Tuple[KeyGroup, KeyGroup]]:
+        """
+        Full outer merge-join of two sorted files on the merge key.
+
+        Args:
+            source: Runs written for the source file
+            comparison: Runs written for the comparison file
+
+        Yields:
+            Tuples of (source group, comparison group); one side is empty
+            when the key exists in only one file
+        """
+        source_groups = self.iter_key_groups(source)
+        comparison_groups = self.iter_key_groups(comparison)
+
+        source_item = next(source_groups, None)
+        comparison_item = next(comparison_groups, None)
+
+        while source_item is not None or comparison_item is not None:
+            if comparison_item is None or (
+                source_item is not None and source_item[0] < comparison_item[0]
+            ):
+                yield source_item[1], []
+                source_item = next(source_groups, None)
+
+            elif source_item is None or comparison_item[0] < source_item[0]:
+                yield [], comparison_item[1]
+                comparison_item = next(comparison_groups, None)
+
+            else:
+                yield source_item[1], comparison_item[1]
+                source_item = next(source_groups, None)
+                comparison_item = next(comparison_groups, None)
+
+    @staticmethod
+    def first_row(source_group: KeyGroup, comparison_group: KeyGroup) -> Optional[Dict[str, Any]]:
+        """Return the first row's data from whichever group is non-empty."""
+        group = source_group or comparison_group
+        return group[0]["data"] if group else None
@@ -2,6 +2,7 @@
 
 from .readers import FileReader
 from .writers import ResultWriter
-from .format_detector import FormatDetector
+from .format_detector import FileProbe, FormatDetector
+from .row_counter import RowCounter
 
-__all__ = ["FileReader", "ResultWriter", "FormatDetector"]
+__all__ = ["FileReader", "ResultWriter", "FormatDetector", "FileProbe", "RowCounter"]
@@ -2,30 +2,69 @@
 File format detection and metadata extraction.
 """
 
+import itertools
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import polars as pl
+import pyarrow as pa
 from rich.console import Console
 
 from ..config.settings import FileFormat
+from .row_counter import RowCounter
+from .xlsx_reader import XlsxStreamReader
 
 
 console = Console()
 
 
+@dataclass
+class FileProbe:
+    """
+    Metadata of one input file, gathered once and shared by every reader call.
+    FormatDetector.probe fills the format-level fields; FileReader.probe adds
+    the header, sample and inferred schema and caches the probe per file.
+    """
+
+    path: Path
+    file_format: str
+    size_bytes: int
+    mtime_ns: int
+    compression: Optional[str] = None  # 'gzip' / 'zstd' for compressed CSV
+    delimiter: Optional[str] = None    # CSV only
+    encoding: Optional[str] = None     # CSV only: 'utf8', or 'utf8-lossy' for invalid UTF-8
+    columns: List[str] = field(default_factory=list)
+    schema: Dict[str, pl.DataType] = field(default_factory=dict)  # Inferred from the sample
+    inferred_as_strings: bool = False  # Sample had mixed types and was read as strings
+    sample: Optional[pl.DataFrame] = None
+    row_count: Optional[int] = None    # Filled on first use (see FileReader.estimate_rows)
+    row_count_exact: bool = False
+
+    def is_current(self) -> bool:
+        """Check that the file has not changed since it was probed."""
+        stat = self.path.stat()
+        return stat.st_size == self.size_bytes and stat.st_mtime_ns == self.mtime_ns
+
+
 class FormatDetector:
     """Detect and analyze file formats for comparison."""
 
+    # Decompressed bytes read at a time when scanning compressed CSV files
+    DECOMPRESS_BLOCK_SIZE = 16 * 1024 * 1024
+
+    # Bytes read from the start of a CSV file to sniff delimiter and encoding
+    HEAD_BYTES = 64 * 1024
+
     @staticmethod
     def detect_format(filepath: Path) -> str:
         """
-        Detect file format (CSV or Excel).
+        Detect file format (CSV, Excel, Parquet or Arrow IPC).
 
         Args:
             filepath: Path to file
 
         Returns:
-            Format type: 'csv' or 'excel'
+            Format type: 'csv', 'excel', 'parquet' or 'arrow'
 
         Raises:
             ValueError: If format is not supported
@@ -36,12 +75,86 @@ class FormatDetector:
         if FileFormat.is_excel(filepath):
             return FileFormat.EXCEL
 
+        if FileFormat.is_parquet(filepath):
+            return FileFormat.PARQUET
+
+        if FileFormat.is_arrow(filepath):
+            return FileFormat.ARROW
+
         raise ValueError(
             f"Unsupported file format: {filepath.suffix}. "
-            f"Supported formats: CSV ({', '.join(FileFormat.CSV_EXTENSIONS)}) "
-            f"or Excel ({', '.join(FileFormat.EXCEL_EXTENSIONS)})"
+            f"Supported formats: {FileFormat.describe_supported()}"
+        )
+
+    @staticmethod
+    def open_decompressed(filepath: Path) -> pa.NativeFile:
+        """
+        Open a compressed CSV file as a stream of decompressed bytes.
+
+        Args:
+            filepath: Path to gzip/zstd-compressed CSV file
+
+        Returns:
+            Binary input stream (close after use)
+        """
+        return pa.input_stream(str(filepath), compression=FileFormat.get_compression(filepath))
+
+    @staticmethod
+    def probe(filepath: Path) -> FileProbe:
+        """
+        Gather format-level metadata of a file (reads at most HEAD_BYTES).
+
+        Args:
+            filepath: Path to file
+
+        Returns:
+            FileProbe without header, sample or row count
+        """
+        stat = filepath.stat()
+        probe = FileProbe(
+            path=filepath,
+            file_format=FormatDetector.detect_format(filepath),
+            size_bytes=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            compression=FileFormat.get_compression(filepath)
         )
 
+        if probe.file_format == FileFormat.CSV:
+            head = FormatDetector._read_head(filepath)
+            probe.encoding = FormatDetector._detect_encoding(head)
+            probe.delimiter = FormatDetector._sniff_delimiter(head.decode('utf-8', errors='ignore'))
+
+        return probe
+
+    @staticmethod
+    def _read_head(filepath: Path) -> bytes:
+        """Read the first HEAD_BYTES of a CSV file (decompressed if needed)."""
+        if FileFormat.get_compression(filepath):
+            with FormatDetector.open_decompressed(filepath) as stream:
+                return stream.read(FormatDetector.HEAD_BYTES)
+
+        with open(filepath, 'rb') as f:
+            return f.read(FormatDetector.HEAD_BYTES)
+
+    @staticmethod
+    def _detect_encoding(head: bytes) -> str:
+        """
+        Check whether a file head is valid UTF-8.
+
+        Args:
+            head: First bytes of the file
+
+        Returns:
+            'utf8', or 'utf8-lossy' so invalid bytes are replaced instead of failing the read
+        """
+        try:
+            head.decode('utf-8')
+        except UnicodeDecodeError as e:
+            # A multi-byte character cut off at the end of the head is still valid
+            if e.start < len(head) - 3:
+                return 'utf8-lossy'
+        return 'utf8'
+
     @staticmethod
     def get_file_info(filepath: Path) -> Dict[str, Any]:
         """
@@ -78,11 +191,24 @@ class FormatDetector:
         Returns:
             Detected delimiter character
         """
+        head = FormatDetector._read_head(filepath).decode('utf-8', errors='ignore')
+        return FormatDetector._sniff_delimiter(head, sample_size)
+
+    @staticmethod
+    def _sniff_delimiter(head: str, sample_size: int = 5) -> str:
+        """
+        Pick the delimiter that occurs a consistent number of times per line.
+
+        Args:
+            head: Start of the file as text
+            sample_size: Number of lines to sample
+
+        Returns:
+            Detected delimiter character (comma if none is consistent)
+        """
         # Common delimiters to try
         delimiters = [',', '\t', ';', '|']
-
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            sample_lines = [f.readline() for _ in range(sample_size)]
+        sample_lines = head.splitlines()[:sample_size]
 
         # Count occurrences of each delimiter
         delimiter_counts = {}
@@ -114,38 +240,37 @@ class FormatDetector:
         file_format = FormatDetector.detect_format(filepath)
 
         try:
+            if file_format == FileFormat.PARQUET:
+                # Row count from the file footer
+                return pl.scan_parquet(filepath).select(pl.len()).collect().item()
+
+            if file_format == FileFormat.ARROW:
+                return pl.scan_ipc(filepath).select(pl.len()).collect().item()
+
+            if file_format == FileFormat.CSV and FileFormat.get_compression(filepath):
+                # File size says little about compressed rows; count lines while decompressing
+                return RowCounter.count_rows(filepath)
+
             if file_format == FileFormat.CSV:
-                # For CSV, read a sample and estimate based on file size
-                delimiter = FormatDetector.detect_delimiter(filepath)
+                # Extrapolate the average size of the first rows to the file size
+                with open(filepath, 'rb') as f:
+                    lines = list(itertools.islice(f, sample_rows + 1))
+
+                if len(lines) <= sample_rows:
+                    # The whole file fit in the sample
+                    return max(0, len(lines) - 1)
+
+                header_bytes = len(lines[0])
+                bytes_per_row = sum(len(line) for line in lines[1:]) / sample_rows
 
-                # Read small sample to get average row size
-                try:
-                    sample_df = pl.read_csv(
-                        filepath,
-                        separator=delimiter,
-                        n_rows=sample_rows,
-                        infer_schema_length=100
-                    )
-                    sample_count = len(sample_df)
-                except Exception:
-                    # If Polars fails, fall back to counting lines
-                    with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                        sample_count = sum(1 for _ in zip(range(sample_rows), f))
-
-                if sample_count == 0:
-                    return 0
-
-                # Estimate based on file size
                 file_size = filepath.stat().st_size
-                bytes_per_row = file_size / sample_count
+                return max(1, int((file_size - header_bytes) / bytes_per_row))
 
-                # Rough estimate of total rows
-                estimated_rows = int(file_size / bytes_per_row)
-                return max(1, estimated_rows)
+            elif XlsxStreamReader.can_stream(filepath):
+                # Row count from the sheet's dimension element (no data is loaded)
+                return XlsxStreamReader(filepath).count_rows()
 
-            else:  # Excel
-                # For Excel, we need to actually read to get accurate count
-                # Read just the first chunk to get started
+            else:  # Other Excel formats have to be read to be counted
                 df = pl.read_excel(filepath, read_options={"n_rows": None})
                 return len(df)
 
@@ -169,7 +294,11 @@ class FormatDetector:
             file_format = FormatDetector.detect_format(filepath)
 
         try:
-            if file_format == FileFormat.CSV:
+            if file_format == FileFormat.PARQUET:
+                df = pl.DataFrame(schema=pl.read_parquet_schema(filepath))
+            elif file_format == FileFormat.ARROW:
+                df = pl.DataFrame(schema=pl.scan_ipc(filepath).collect_schema())
+            elif file_format == FileFormat.CSV:
                 delimiter = FormatDetector.detect_delimiter(filepath)
                 df = pl.read_csv(
                     filepath,
@@ -177,7 +306,9 @@ class FormatDetector:
                     n_rows=0,  # Just read headers
                     infer_schema_length=0
                 )
-            else:  # Excel
+            elif XlsxStreamReader.can_stream(filepath):
+                df = XlsxStreamReader(filepath).read_sample(0)
+            else:  # Other Excel formats
                 df = pl.read_excel(filepath, read_options={"n_rows": 0})
 
             return {
@@ -1,15 +1,20 @@
 """
 File readers with chunked processing support for large files.
-Supports both CSV and Excel formats.
+Supports CSV (plain, gzip or zstd), Excel, Parquet and Arrow IPC formats.
 """
 
+import io
 from pathlib import Path
-from typing import Iterator, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 import polars as pl
+import pyarrow as pa
+import pyarrow.parquet as pq
 from rich.console import Console
 
 from ..config.settings import FileFormat, ComparisonSettings
-from .format_detector import FormatDetector
+from .format_detector import FileProbe, FormatDetector
+from .row_counter import RowCounter
+from .xlsx_reader import XlsxStreamReader
 
 
 console = Console()
@@ -17,10 +22,17 @@ console = Console()
 
 class FileReader:
     """
-    Chunked file reader for CSV and Excel files.
+    Chunked file reader for CSV, Excel, Parquet and Arrow IPC files.
     Supports streaming for memory-efficient processing of large files.
+    Columns that are not compared are never read (see _projection).
     """
 
+    # Number of batches pulled from the batched CSV reader per call
+    CSV_BATCHES_PER_READ = 8
+
+    # Rows kept in each file's probe; smaller samples are served from it
+    PROBE_SAMPLE_ROWS = 1000
+
     def __init__(self, settings: ComparisonSettings):
         """
         Initialize file reader.
@@ -31,28 +43,87 @@ class FileReader:
         self.settings = settings
         self.format_detector = FormatDetector()
 
-    def _create_string_schema(self, filepath: Path, delimiter: str) -> dict:
+        # Key columns are always read; the comparer updates them once the key is resolved
+        self.key_columns = settings.get_key_columns()
+
+        # Probes by resolved path, so each file's metadata is gathered once
+        self._probes: Dict[Path, FileProbe] = {}
+
+    def probe(self, filepath: Path) -> FileProbe:
+        """
+        Get the cached metadata of a file, probing it on first use.
+        The probe is refreshed if the file changed since it was taken.
+
+        Args:
+            filepath: Path to file
+
+        Returns:
+            FileProbe with format, delimiter, encoding, header, sample and schema
+        """
+        cache_key = filepath.resolve()
+        probe = self._probes.get(cache_key)
+        if probe is not None and probe.is_current():
+            return probe
+
+        probe = self.format_detector.probe(filepath)
+        probe.sample, probe.inferred_as_strings = self._read_sample_rows(filepath, probe, self.PROBE_SAMPLE_ROWS)
+        probe.columns = probe.sample.columns
+        probe.schema = dict(probe.sample.schema)
+
+        self._probes[cache_key] = probe
+        return probe
+
+    def _create_string_schema(self, filepath: Path) -> dict:
         """
         Create schema with all columns as String type.
         Used as fallback when type inference fails on mixed data.
 
         Args:
             filepath: Path to CSV file
-            delimiter: CSV delimiter
 
         Returns:
             Dictionary mapping column names to pl.String type
         """
-        # Read just headers (no data, no type inference)
-        headers_df = pl.read_csv(
-            filepath,
-            separator=delimiter,
-            n_rows=0,
-            infer_schema_length=0
-        )
+        return {col: pl.String for col in self.probe(filepath).columns}
+
+    def _projection(self, filepath: Path) -> Optional[List[str]]:
+        """
+        Columns to read from a file, pushed down into every format's reader.
+        Only the compared columns (all columns if compare_columns is not set)
+        minus the excluded columns are read. Key and sort columns are always read.
+
+        Args:
+            filepath: Path to file
 
-        # Return all columns as String type
-        return {col: pl.String for col in headers_df.columns}
+        Returns:
+            Column names in file order, or None to read every column
+        """
+        exclude_columns = set(self.settings.get_exclude_columns())
+        compare_columns = set(self.settings.get_compare_columns())
+        if not exclude_columns and not compare_columns:
+            return None
+
+        keep_columns = set(self.key_columns) | set(self.settings.get_sort_columns())
+        columns = self.get_columns(filepath)
+        projected = [
+            col for col in columns
+            if col in keep_columns
+            or (col not in exclude_columns and (not compare_columns or col in compare_columns))
+        ]
+
+        return projected if len(projected) < len(columns) else None
+
+    def projected_columns(self, filepath: Path) -> List[str]:
+        """
+        Columns that are actually read from a file.
+
+        Args:
+            filepath: Path to file
+
+        Returns:
+            Column names in file order
+        """
+        return self._projection(filepath) or self.get_columns(filepath)
 
     def read_file(
         self,
@@ -70,31 +141,79 @@ class FileReader:
         Returns:
             Polars DataFrame
         """
-        file_format = self.format_detector.detect_format(filepath)
+        probe = self.probe(filepath)
+        file_format = probe.file_format
+        columns = self._projection(filepath)
 
-        if file_format == FileFormat.CSV:
-            delimiter = self.format_detector.detect_delimiter(filepath)
+        if file_format == FileFormat.PARQUET:
+            return pl.read_parquet(filepath, columns=columns)
+
+        if file_format == FileFormat.ARROW:
+            return pl.read_ipc(filepath, columns=columns, memory_map=True)
 
+        if file_format == FileFormat.CSV:
+            # Compressed files are decompressed in memory by Polars
             # Try with type inference first (fast path for clean data)
             try:
                 return pl.read_csv(
                     filepath,
-                    separator=delimiter,
+                    separator=probe.delimiter,
+                    encoding=probe.encoding,
+                    columns=columns,
                     infer_schema_length=10000,
                     null_values=self.settings.null_equivalents
                 )
             except pl.exceptions.ComputeError:
                 # Fallback: Mixed types detected, read as strings
                 console.print("[yellow]Warning: Mixed data types detected, reading all columns as strings[/yellow]")
-                schema_overrides = self._create_string_schema(filepath, delimiter)
+                schema_overrides = self._create_string_schema(filepath)
                 return pl.read_csv(
                     filepath,
-                    separator=delimiter,
+                    separator=probe.delimiter,
+                    encoding=probe.encoding,
+                    columns=columns,
                     null_values=self.settings.null_equivalents,
                     schema_overrides=schema_overrides
                 )
         else:  # Excel
-            return pl.read_excel(filepath)
+            return self._read_excel(filepath, columns)
+
+    def scan_file(self, filepath: Path) -> pl.LazyFrame:
+        """
+        Build a lazy scan of a file for query plans.
+        CSV (also compressed), Parquet and Arrow IPC files are scanned, so the
+        projection and later filters are pushed into the reader; Excel
+        workbooks cannot be scanned and are read whole.
+
+        Args:
+            filepath: Path to file
+
+        Returns:
+            LazyFrame over the projected columns
+        """
+        probe = self.probe(filepath)
+        file_format = probe.file_format
+        columns = self._projection(filepath)
+
+        if file_format == FileFormat.PARQUET:
+            scan = pl.scan_parquet(filepath)
+        elif file_format == FileFormat.ARROW:
+            scan = pl.scan_ipc(filepath, memory_map=True)
+        elif file_format == FileFormat.CSV:
+            # Mixed types seen in the probe sample are read as strings up front;
+            # later conflicts surface as a ComputeError when the plan runs
+            scan = pl.scan_csv(
+                filepath,
+                separator=probe.delimiter,
+                encoding=probe.encoding,
+                null_values=self.settings.null_equivalents,
+                infer_schema_length=10000,
+                schema_overrides=self._create_string_schema(filepath) if probe.inferred_as_strings else None
+            )
+        else:  # Excel
+            return self.read_file(filepath).lazy()
+
+        return scan.select(columns) if columns else scan
 
     def read_chunked(
         self,
@@ -114,81 +233,397 @@ class FileReader:
         if chunk_size is None:
             chunk_size = self.settings.chunk_size
 
-        file_format = self.format_detector.detect_format(filepath)
-
-        if file_format == FileFormat.CSV:
-            yield from self._read_csv_chunked(filepath, chunk_size)
+        probe = self.probe(filepath)
+        file_format = probe.file_format
+        columns = self._projection(filepath)
+
+        if file_format == FileFormat.PARQUET:
+            yield from self._read_parquet_chunked(filepath, chunk_size, columns)
+        elif file_format == FileFormat.ARROW:
+            yield from self._read_arrow_chunked(filepath, chunk_size, columns)
+        elif file_format == FileFormat.CSV and probe.compression:
+            yield from self._read_compressed_csv_chunked(filepath, chunk_size, columns)
+        elif file_format == FileFormat.CSV:
+            yield from self._read_csv_chunked(filepath, chunk_size, columns)
         else:  # Excel
-            yield from self._read_excel_chunked(filepath, chunk_size)
+            yield from self._read_excel_chunked(filepath, chunk_size, columns)
+
+    def read_rows(
+        self,
+        filepath: Path,
+        row_numbers: pl.Series,
+        row_number_column: str = "_row_nr"
+    ) -> Iterator[pl.DataFrame]:
+        """
+        Read only the given rows of a file, chunk by chunk.
+        Rows are numbered from 0 in file order (as yielded by read_chunked),
+        and reading stops after the last requested row.
 
-    def _read_csv_chunked(self, filepath: Path, chunk_size: int) -> Iterator[pl.DataFrame]:
+        Args:
+            filepath: Path to file
+            row_numbers: Row numbers to keep
+            row_number_column: Name of the row number column added to the output
+
+        Yields:
+            DataFrame chunks holding the requested rows and their row numbers
+        """
+        if len(row_numbers) == 0:
+            return
+
+        row_numbers = row_numbers.cast(pl.UInt64)
+        last_row = row_numbers.max()
+        row_offset = 0
+
+        for chunk in self.read_chunked(filepath):
+            selected = chunk.with_columns(
+                pl.int_range(pl.len(), dtype=pl.UInt64).add(row_offset).alias(row_number_column)
+            ).filter(pl.col(row_number_column).is_in(row_numbers))
+
+            if len(selected) > 0:
+                yield selected
+
+            row_offset += len(chunk)
+            if row_offset > last_row:
+                break
+
+    def _read_csv_chunked(
+        self,
+        filepath: Path,
+        chunk_size: int,
+        columns: Optional[List[str]] = None
+    ) -> Iterator[pl.DataFrame]:
         """
-        Read CSV file in chunks.
+        Read CSV file in chunks with a single streaming pass.
+        The file is parsed once by Polars' batched reader; batches are
+        regrouped into chunks of exactly chunk_size rows (last chunk may be smaller).
 
         Args:
             filepath: Path to CSV file
             chunk_size: Number of rows per chunk
+            columns: Columns to read (None = all)
 
         Yields:
             DataFrame chunks
         """
-        delimiter = self.format_detector.detect_delimiter(filepath)
+        delimiter = self.probe(filepath).delimiter
+        rows_yielded = 0
 
-        # Try with type inference first (fast path for clean data)
         try:
-            lazy_df = pl.scan_csv(
-                filepath,
-                separator=delimiter,
-                null_values=self.settings.null_equivalents,
-                infer_schema_length=10000
-            )
-        except pl.exceptions.ComputeError:
-            # Fallback: Mixed types detected, read as strings
-            console.print("[yellow]Warning: Mixed data types detected, reading all columns as strings[/yellow]")
-            schema_overrides = self._create_string_schema(filepath, delimiter)
-            lazy_df = pl.scan_csv(
-                filepath,
-                separator=delimiter,
-                null_values=self.settings.null_equivalents,
-                schema_overrides=schema_overrides
-            )
+            # Try with type inference first (fast path for clean data)
+            try:
+                for chunk in self._iter_csv_batches(
+                    filepath,
+                    delimiter,
+                    chunk_size,
+                    columns=columns,
+                    infer_schema_length=10000
+                ):
+                    yield chunk
+                    rows_yielded += len(chunk)
 
-        # Process in chunks
-        try:
-            offset = 0
+            except pl.exceptions.ComputeError:
+                # Fallback: Mixed types detected, read the rest as strings.
+                # Rows already yielded are skipped so nothing is read twice.
+                console.print("[yellow]Warning: Mixed data types detected, reading all columns as strings[/yellow]")
+                schema_overrides = self._create_string_schema(filepath)
+                yield from self._iter_csv_batches(
+                    filepath,
+                    delimiter,
+                    chunk_size,
+                    columns=columns,
+                    schema_overrides=schema_overrides,
+                    skip_rows_after_header=rows_yielded
+                )
+
+        except Exception as e:
+            console.print(f"[red]Error reading CSV file {filepath}: {e}[/red]")
+            raise
+
+    def _iter_csv_batches(
+        self,
+        filepath: Path,
+        delimiter: str,
+        chunk_size: int,
+        **read_options
+    ) -> Iterator[pl.DataFrame]:
+        """
+        Stream a CSV file with Polars' batched reader and regroup batches into chunks.
+
+        Args:
+            filepath: Path to CSV file
+            delimiter: CSV delimiter
+            chunk_size: Number of rows per yielded chunk
+            **read_options: Extra options for pl.read_csv_batched
+
+        Yields:
+            DataFrame chunks of chunk_size rows
+        """
+        reader = pl.read_csv_batched(
+            filepath,
+            separator=delimiter,
+            encoding=self.probe(filepath).encoding,
+            null_values=self.settings.null_equivalents,
+            batch_size=chunk_size,
+            **read_options
+        )
+
+        def batches() -> Iterator[pl.DataFrame]:
             while True:
-                chunk = lazy_df.slice(offset, chunk_size).collect()
+                next_batches = reader.next_batches(self.CSV_BATCHES_PER_READ)
+                if not next_batches:
+                    return
+                yield from next_batches
 
-                if len(chunk) == 0:
-                    break
+        yield from self._rechunk(batches(), chunk_size)
 
-                yield chunk
-                offset += chunk_size
+    @staticmethod
+    def _rechunk(batches: Iterable[pl.DataFrame], chunk_size: int) -> Iterator[pl.DataFrame]:
+        """
+        Regroup batches of any size into chunks of exactly chunk_size rows.
 
-                if len(chunk) < chunk_size:
-                    # Last chunk
-                    break
+        Args:
+            batches: DataFrame batches in file order
+            chunk_size: Number of rows per yielded chunk
+
+        Yields:
+            DataFrame chunks (last chunk may be smaller)
+        """
+        buffer = []
+        buffered_rows = 0
 
+        for batch in batches:
+            buffer.append(batch)
+            buffered_rows += len(batch)
+
+            # Emit full chunks; keep the remainder for the next round
+            while buffered_rows >= chunk_size:
+                combined = pl.concat(buffer, how="vertical_relaxed")
+                yield combined.slice(0, chunk_size)
+
+                remainder = combined.slice(chunk_size)
+                buffer = [remainder] if len(remainder) > 0 else []
+                buffered_rows = len(remainder)
+
+        if buffered_rows > 0:
+            yield pl.concat(buffer, how="vertical_relaxed")
+
+    def _read_compressed_csv_chunked(
+        self,
+        filepath: Path,
+        chunk_size: int,
+        columns: Optional[List[str]] = None
+    ) -> Iterator[pl.DataFrame]:
+        """
+        Read a gzip/zstd-compressed CSV file in chunks while decompressing it.
+        The decompressed stream is cut into blocks of whole lines (never inside
+        a quoted field) that are parsed with the file's header. Dtypes are
+        inferred from the first block and kept for the rest; after a block
+        that does not fit them, the remaining blocks are read as strings.
+
+        Args:
+            filepath: Path to compressed CSV file
+            chunk_size: Number of rows per chunk
+            columns: Columns to read (None = all)
+
+        Yields:
+            DataFrame chunks
+        """
+        probe = self.probe(filepath)
+
+        def parse(header: bytes, block: bytes, **read_options) -> pl.DataFrame:
+            return pl.read_csv(
+                io.BytesIO(header + block),
+                separator=probe.delimiter,
+                encoding=probe.encoding,
+                columns=columns,
+                null_values=self.settings.null_equivalents,
+                **read_options
+            )
+
+        def batches() -> Iterator[pl.DataFrame]:
+            header = None
+            schema = None  # dtypes inferred from the first block
+            as_strings = False
+
+            for block in self._iter_line_blocks(filepath):
+                if header is None:
+                    header_end, _, _ = self._line_ends(block, False)
+                    if header_end < 0:
+                        return  # Header only
+                    header, block = block[:header_end + 1], block[header_end + 1:]
+                if not block.strip():
+                    continue
+
+                if as_strings:
+                    yield parse(header, block, infer_schema_length=0)
+                    continue
+
+                try:
+                    if schema is None:
+                        batch = parse(header, block, infer_schema_length=10000)
+                        schema = batch.schema
+                    else:
+                        batch = parse(header, block, schema_overrides=schema)
+                except pl.exceptions.ComputeError:
+                    # Fallback: Mixed types detected, read the rest as strings
+                    console.print("[yellow]Warning: Mixed data types detected, reading all columns as strings[/yellow]")
+                    as_strings = True
+                    batch = parse(header, block, infer_schema_length=0)
+
+                yield batch
+
+        try:
+            yield from self._rechunk(batches(), chunk_size)
         except Exception as e:
             console.print(f"[red]Error reading CSV file {filepath}: {e}[/red]")
             raise
 
-    def _read_excel_chunked(self, filepath: Path, chunk_size: int) -> Iterator[pl.DataFrame]:
+    def _iter_line_blocks(self, filepath: Path) -> Iterator[bytes]:
+        """
+        Decompress a file into blocks that end on a line break outside quotes.
+        Each decompressed block is scanned once; the quote state is carried
+        over to the next block.
+
+        Args:
+            filepath: Path to compressed CSV file
+
+        Yields:
+            Blocks of decompressed bytes
+        """
+        carry = b""
+        in_quotes = False  # Quote state at the end of carry
+
+        with self.format_detector.open_decompressed(filepath) as stream:
+            while True:
+                data = stream.read(self.format_detector.DECOMPRESS_BLOCK_SIZE)
+                if not data:
+                    break
+
+                _, cut, in_quotes = self._line_ends(data, in_quotes)
+                if cut < 0:
+                    carry += data
+                    continue
+
+                buffer = carry + data
+                cut += len(carry)
+                carry = buffer[cut + 1:]
+                yield buffer[:cut + 1]
+
+        if carry:
+            yield carry
+
+    @staticmethod
+    def _line_ends(block: bytes, in_quotes: bool) -> Tuple[int, int, bool]:
+        """
+        Find the first and last line breaks outside quoted fields in one pass.
+
+        Args:
+            block: Bytes to scan
+            in_quotes: Whether the block starts inside a quoted field
+
+        Returns:
+            Tuple of (first line break, last line break, whether the block ends
+            inside quotes); line breaks are -1 if there is none
+        """
+        if b'"' not in block:
+            if in_quotes:
+                return -1, -1, True
+            return block.find(b"\n"), block.rfind(b"\n"), False
+
+        # Segments between quote characters alternate between outside and inside a
+        # quoted field; an escaped quote ("") adds an empty segment and keeps the state
+        segments = block.split(b'"')
+        first = last = -1
+        offset = 0
+        for index, segment in enumerate(segments):
+            if index % 2 == in_quotes:
+                line_break = segment.rfind(b"\n")
+                if line_break >= 0:
+                    if first < 0:
+                        first = offset + segment.find(b"\n")
+                    last = offset + line_break
+            offset += len(segment) + 1
+
+        return first, last, in_quotes ^ (len(segments) % 2 == 0)
+
+    def _read_parquet_chunked(
+        self,
+        filepath: Path,
+        chunk_size: int,
+        columns: Optional[List[str]] = None
+    ) -> Iterator[pl.DataFrame]:
+        """
+        Stream a Parquet file row group by row group, reading only the projected columns.
+
+        Args:
+            filepath: Path to Parquet file
+            chunk_size: Number of rows per chunk
+            columns: Columns to read (None = all)
+
+        Yields:
+            DataFrame chunks
+        """
+        parquet_file = pq.ParquetFile(filepath)
+        try:
+            batches = parquet_file.iter_batches(batch_size=chunk_size, columns=columns)
+            yield from self._rechunk((pl.from_arrow(batch) for batch in batches), chunk_size)
+        finally:
+            parquet_file.close()
+
+    def _read_arrow_chunked(
+        self,
+        filepath: Path,
+        chunk_size: int,
+        columns: Optional[List[str]] = None
+    ) -> Iterator[pl.DataFrame]:
+        """
+        Stream an Arrow IPC (Feather v2) file record batch by record batch.
+        The file is memory-mapped, so uncompressed batches are not copied.
+
+        Args:
+            filepath: Path to Arrow IPC file
+            chunk_size: Number of rows per chunk
+            columns: Columns to read (None = all)
+
+        Yields:
+            DataFrame chunks
+        """
+        with pa.memory_map(str(filepath)) as source:
+            reader = pa.ipc.open_file(source)
+
+            def batches() -> Iterator[pl.DataFrame]:
+                for i in range(reader.num_record_batches):
+                    batch = reader.get_batch(i)
+                    yield pl.from_arrow(batch.select(columns) if columns else batch)
+
+            yield from self._rechunk(batches(), chunk_size)
+
+    def _read_excel_chunked(
+        self,
+        filepath: Path,
+        chunk_size: int,
+        columns: Optional[List[str]] = None
+    ) -> Iterator[pl.DataFrame]:
         """
         Read Excel file in chunks.
-        Note: Excel reading is less memory-efficient than CSV.
+        XLSX/XLSM worksheets are streamed with bounded memory; legacy .xls and
+        .xlsb workbooks are loaded whole and sliced.
 
         Args:
             filepath: Path to Excel file
             chunk_size: Number of rows per chunk
+            columns: Columns to read (None = all)
 
         Yields:
             DataFrame chunks
         """
         try:
-            # For Excel, we have to read the whole file first
-            # Then chunk it in memory
-            df = pl.read_excel(filepath)
+            if XlsxStreamReader.can_stream(filepath):
+                yield from XlsxStreamReader(filepath).iter_chunks(chunk_size, columns=columns)
+                return
+
+            # Other Excel formats have to be read whole, then chunked in memory
+            df = self._read_excel(filepath, columns)
 
             total_rows = len(df)
             for start_idx in range(0, total_rows, chunk_size):
@@ -199,6 +634,25 @@ class FileReader:
             console.print(f"[red]Error reading Excel file {filepath}: {e}[/red]")
             raise
 
+    def _read_excel(self, filepath: Path, columns: Optional[List[str]] = None) -> pl.DataFrame:
+        """
+        Read a whole Excel workbook.
+        XLSX/XLSM go through the same stream reader as the chunked path so
+        every engine sees identical values; other formats infer dtypes from
+        all rows, as a short inference window would null out later cells
+        that do not fit the inferred type.
+
+        Args:
+            filepath: Path to Excel file
+            columns: Columns to read (None = all)
+
+        Returns:
+            DataFrame with every data row
+        """
+        if XlsxStreamReader.can_stream(filepath):
+            return XlsxStreamReader(filepath).read_all(self.settings.chunk_size, columns=columns)
+        return pl.read_excel(filepath, columns=columns, infer_schema_length=None)
+
     def get_columns(self, filepath: Path) -> list[str]:
         """
         Get column names from file without reading all data.
@@ -209,36 +663,51 @@ class FileReader:
         Returns:
             List of column names
         """
-        file_format = self.format_detector.detect_format(filepath)
+        return list(self.probe(filepath).columns)
 
-        if file_format == FileFormat.CSV:
-            delimiter = self.format_detector.detect_delimiter(filepath)
-            df = pl.read_csv(
-                filepath,
-                separator=delimiter,
-                n_rows=0,  # Just headers
-                infer_schema_length=0
-            )
-        else:  # Excel
-            df = pl.read_excel(filepath, read_options={"n_rows": 0})
+    def estimate_rows(self, filepath: Path) -> int:
+        """
+        Count or estimate the rows of a file (computed once per file).
+        CSV files are counted exactly unless row_count_mode is 'estimate'.
 
-        return df.columns
+        Args:
+            filepath: Path to file
 
-    def estimate_rows(self, filepath: Path) -> int:
+        Returns:
+            Row count (estimated for Excel, and for CSV in estimate mode)
+        """
+        probe = self.probe(filepath)
+        if probe.row_count is not None:
+            return probe.row_count
+
+        mode = self.settings.row_count_mode
+        if probe.file_format == FileFormat.CSV and mode != "estimate":
+            probe.row_count = RowCounter.count_rows(filepath, quote_aware=mode == "quoted")
+            probe.row_count_exact = True
+        else:
+            probe.row_count = self.format_detector.estimate_row_count(filepath)
+            # Parquet and Arrow IPC files store their row count
+            probe.row_count_exact = probe.file_format in (FileFormat.PARQUET, FileFormat.ARROW)
+
+        return probe.row_count
+
+    def progress_total(self, filepath: Path) -> Optional[int]:
         """
-        Estimate number of rows in file.
+        Row count to use as a progress bar total.
 
         Args:
             filepath: Path to file
 
         Returns:
-            Estimated row count
+            Exact row count, or None if only an estimate is available
         """
-        return self.format_detector.estimate_row_count(filepath)
+        rows = self.estimate_rows(filepath)
+        return rows if self.probe(filepath).row_count_exact else None
 
     def read_sample(self, filepath: Path, n_rows: int = 100) -> pl.DataFrame:
         """
         Read a sample of rows from file.
+        Samples up to PROBE_SAMPLE_ROWS rows are served from the file's probe.
 
         Args:
             filepath: Path to file
@@ -247,30 +716,66 @@ class FileReader:
         Returns:
             DataFrame with sample rows
         """
-        file_format = self.format_detector.detect_format(filepath)
+        probe = self.probe(filepath)
+        if n_rows <= self.PROBE_SAMPLE_ROWS:
+            return probe.sample.head(n_rows)
+
+        sample, _ = self._read_sample_rows(filepath, probe, n_rows)
+        return sample
+
+    def _read_sample_rows(self, filepath: Path, probe: FileProbe, n_rows: int) -> Tuple[pl.DataFrame, bool]:
+        """
+        Read the first rows of a file.
+
+        Args:
+            filepath: Path to file
+            probe: Format-level metadata of the file
+            n_rows: Number of rows to read
+
+        Returns:
+            Tuple of (sample rows, whether mixed types forced all columns to strings)
+        """
+        file_format = probe.file_format
+
+        if file_format == FileFormat.PARQUET:
+            return pl.read_parquet(filepath, n_rows=n_rows), False
+
+        if file_format == FileFormat.ARROW:
+            return pl.read_ipc(filepath, n_rows=n_rows, memory_map=True), False
 
         if file_format == FileFormat.CSV:
-            delimiter = self.format_detector.detect_delimiter(filepath)
+            if probe.compression:
+                # Parse only the first decompressed block
+                source = io.BytesIO(next(self._iter_line_blocks(filepath), b""))
+            else:
+                source = filepath
 
             # Try with type inference first (fast path for clean data)
             try:
                 return pl.read_csv(
-                    filepath,
-                    separator=delimiter,
+                    source,
+                    separator=probe.delimiter,
+                    encoding=probe.encoding,
                     n_rows=n_rows,
                     null_values=self.settings.null_equivalents,
                     infer_schema_length=10000
-                )
+                ), False
             except pl.exceptions.ComputeError:
                 # Fallback: Mixed types detected, read as strings
                 console.print("[yellow]Warning: Mixed data types detected, reading all columns as strings[/yellow]")
-                schema_overrides = self._create_string_schema(filepath, delimiter)
+                if isinstance(source, io.BytesIO):
+                    source.seek(0)
                 return pl.read_csv(
-                    filepath,
-                    separator=delimiter,
+                    source,
+                    separator=probe.delimiter,
+                    encoding=probe.encoding,
                     n_rows=n_rows,
                     null_values=self.settings.null_equivalents,
-                    schema_overrides=schema_overrides
-                )
-        else:  # Excel
-            return pl.read_excel(filepath, read_options={"n_rows": n_rows})
+                    infer_schema_length=0
+                ), True
+
+        if XlsxStreamReader.can_stream(filepath):
+            return XlsxStreamReader(filepath).read_sample(n_rows), False
+
+        # Other Excel formats
+        return pl.read_excel(filepath, read_options={"n_rows": n_rows}, infer_schema_length=None), False
@@ -1,21 +1,297 @@
 """
 Output writers for comparison results.
-Supports CSV, Excel, and HTML formats.
+Supports CSV, Excel, HTML, Parquet and Arrow IPC formats.
 """
 
+import base64
+import gzip
+import json
+import multiprocessing
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from contextlib import nullcontext
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, List
+from typing import Any, Callable, Dict, Iterator, Optional, List, Tuple, Union
 from dataclasses import dataclass
 import polars as pl
+import xlsxwriter
 from rich.console import Console
 
 from ..config.settings import ComparisonSettings, FileFormat
+from ..utils.performance import PerformanceMonitor
 
 
 console = Console()
 
 
+# Shared stylesheet of the HTML reports
+REPORT_CSS = """\
+        body {
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            margin: 0;
+            padding: 20px;
+            background: #f5f5f5;
+        }
+        .container {
+            max-width: 1600px;
+            margin: 0 auto;
+            background: white;
+            padding: 30px;
+            border-radius: 8px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }
+        h1 {
+            color: #333;
+            margin-bottom: 10px;
+        }
+        .info {
+            color: #666;
+            margin-bottom: 20px;
+            font-size: 14px;
+        }
+        .stats {
+            display: flex;
+            gap: 20px;
+            margin-bottom: 30px;
+        }
+        .stat-box {
+            flex: 1;
+            padding: 20px;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            border-radius: 8px;
+            text-align: center;
+        }
+        .stat-number {
+            font-size: 36px;
+            font-weight: bold;
+            margin-bottom: 5px;
+        }
+        .stat-label {
+            font-size: 14px;
+            opacity: 0.9;
+        }
+        .warning-box {
+            padding: 15px;
+            background: #fff3cd;
+            border: 1px solid #ffc107;
+            border-radius: 4px;
+            margin-bottom: 20px;
+            color: #856404;
+        }
+        table.dataTable {
+            width: 100% !important;
+        }
+        table.dataTable thead th {
+            background: #2c3e50;
+            color: white;
+            padding: 12px;
+            text-align: left;
+            font-weight: 600;
+        }
+        table.dataTable tbody td {
+            padding: 10px;
+            border-bottom: 1px solid #eee;
+        }
+        .dataTables_wrapper {
+            padding: 20px 0;
+        }
+        .dataTables_filter {
+            margin-bottom: 20px;
+        }
+        .dataTables_length {
+            margin-bottom: 20px;
+        }
+
+        /* SearchPanes styling */
+        .dtsp-searchPanes {
+            margin-bottom: 20px;
+        }
+        .dtsp-searchPane {
+            background: white;
+            border: 1px solid #e0e0e0;
+            border-radius: 4px;
+            box-shadow: 0 1px 3px rgba(0,0,0,0.05);
+        }
+        .dtsp-title {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            padding: 8px 12px;
+            font-weight: 600;
+            border-radius: 4px 4px 0 0;
+        }
+        .dtsp-topRow {
+            background: #f8f9fa;
+            padding: 8px;
+            border-bottom: 1px solid #e0e0e0;
+        }
+        .dtsp-searchCont input {
+            border: 1px solid #ced4da;
+            border-radius: 4px;
+            padding: 8px 12px;
+            width: 100%;
+            font-size: 13px;
+            transition: all 0.2s ease;
+            background: white;
+        }
+        .dtsp-searchCont input:focus {
+            outline: none;
+            border-color: #667eea;
+            box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1);
+        }
+        .dtsp-searchCont input::placeholder {
+            color: #a0a0a0;
+            font-style: italic;
+            opacity: 0.8;
+        }
+        .dtsp-selected {
+            background: #e3f2fd !important;
+            border-left: 3px solid #667eea !important;
+        }
+
+        /* Filters Active Counter */
+        .dtsp-panesContainer {
+            margin-bottom: 25px;
+        }
+        div.dtsp-panesContainer div.dtsp-title {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            padding: 10px 16px;
+            font-size: 15px;
+            font-weight: 600;
+            border-radius: 6px;
+            box-shadow: 0 2px 4px rgba(102, 126, 234, 0.2);
+            margin-bottom: 15px;
+            display: inline-block;
+            min-width: 180px;
+            text-align: center;
+        }
+        div.dtsp-panesContainer button.dtsp-clearAll {
+            background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
+            color: white;
+            border: none;
+            padding: 8px 16px;
+            border-radius: 4px;
+            font-weight: 500;
+            cursor: pointer;
+            transition: all 0.2s ease;
+            box-shadow: 0 2px 4px rgba(245, 87, 108, 0.2);
+        }
+        div.dtsp-panesContainer button.dtsp-clearAll:hover {
+            transform: translateY(-1px);
+            box-shadow: 0 4px 8px rgba(245, 87, 108, 0.3);
+        }
+        div.dtsp-panesContainer button.dtsp-clearAll:active {
+            transform: translateY(0);
+        }
+        .help-text {
+            background: #f0f7ff;
+            border-left: 4px solid #667eea;
+            padding: 12px 15px;
+            margin-bottom: 20px;
+            color: #1a1a1a;
+            border-radius: 4px;
+        }
+
+        /* Pagination styling - add moderate spacing to prevent wrapping */
+        .dataTables_paginate {
+            padding-right: 15px !important;
+            padding-left: 10px !important;
+            margin-top: 20px !important;
+        }
+        .dataTables_paginate .paginate_button {
+            margin: 0 5px !important;
+            padding: 8px 12px !important;
+        }
+        .dataTables_paginate .paginate_button.current {
+            margin: 0 5px !important;
+        }
+        .dataTables_paginate .paginate_button.previous,
+        .dataTables_paginate .paginate_button.next {
+            margin: 0 8px !important;
+        }
+        .dataTables_info {
+            padding-left: 10px !important;
+        }
+"""
+
+
+# Extra styles of the paged HTML report's filter panes
+PAGED_REPORT_CSS = """\
+        .filter-panes {
+            display: flex;
+            flex-wrap: wrap;
+            gap: 20px;
+            align-items: flex-start;
+            margin-bottom: 20px;
+        }
+        .filter-pane {
+            flex: 1;
+            min-width: 220px;
+            background: white;
+            border: 1px solid #e0e0e0;
+            border-radius: 4px;
+            box-shadow: 0 1px 3px rgba(0,0,0,0.05);
+        }
+        .filter-title {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            padding: 8px 12px;
+            font-weight: 600;
+            border-radius: 4px 4px 0 0;
+        }
+        .filter-values {
+            list-style: none;
+            margin: 0;
+            padding: 0;
+            max-height: 240px;
+            overflow-y: auto;
+        }
+        .filter-values li {
+            display: flex;
+            justify-content: space-between;
+            gap: 10px;
+            padding: 6px 12px;
+            border-bottom: 1px solid #f0f0f0;
+            cursor: pointer;
+            font-size: 13px;
+        }
+        .filter-values li:hover {
+            background: #f8f9fa;
+        }
+        .filter-values li.selected {
+            background: #e3f2fd;
+            border-left: 3px solid #667eea;
+        }
+        .filter-count {
+            color: #666;
+            background: #eef0f8;
+            border-radius: 10px;
+            padding: 0 8px;
+        }
+        .filter-note {
+            padding: 6px 12px;
+            color: #888;
+            font-size: 12px;
+            font-style: italic;
+        }
+        .filter-clear {
+            background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
+            color: white;
+            border: none;
+            padding: 8px 16px;
+            border-radius: 4px;
+            font-weight: 500;
+            cursor: pointer;
+        }
+        .load-status {
+            color: #666;
+            font-size: 13px;
+            margin-bottom: 10px;
+        }
+"""
+
+
 @dataclass
 class SearchPanesConfig:
     """
@@ -176,6 +452,41 @@ class ResultWriter:
     Write comparison results to various output formats.
     """
 
+    # Codecs supported by Arrow IPC output
+    IPC_COMPRESSIONS = {"zstd", "lz4", "uncompressed"}
+
+    # Differences from which Excel is written in its own process alongside other writers
+    PARALLEL_EXCEL_MIN_ROWS = 100000
+
+    # Differences embedded in an inline HTML report (auto mode pages beyond this)
+    HTML_INLINE_MAX_ROWS = 50000
+
+    # Differences per data chunk of a paged HTML report
+    HTML_CHUNK_ROWS = 50000
+
+    # Most frequent values listed per filter pane of a paged HTML report
+    HTML_FILTER_VALUES = 1000
+
+    # Values are written as-is: no formulas, hyperlinks or NaN errors
+    EXCEL_WORKBOOK_OPTIONS = {
+        "constant_memory": True,
+        "strings_to_formulas": False,
+        "strings_to_urls": False,
+        "nan_inf_to_errors": True,
+        "remove_timezone": True
+    }
+
+    # Difference rows per worksheet (the header takes one sheet row)
+    EXCEL_SHEET_ROWS = FileFormat.EXCEL_MAX_ROWS - 1
+
+    # Rows sampled to size Excel columns, and the widest column in characters
+    EXCEL_WIDTH_SAMPLE_ROWS = 1000
+    EXCEL_MAX_COLUMN_WIDTH = 60
+
+    # Fill colors of the source and comparison value columns
+    EXCEL_SOURCE_FILL = "#FFCDD2"
+    EXCEL_COMPARISON_FILL = "#C8E6C9"
+
     def __init__(self, settings: ComparisonSettings):
         """
         Initialize result writer.
@@ -189,138 +500,680 @@ class ResultWriter:
 
     def write_differences(
         self,
-        differences: pl.DataFrame,
+        differences: Union[pl.DataFrame, pl.LazyFrame],
         source_file: str,
         comparison_file: str,
-        summary_stats: Optional[dict] = None
+        summary_stats: Optional[dict] = None,
+        comparison_summary: Optional[Dict[str, Any]] = None,
+        monitor: Optional[PerformanceMonitor] = None,
+        key_dtypes: Optional[Dict[str, pl.DataType]] = None
     ) -> List[Path]:
         """
         Write comparison differences to output files.
 
+        With parallel_writers and more than one worker, the output formats are
+        written concurrently: CSV and HTML in threads, and Excel (whose writer
+        holds the GIL) in its own process once there are PARALLEL_EXCEL_MIN_ROWS
+        differences.
+
         Args:
-            differences: DataFrame containing differences
+            differences: DataFrame containing differences, or a LazyFrame
+                (e.g. over spilled differences) that is streamed where possible
             source_file: Name of source file
             comparison_file: Name of comparison file
             summary_stats: Optional summary statistics
+            comparison_summary: Optional ComparisonSummary.to_dict(), written
+                to the Excel summary sheet
+            monitor: Optional monitor recording a write span per output format
+            key_dtypes: Original data types of the key columns, restored in
+                Parquet and Arrow output (keys are tracked as text)
 
         Returns:
             List of output file paths
         """
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_files = []
+        total_rows = self._row_count(differences)
+        writers: List[Tuple[str, Callable[[], List[Path]]]] = []
 
         if self.settings.output_format in ["csv", "both"]:
-            csv_file = self._write_csv(differences, timestamp)
-            output_files.append(csv_file)
+            writers.append(("csv", lambda: [self._write_csv(differences, timestamp)]))
 
         if self.settings.output_format in ["excel", "both"]:
-            excel_file = self._write_excel(differences, timestamp)
-            output_files.append(excel_file)
+            summary_rows = self._excel_summary_rows(source_file, comparison_file, comparison_summary)
+            writers.append(("excel", lambda: self._write_excel(differences, timestamp, summary_rows)))
+
+        if self.settings.output_format in ["parquet", "arrow"]:
+            writers.append((self.settings.output_format, lambda: [self._write_typed(
+                differences,
+                timestamp,
+                key_dtypes or {}
+            )]))
 
         if self.settings.generate_html_report:
-            html_file = self._write_html_report(
+            writers.append(("html", lambda: [self._write_html_report(
                 differences,
                 source_file,
                 comparison_file,
                 timestamp,
                 summary_stats
-            )
-            output_files.append(html_file)
+            )]))
 
-        return output_files
+        parallel = (
+            self.settings.parallel_writers
+            and len(writers) > 1
+            and self.settings.get_effective_workers() > 1
+        )
+        if parallel and total_rows >= self.PARALLEL_EXCEL_MIN_ROWS:
+            writers = [
+                (name, lambda: self._write_excel_in_process(differences, timestamp, summary_rows))
+                if name == "excel" else (name, write)
+                for name, write in writers
+            ]
+
+        return self._run_writers(writers, parallel, total_rows, monitor)
+
+    def _run_writers(
+        self,
+        writers: List[Tuple[str, Callable[[], List[Path]]]],
+        parallel: bool,
+        total_rows: int,
+        monitor: Optional[PerformanceMonitor]
+    ) -> List[Path]:
+        """
+        Run output writers, one thread each when parallel.
+
+        Args:
+            writers: (format name, write function) pairs
+            parallel: Run the writers concurrently
+            total_rows: Number of differences (recorded on the spans)
+            monitor: Optional monitor recording a write span per writer
+
+        Returns:
+            Output file paths, in writer order
+        """
+        parent = monitor.current_span() if monitor else None
+
+        def run(name: str, write: Callable[[], List[Path]]) -> List[Path]:
+            with monitor.span("write", parent=parent, format=name) if monitor else nullcontext() as span:
+                files = write()
+                if span is not None:
+                    span.update_rows(total_rows)
+                    span.add_bytes(sum(file.stat().st_size for file in files if file.exists()))
+            return files
+
+        if parallel:
+            with ThreadPoolExecutor(max_workers=len(writers), thread_name_prefix="writer") as executor:
+                futures = [executor.submit(run, name, write) for name, write in writers]
+                results = [future.result() for future in futures]
+        else:
+            results = [run(name, write) for name, write in writers]
+
+        return [file for files in results for file in files]
+
+    def _write_excel_in_process(
+        self,
+        df: Union[pl.DataFrame, pl.LazyFrame],
+        timestamp: str,
+        summary_rows: List[Tuple[str, Any]]
+    ) -> List[Path]:
+        """
+        Run _write_excel in a separate process, so the other writers keep the GIL.
+        A LazyFrame over spilled differences is sent as its query plan.
+        """
+        # spawn: forked Polars thread pools can deadlock
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+            return executor.submit(
+                _write_excel_process,
+                self.settings.model_dump(),
+                df,
+                timestamp,
+                summary_rows
+            ).result()
+
+    @staticmethod
+    def _head(df: Union[pl.DataFrame, pl.LazyFrame], max_rows: int) -> Tuple[pl.DataFrame, int]:
+        """
+        Materialize at most max_rows differences.
+
+        Args:
+            df: Differences (DataFrame or LazyFrame)
+            max_rows: Maximum rows to load
+
+        Returns:
+            Tuple of (first max_rows rows, total row count)
+        """
+        if isinstance(df, pl.DataFrame):
+            return df.head(max_rows), len(df)
 
-    def _write_csv(self, df: pl.DataFrame, timestamp: str) -> Path:
+        return df.head(max_rows).collect(), ResultWriter._row_count(df)
+
+    @staticmethod
+    def _row_count(df: Union[pl.DataFrame, pl.LazyFrame]) -> int:
+        """Count differences without materializing them."""
+        if isinstance(df, pl.DataFrame):
+            return len(df)
+        return df.select(pl.len()).collect().item()
+
+    @staticmethod
+    def _iter_chunks(df: Union[pl.DataFrame, pl.LazyFrame], chunk_rows: int) -> Iterator[pl.DataFrame]:
+        """
+        Materialize differences chunk by chunk.
+
+        Args:
+            df: Differences (DataFrame or LazyFrame)
+            chunk_rows: Rows per chunk
+
+        Yields:
+            DataFrame chunks of chunk_rows rows (last chunk may be smaller)
+        """
+        if isinstance(df, pl.DataFrame):
+            yield from df.iter_slices(chunk_rows)
+            return
+
+        # Slices are pushed down into the spill file scan
+        offset = 0
+        while True:
+            chunk = df.slice(offset, chunk_rows).collect()
+            if chunk.is_empty():
+                return
+            yield chunk
+            offset += len(chunk)
+
+    def _write_csv(self, df: Union[pl.DataFrame, pl.LazyFrame], timestamp: str) -> Path:
         """Write differences to CSV file."""
         output_file = self.output_dir / f"differences_{timestamp}.csv"
 
-        df.write_csv(output_file)
+        if isinstance(df, pl.LazyFrame):
+            df.sink_csv(output_file)
+        else:
+            df.write_csv(output_file)
 
         console.print(f"[green]CSV saved:[/green] {output_file}")
         return output_file
 
-    def _write_excel(self, df: pl.DataFrame, timestamp: str) -> Path:
-        """Write differences to Excel file with formatting."""
-        output_file = self.output_dir / f"differences_{timestamp}.xlsx"
+    def _write_typed(
+        self,
+        df: Union[pl.DataFrame, pl.LazyFrame],
+        timestamp: str,
+        key_dtypes: Dict[str, pl.DataType]
+    ) -> Path:
+        """
+        Write differences to a Parquet or Arrow IPC file with a typed schema.
+        The file is written by a streaming sink straight from the differences
+        (plans the streaming engine cannot run are collected first).
+
+        Args:
+            df: Differences (DataFrame or LazyFrame)
+            timestamp: Timestamp for output file names
+            key_dtypes: Original data types of the key columns
+
+        Returns:
+            Path of the written file
+        """
+        output_format = self.settings.output_format
+        compression = self.settings.output_compression
+        typed = self._typed_differences(df.lazy(), key_dtypes)
+
+        if output_format == "parquet":
+            output_file = self.output_dir / f"differences_{timestamp}.parquet"
+            options = {"compression": compression}
+        else:
+            if compression not in self.IPC_COMPRESSIONS:
+                console.print(
+                    f"[yellow]Warning: Arrow IPC does not support {compression} compression, "
+                    f"using zstd[/yellow]"
+                )
+                compression = "zstd"
+            output_file = self.output_dir / f"differences_{timestamp}.arrow"
+            options = {"compression": None if compression == "uncompressed" else compression}
+
+        try:
+            if output_format == "parquet":
+                typed.sink_parquet(output_file, **options)
+            else:
+                typed.sink_ipc(output_file, **options)
+        except pl.exceptions.InvalidOperationError:
+            # Some key parsing expressions cannot run in the streaming engine
+            frame = typed.collect()
+            if output_format == "parquet":
+                frame.write_parquet(output_file, **options)
+            else:
+                frame.write_ipc(output_file, **options)
+
+        console.print(f"[green]{output_format.capitalize()} saved:[/green] {output_file}")
+        return output_file
+
+    def _typed_differences(self, lazy: pl.LazyFrame, key_dtypes: Dict[str, pl.DataType]) -> pl.LazyFrame:
+        """
+        Restore typed columns: key columns as their original types, field and
+        type as categoricals, values kept as text.
+
+        Args:
+            lazy: Differences
+            key_dtypes: Original data types of the key columns
+
+        Returns:
+            LazyFrame with the typed schema
+        """
+        key_column = lazy.collect_schema().names()[0]  # First column is always the key
+
+        return lazy.select(
+            *self._typed_key_exprs(lazy, key_column, key_dtypes),
+            pl.col("field").cast(pl.Categorical),
+            pl.col("source_value"),
+            pl.col("comparison_value"),
+            pl.col("type").cast(pl.Categorical)
+        )
+
+    def _typed_key_exprs(
+        self,
+        lazy: pl.LazyFrame,
+        key_column: str,
+        key_dtypes: Dict[str, pl.DataType]
+    ) -> List[pl.Expr]:
+        """
+        Parse the key text back into one column per key column.
+
+        Composite keys are rendered like Python tuples; they are split only when
+        no part is text (text parts may contain the separator). The key stays
+        text when any value does not parse as its original type.
 
-        # Check row limit
-        if len(df) > FileFormat.EXCEL_MAX_ROWS:
+        Args:
+            lazy: Differences
+            key_column: Name of the key text column
+            key_dtypes: Original data types of the key columns
+
+        Returns:
+            Key column expressions
+        """
+        key_columns = [col.strip() for col in key_column.split(",") if col.strip()]
+        text = pl.col(key_column)
+
+        if len(key_columns) == 1:
+            parts = {key_columns[0]: text}
+        elif all(key_dtypes.get(col, pl.String) != pl.String for col in key_columns):
+            split = text.str.strip_prefix("(").str.strip_suffix(")").str.split(", ")
+            parts = {col: split.list.get(i, null_on_oob=True) for i, col in enumerate(key_columns)}
+        else:
+            return [text]
+
+        typed = {col: self._parse_key(part, key_dtypes.get(col, pl.String)) for col, part in parts.items()}
+        if all(key_dtypes.get(col, pl.String) == pl.String for col in typed):
+            return [expr.alias(col) for col, expr in typed.items()]
+
+        # One pass over the key column only: any value lost to parsing keeps the text key
+        lost = lazy.select(
+            pl.any_horizontal([(part != "") & typed[col].is_null() for col, part in parts.items()]).any()
+        ).collect().item()
+        if lost:
             console.print(
-                f"[yellow]Warning: {len(df):,} differences exceed Excel's "
-                f"{FileFormat.EXCEL_MAX_ROWS:,} row limit. "
-                f"Truncating to fit Excel format.[/yellow]"
+                f"[yellow]Warning: Some {key_column} values do not match the source column type, "
+                f"writing the key as text[/yellow]"
             )
-            df = df.head(FileFormat.EXCEL_MAX_ROWS)
-
-        # Write using xlsxwriter for better formatting control
-        with pl.Config() as cfg:
-            df.write_excel(
-                output_file,
-                worksheet="Differences",
-                autofit=True
+            return [text]
+
+        return [expr.alias(col) for col, expr in typed.items()]
+
+    @staticmethod
+    def _parse_key(text: pl.Expr, dtype: pl.DataType) -> pl.Expr:
+        """Parse key text (rendered like str(value)) as dtype; unparsable values become null."""
+        if dtype == pl.Boolean:
+            return pl.when(text == "True").then(True).when(text == "False").then(False)
+        if dtype == pl.Datetime:
+            return text.str.to_datetime("%Y-%m-%d %H:%M:%S%.f", time_unit=dtype.time_unit or "us", strict=False)
+        if dtype == pl.Date:
+            return text.str.to_date("%Y-%m-%d", strict=False)
+        if dtype.is_numeric():
+            return text.cast(dtype, strict=False)
+        return text
+
+    def _write_excel(
+        self,
+        df: Union[pl.DataFrame, pl.LazyFrame],
+        timestamp: str,
+        summary_rows: List[Tuple[str, Any]]
+    ) -> List[Path]:
+        """
+        Write differences to Excel files with formatting.
+
+        Differences beyond one worksheet's capacity continue on Differences_2,
+        Differences_3, ... sheets. With excel_rows_per_workbook set, they are
+        split into part workbooks instead, written in parallel processes.
+
+        Args:
+            df: Differences (DataFrame or LazyFrame)
+            timestamp: Timestamp for output file names
+            summary_rows: (label, value) rows of the summary sheet
+
+        Returns:
+            List of Excel file paths
+        """
+        total_rows = self._row_count(df)
+        rows_per_workbook = self.settings.excel_rows_per_workbook
+
+        if rows_per_workbook is None or total_rows <= rows_per_workbook:
+            output_file = self.output_dir / f"differences_{timestamp}.xlsx"
+            self._write_excel_workbook(output_file, df, total_rows, summary_rows)
+            console.print(f"[green]Excel saved:[/green] {output_file}")
+            return [output_file]
+
+        return self._write_excel_parts(df, timestamp, total_rows, summary_rows)
+
+    def _write_excel_parts(
+        self,
+        df: Union[pl.DataFrame, pl.LazyFrame],
+        timestamp: str,
+        total_rows: int,
+        summary_rows: List[Tuple[str, Any]]
+    ) -> List[Path]:
+        """
+        Split differences into workbooks of excel_rows_per_workbook rows.
+        Parts are materialized one at a time and written by a process pool
+        (xlsxwriter holds the GIL), with at most one pending part per worker.
+
+        Args:
+            df: Differences (DataFrame or LazyFrame)
+            timestamp: Timestamp for output file names
+            total_rows: Number of differences
+            summary_rows: (label, value) rows of the summary sheet
+
+        Returns:
+            List of Excel file paths, in part order
+        """
+        part_rows = self.settings.excel_rows_per_workbook
+        offsets = list(range(0, total_rows, part_rows))
+        output_files = [
+            self.output_dir / f"differences_{timestamp}_part{number:03d}.xlsx"
+            for number in range(1, len(offsets) + 1)
+        ]
+        num_workers = min(self.settings.get_effective_workers(), len(offsets))
+
+        console.print(
+            f"[yellow]Splitting {total_rows:,} differences into {len(offsets)} workbooks "
+            f"of up to {part_rows:,} rows ({num_workers} workers)[/yellow]"
+        )
+
+        def parts():
+            for number, (offset, output_file) in enumerate(zip(offsets, output_files), 1):
+                part = df.slice(offset, part_rows)
+                if isinstance(part, pl.LazyFrame):
+                    part = part.collect()
+                rows = summary_rows + [("Workbook", f"{number} of {len(offsets)}")]
+                yield output_file, part, rows
+
+        if num_workers <= 1:
+            for output_file, part, rows in parts():
+                self._write_excel_workbook(output_file, part, len(part), rows)
+        else:
+            settings_data = self.settings.model_dump()
+            # spawn: forked Polars thread pools can deadlock
+            with ProcessPoolExecutor(
+                max_workers=num_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            ) as executor:
+                pending = set()
+                for output_file, part, rows in parts():
+                    if len(pending) >= num_workers:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            future.result()
+                    pending.add(executor.submit(_write_excel_part, settings_data, output_file, part, rows))
+
+                for future in pending:
+                    future.result()
+
+        for output_file in output_files:
+            console.print(f"[green]Excel saved:[/green] {output_file}")
+        return output_files
+
+    def _write_excel_workbook(
+        self,
+        output_file: Path,
+        df: Union[pl.DataFrame, pl.LazyFrame],
+        total_rows: int,
+        summary_rows: List[Tuple[str, Any]]
+    ):
+        """
+        Write one workbook: difference sheets of up to EXCEL_SHEET_ROWS rows
+        each, then the summary sheet.
+
+        The workbook is written in a single pass in xlsxwriter's constant_memory
+        mode, so rows are flushed to disk as they are written. Value columns are
+        colored by one conditional format range each, and column widths come
+        from a sample of the first rows.
+
+        Args:
+            output_file: Path of the workbook
+            df: Differences (DataFrame or LazyFrame)
+            total_rows: Number of differences
+            summary_rows: (label, value) rows of the summary sheet
+        """
+        sheet_rows = self.EXCEL_SHEET_ROWS
+        offsets = range(0, max(total_rows, 1), sheet_rows)
+        if len(offsets) > 1:
+            console.print(
+                f"[yellow]Note: {total_rows:,} differences exceed Excel's "
+                f"{FileFormat.EXCEL_MAX_ROWS:,} row limit. "
+                f"Continuing on {len(offsets) - 1} more worksheet(s).[/yellow]"
             )
 
-        # Apply conditional formatting if possible
+        schema = df.collect_schema()
+        workbook = xlsxwriter.Workbook(str(output_file), self.EXCEL_WORKBOOK_OPTIONS)
         try:
-            self._apply_excel_formatting(output_file, df)
-        except Exception as e:
-            console.print(f"[yellow]Note: Could not apply Excel formatting: {e}[/yellow]")
+            for index, offset in enumerate(offsets):
+                worksheet = workbook.add_worksheet("Differences" if index == 0 else f"Differences_{index + 1}")
+                self._write_excel_sheet(
+                    workbook,
+                    worksheet,
+                    schema,
+                    self._iter_chunks(df.slice(offset, sheet_rows), self.settings.chunk_size)
+                )
+
+            self._write_excel_summary(
+                workbook,
+                summary_rows + [("Differences in workbook", total_rows), ("Difference sheets", len(offsets))]
+            )
+        finally:
+            workbook.close()
 
-        console.print(f"[green]Excel saved:[/green] {output_file}")
-        return output_file
+    @staticmethod
+    def _excel_summary_rows(
+        source_file: str,
+        comparison_file: str,
+        comparison_summary: Optional[Dict[str, Any]]
+    ) -> List[Tuple[str, Any]]:
+        """
+        Build the (label, value) rows of the Excel summary sheet.
+
+        Args:
+            source_file: Name of source file
+            comparison_file: Name of comparison file
+            comparison_summary: Optional ComparisonSummary.to_dict()
 
-    def _apply_excel_formatting(self, filepath: Path, df: pl.DataFrame):
-        """Apply conditional formatting to Excel file."""
-        from openpyxl import load_workbook
-        from openpyxl.styles import PatternFill
+        Returns:
+            Summary rows
+        """
+        rows = [
+            ("Source file", source_file),
+            ("Comparison file", comparison_file),
+            ("Generated at", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+        ]
+        for name, value in (comparison_summary or {}).items():
+            rows.append((name.replace("_", " ").capitalize(), value))
+        return rows
+
+    def _write_excel_summary(self, workbook: "xlsxwriter.Workbook", summary_rows: List[Tuple[str, Any]]):
+        """
+        Add the summary sheet of (label, value) rows.
 
-        wb = load_workbook(filepath)
-        ws = wb.active
+        Args:
+            workbook: Workbook being written
+            summary_rows: Summary rows
+        """
+        worksheet = workbook.add_worksheet("Summary")
+        label_format = workbook.add_format({"bold": True})
+        count_format = workbook.add_format({"num_format": "#,##0", "align": "left"})
 
-        # Define fill colors
-        source_fill = PatternFill(start_color='FFCDD2', end_color='FFCDD2', fill_type='solid')
-        comparison_fill = PatternFill(start_color='C8E6C9', end_color='C8E6C9', fill_type='solid')
+        # Column formats must be set before rows are flushed
+        worksheet.set_column(0, 0, max(len(label) for label, _ in summary_rows) + 2)
+        worksheet.set_column(1, 1, min(max(len(str(value)) for _, value in summary_rows) + 2, self.EXCEL_MAX_COLUMN_WIDTH))
 
-        # Find columns (assuming standard naming)
-        header_row = list(ws.iter_rows(min_row=1, max_row=1, values_only=True))[0]
+        for row, (label, value) in enumerate(summary_rows):
+            worksheet.write_string(row, 0, label, label_format)
+            worksheet.write(row, 1, value, count_format if isinstance(value, int) else None)
 
+    def _write_excel_sheet(
+        self,
+        workbook: "xlsxwriter.Workbook",
+        worksheet: "xlsxwriter.worksheet.Worksheet",
+        schema: pl.Schema,
+        chunks: Iterator[pl.DataFrame]
+    ) -> int:
+        """
+        Stream difference rows into a worksheet below a header row.
+
+        Args:
+            workbook: Workbook the worksheet belongs to
+            worksheet: Empty worksheet
+            schema: Schema of the differences
+            chunks: Difference chunks, in row order
+
+        Returns:
+            Number of data rows written
+        """
+        columns = schema.names()
+        header_format = workbook.add_format({"bold": True, "bottom": 1})
+        worksheet.write_row(0, 0, columns, header_format)
+        worksheet.freeze_panes(1, 0)
+
+        # Column formats must be set before the first data row is flushed
+        row = 1
+        sized = False
+        for chunk in chunks:
+            if not sized:
+                self._set_excel_columns(workbook, worksheet, chunk)
+                sized = True
+            for values in chunk.iter_rows():
+                worksheet.write_row(row, 0, values)
+                row += 1
+
+        if not sized:
+            self._set_excel_columns(workbook, worksheet, pl.DataFrame(schema=schema))
+
+        last_row = row - 1
+        worksheet.autofilter(0, 0, last_row, len(columns) - 1)
+
+        # Color the value columns with one range each instead of per-cell fills
+        if last_row >= 1:
+            for column, color in self._excel_fill_columns(columns):
+                worksheet.conditional_format(1, column, last_row, column, {
+                    "type": "formula",
+                    "criteria": "=TRUE",
+                    "format": workbook.add_format({"bg_color": color})
+                })
+
+        return last_row
+
+    def _set_excel_columns(
+        self,
+        workbook: "xlsxwriter.Workbook",
+        worksheet: "xlsxwriter.worksheet.Worksheet",
+        sample: pl.DataFrame
+    ):
+        """
+        Size columns from the header and a sample of rows, and give date
+        columns a date format.
+
+        Args:
+            workbook: Workbook the worksheet belongs to
+            worksheet: Worksheet being written
+            sample: First rows of the differences
+        """
+        sample = sample.head(self.EXCEL_WIDTH_SAMPLE_ROWS)
+        date_format = workbook.add_format({"num_format": "yyyy-mm-dd"})
+        datetime_format = workbook.add_format({"num_format": "yyyy-mm-dd hh:mm:ss"})
+
+        for index, (column, dtype) in enumerate(sample.schema.items()):
+            if dtype == pl.Date:
+                widest, cell_format = 10, date_format
+            elif dtype == pl.Datetime:
+                widest, cell_format = 19, datetime_format
+            else:
+                widest = sample[column].cast(pl.String).str.len_chars().max() or 0
+                cell_format = None
+
+            width = min(max(len(column), widest) + 2, self.EXCEL_MAX_COLUMN_WIDTH)
+            worksheet.set_column(index, index, width, cell_format)
+
+    @classmethod
+    def _excel_fill_columns(cls, columns: List[str]) -> List[Tuple[int, str]]:
+        """Find the source and comparison value columns and their fill colors."""
         source_col_idx = None
         comparison_col_idx = None
 
-        for idx, header in enumerate(header_row, 1):
-            if header and 'SOURCE' in str(header).upper():
+        for idx, header in enumerate(columns):
+            if 'SOURCE' in header.upper():
                 source_col_idx = idx
-            elif header and ('COMPARISON' in str(header).upper() or 'NEW' in str(header).upper()):
+            elif 'COMPARISON' in header.upper() or 'NEW' in header.upper():
                 comparison_col_idx = idx
 
-        # Apply formatting
-        for row_idx in range(2, len(df) + 2):  # Skip header
-            if source_col_idx:
-                ws.cell(row=row_idx, column=source_col_idx).fill = source_fill
-            if comparison_col_idx:
-                ws.cell(row=row_idx, column=comparison_col_idx).fill = comparison_fill
+        fills = []
+        if source_col_idx is not None:
+            fills.append((source_col_idx, cls.EXCEL_SOURCE_FILL))
+        if comparison_col_idx is not None:
+            fills.append((comparison_col_idx, cls.EXCEL_COMPARISON_FILL))
+        return fills
 
-        wb.save(filepath)
+    @staticmethod
+    def _stats_html(summary_stats: Optional[dict]) -> str:
+        """Build the summary boxes shown at the top of HTML reports."""
+        stats_html = ""
+        if summary_stats:
+            stats_html = f"""
+            <div class="stats">
+                <div class="stat-box">
+                    <div class="stat-number">{summary_stats.get('total_differences', 0):,}</div>
+                    <div class="stat-label">Total Differences</div>
+                </div>
+                <div class="stat-box">
+                    <div class="stat-number">{summary_stats.get('unique_keys', 0):,}</div>
+                    <div class="stat-label">Unique Records</div>
+                </div>
+                <div class="stat-box">
+                    <div class="stat-number">{summary_stats.get('exact_matches', 0):,}</div>
+                    <div class="stat-label">Exact Matches (Excluded)</div>
+                </div>
+            </div>
+            """
+        return stats_html
 
     def _write_html_report(
         self,
-        df: pl.DataFrame,
+        df: Union[pl.DataFrame, pl.LazyFrame],
         source_file: str,
         comparison_file: str,
         timestamp: str,
         summary_stats: Optional[dict] = None
     ) -> Path:
         """Generate interactive HTML report with DataTables and SearchPanes filtering."""
+        mode = self.settings.html_report_mode
+        if mode == "auto":
+            mode = "paged" if self._row_count(df) > self.HTML_INLINE_MAX_ROWS else "inline"
+
+        if mode == "paged":
+            return self._write_paged_html_report(df, source_file, comparison_file, timestamp, summary_stats)
+
         output_file = self.output_dir / f"differences_report_{timestamp}.html"
 
         # Limit rows for HTML (performance)
-        max_html_rows = 50000
+        max_html_rows = self.HTML_INLINE_MAX_ROWS
         is_truncated = False
-        if len(df) > max_html_rows:
+        df, total_rows = self._head(df, max_html_rows)
+        if total_rows > max_html_rows:
             console.print(
                 f"[yellow]HTML report limited to {max_html_rows:,} rows "
-                f"(file has {len(df):,} differences)[/yellow]"
+                f"(file has {total_rows:,} differences)[/yellow]"
             )
-            df = df.head(max_html_rows)
             is_truncated = True
 
         # Configure SearchPanes for column filtering
@@ -353,25 +1206,7 @@ class ResultWriter:
         for col in df.columns:
             table_headers += f"<th>{col}</th>"
 
-        # Generate stats
-        stats_html = ""
-        if summary_stats:
-            stats_html = f"""
-            <div class="stats">
-                <div class="stat-box">
-                    <div class="stat-number">{summary_stats.get('total_differences', 0):,}</div>
-                    <div class="stat-label">Total Differences</div>
-                </div>
-                <div class="stat-box">
-                    <div class="stat-number">{summary_stats.get('unique_keys', 0):,}</div>
-                    <div class="stat-label">Unique Records</div>
-                </div>
-                <div class="stat-box">
-                    <div class="stat-number">{summary_stats.get('exact_matches', 0):,}</div>
-                    <div class="stat-label">Exact Matches (Excluded)</div>
-                </div>
-            </div>
-            """
+        stats_html = self._stats_html(summary_stats)
 
         truncation_warning = ""
         if is_truncated:
@@ -400,194 +1235,7 @@ class ResultWriter:
     {css_links}
     {js_scripts}
     <style>
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            margin: 0;
-            padding: 20px;
-            background: #f5f5f5;
-        }}
-        .container {{
-            max-width: 1600px;
-            margin: 0 auto;
-            background: white;
-            padding: 30px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        h1 {{
-            color: #333;
-            margin-bottom: 10px;
-        }}
-        .info {{
-            color: #666;
-            margin-bottom: 20px;
-            font-size: 14px;
-        }}
-        .stats {{
-            display: flex;
-            gap: 20px;
-            margin-bottom: 30px;
-        }}
-        .stat-box {{
-            flex: 1;
-            padding: 20px;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            border-radius: 8px;
-            text-align: center;
-        }}
-        .stat-number {{
-            font-size: 36px;
-            font-weight: bold;
-            margin-bottom: 5px;
-        }}
-        .stat-label {{
-            font-size: 14px;
-            opacity: 0.9;
-        }}
-        .warning-box {{
-            padding: 15px;
-            background: #fff3cd;
-            border: 1px solid #ffc107;
-            border-radius: 4px;
-            margin-bottom: 20px;
-            color: #856404;
-        }}
-        table.dataTable {{
-            width: 100% !important;
-        }}
-        table.dataTable thead th {{
-            background: #2c3e50;
-            color: white;
-            padding: 12px;
-            text-align: left;
-            font-weight: 600;
-        }}
-        table.dataTable tbody td {{
-            padding: 10px;
-            border-bottom: 1px solid #eee;
-        }}
-        .dataTables_wrapper {{
-            padding: 20px 0;
-        }}
-        .dataTables_filter {{
-            margin-bottom: 20px;
-        }}
-        .dataTables_length {{
-            margin-bottom: 20px;
-        }}
-
-        /* SearchPanes styling */
-        .dtsp-searchPanes {{
-            margin-bottom: 20px;
-        }}
-        .dtsp-searchPane {{
-            background: white;
-            border: 1px solid #e0e0e0;
-            border-radius: 4px;
-            box-shadow: 0 1px 3px rgba(0,0,0,0.05);
-        }}
-        .dtsp-title {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 8px 12px;
-            font-weight: 600;
-            border-radius: 4px 4px 0 0;
-        }}
-        .dtsp-topRow {{
-            background: #f8f9fa;
-            padding: 8px;
-            border-bottom: 1px solid #e0e0e0;
-        }}
-        .dtsp-searchCont input {{
-            border: 1px solid #ced4da;
-            border-radius: 4px;
-            padding: 8px 12px;
-            width: 100%;
-            font-size: 13px;
-            transition: all 0.2s ease;
-            background: white;
-        }}
-        .dtsp-searchCont input:focus {{
-            outline: none;
-            border-color: #667eea;
-            box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1);
-        }}
-        .dtsp-searchCont input::placeholder {{
-            color: #a0a0a0;
-            font-style: italic;
-            opacity: 0.8;
-        }}
-        .dtsp-selected {{
-            background: #e3f2fd !important;
-            border-left: 3px solid #667eea !important;
-        }}
-
-        /* Filters Active Counter */
-        .dtsp-panesContainer {{
-            margin-bottom: 25px;
-        }}
-        div.dtsp-panesContainer div.dtsp-title {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 10px 16px;
-            font-size: 15px;
-            font-weight: 600;
-            border-radius: 6px;
-            box-shadow: 0 2px 4px rgba(102, 126, 234, 0.2);
-            margin-bottom: 15px;
-            display: inline-block;
-            min-width: 180px;
-            text-align: center;
-        }}
-        div.dtsp-panesContainer button.dtsp-clearAll {{
-            background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
-            color: white;
-            border: none;
-            padding: 8px 16px;
-            border-radius: 4px;
-            font-weight: 500;
-            cursor: pointer;
-            transition: all 0.2s ease;
-            box-shadow: 0 2px 4px rgba(245, 87, 108, 0.2);
-        }}
-        div.dtsp-panesContainer button.dtsp-clearAll:hover {{
-            transform: translateY(-1px);
-            box-shadow: 0 4px 8px rgba(245, 87, 108, 0.3);
-        }}
-        div.dtsp-panesContainer button.dtsp-clearAll:active {{
-            transform: translateY(0);
-        }}
-        .help-text {{
-            background: #f0f7ff;
-            border-left: 4px solid #667eea;
-            padding: 12px 15px;
-            margin-bottom: 20px;
-            color: #1a1a1a;
-            border-radius: 4px;
-        }}
-
-        /* Pagination styling - add moderate spacing to prevent wrapping */
-        .dataTables_paginate {{
-            padding-right: 15px !important;
-            padding-left: 10px !important;
-            margin-top: 20px !important;
-        }}
-        .dataTables_paginate .paginate_button {{
-            margin: 0 5px !important;
-            padding: 8px 12px !important;
-        }}
-        .dataTables_paginate .paginate_button.current {{
-            margin: 0 5px !important;
-        }}
-        .dataTables_paginate .paginate_button.previous,
-        .dataTables_paginate .paginate_button.next {{
-            margin: 0 8px !important;
-        }}
-        .dataTables_info {{
-            padding-left: 10px !important;
-        }}
-    </style>
+{REPORT_CSS}    </style>
 </head>
 <body>
     <div class="container">
@@ -737,3 +1385,314 @@ class ResultWriter:
         output_file.write_text(html, encoding='utf-8')
         console.print(f"[green]HTML report saved:[/green] {output_file}")
         return output_file
+
+    def _filter_counts(self, df: Union[pl.DataFrame, pl.LazyFrame], columns: List[str]) -> List[Dict[str, Any]]:
+        """
+        Count the values of each filter column for the paged report's filter panes.
+
+        Args:
+            df: Differences (DataFrame or LazyFrame)
+            columns: Filter column names
+
+        Returns:
+            One dictionary per column with its name, index, number of distinct
+            values and the most frequent [value, count] pairs
+        """
+        if not columns:
+            return []
+
+        lazy = df.lazy()
+        all_columns = lazy.collect_schema().names()
+        plans = [
+            lazy.select(pl.col(column).cast(pl.String).fill_null(""))
+            .group_by(column)
+            .agg(pl.len().alias("count"))
+            .sort(["count", column], descending=[True, False])
+            for column in columns
+        ]
+
+        filters = []
+        for column, counts in zip(columns, pl.collect_all(plans, streaming=True)):
+            filters.append({
+                "column": column,
+                "index": all_columns.index(column),
+                "distinct": len(counts),
+                "values": counts.head(self.HTML_FILTER_VALUES).rows()
+            })
+
+        return filters
+
+    def _write_paged_html_report(
+        self,
+        df: Union[pl.DataFrame, pl.LazyFrame],
+        source_file: str,
+        comparison_file: str,
+        timestamp: str,
+        summary_stats: Optional[dict] = None
+    ) -> Path:
+        """
+        Generate an HTML report whose rows live in data chunks next to the page.
+
+        Differences are written as gzip-compressed JSON chunks wrapped in small
+        scripts (browsers load scripts from local files, unlike fetch), and the
+        page loads them one after another into a DataTable that only renders
+        the rows on screen. Filter pane counts are computed here, so no row
+        limit applies and the first page shows as soon as the first chunk loads.
+        """
+        output_file = self.output_dir / f"differences_report_{timestamp}.html"
+        data_dir = self.output_dir / f"differences_report_{timestamp}_data"
+        data_dir.mkdir(parents=True, exist_ok=True)
+
+        columns = df.collect_schema().names()
+        search_panes_config = SearchPanesConfig.from_settings(self.settings, columns, columns[0])
+        filters = self._filter_counts(df, [columns[i] for i in search_panes_config.columns])
+
+        chunk_files = []
+        total_rows = 0
+        for index, chunk in enumerate(self._iter_chunks(df, self.HTML_CHUNK_ROWS)):
+            rows = chunk.select(pl.all().cast(pl.String).fill_null("")).rows()
+            payload = gzip.compress(json.dumps(rows, separators=(",", ":")).encode("utf-8"), compresslevel=6)
+
+            chunk_file = data_dir / f"chunk_{index:05d}.js"
+            chunk_file.write_text(
+                f'diffReport.addChunk("{base64.b64encode(payload).decode("ascii")}");\n',
+                encoding="utf-8"
+            )
+            chunk_files.append(f"{data_dir.name}/{chunk_file.name}")
+            total_rows += len(rows)
+
+        # Embedded in a <script> block, so "</" must not close it
+        report_data = json.dumps({
+            "chunks": chunk_files,
+            "totalRows": total_rows,
+            "filters": filters
+        }).replace("</", "<\\/")
+
+        table_headers = "".join(f"<th>{col}</th>" for col in columns)
+        stats_html = self._stats_html(summary_stats)
+        filter_help = (
+            "Click values in the filter panels above to narrow down results (counts cover all differences)"
+            if filters else "Enable with --enable-search-panes flag"
+        )
+
+        html = f"""
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>File Comparison Report</title>
+    <link rel="stylesheet" href="https://cdn.datatables.net/1.13.6/css/jquery.dataTables.min.css">
+    <script src="https://code.jquery.com/jquery-3.7.0.min.js"></script>
+    <script src="https://cdn.datatables.net/1.13.6/js/jquery.dataTables.min.js"></script>
+    <style>
+{REPORT_CSS}{PAGED_REPORT_CSS}    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>File Comparison Report</h1>
+        <div class="info">
+            <strong>Source File:</strong> {source_file}<br>
+            <strong>Compared to:</strong> {comparison_file}<br>
+            <strong>Generated at:</strong> {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+        </div>
+
+        {stats_html}
+
+        <div class="help-text">
+            <strong>💡 Interactive Features:</strong><br>
+            • <strong>Column Filters:</strong> {filter_help}<br>
+            • <strong>Multi-Column Sort:</strong> Hold Shift and click column headers to sort by multiple columns<br>
+            • <strong>Search:</strong> Use the search box to find specific text across all columns<br>
+            • <strong>Data:</strong> Rows are loaded from the <code>{data_dir.name}</code> folder, which must stay next to this file
+        </div>
+
+        <div id="filterPanes" class="filter-panes"></div>
+        <div id="loadStatus" class="load-status">Loading differences...</div>
+
+        <table id="diffTable" class="display">
+            <thead>
+                <tr>{table_headers}</tr>
+            </thead>
+        </table>
+    </div>
+
+    <script>
+        var diffReport = (function() {{
+            var report = {report_data};
+            var table = null;
+            var loaded = 0;
+            var selected = {{}};
+
+            function escapeHtml(text) {{
+                return text.replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;');
+            }}
+
+            function renderCell(data, type) {{
+                // Escape and convert newlines to <br> for display; filter and sort on raw values
+                return type === 'display' ? escapeHtml(data).replace(/\\n/g, '<br>') : data;
+            }}
+
+            function setStatus(text) {{
+                $('#loadStatus').text(text);
+            }}
+
+            function decode(payload) {{
+                var bytes = Uint8Array.from(atob(payload), function(c) {{ return c.charCodeAt(0); }});
+                var stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('gzip'));
+                return new Response(stream).json();
+            }}
+
+            function loadNext() {{
+                if (loaded >= report.chunks.length) {{
+                    setStatus('All ' + report.totalRows.toLocaleString() + ' differences loaded');
+                    return;
+                }}
+                var script = document.createElement('script');
+                script.src = report.chunks[loaded];
+                script.onerror = function() {{
+                    setStatus('Could not load ' + report.chunks[loaded] + ' (keep the data folder next to this report)');
+                }};
+                document.body.appendChild(script);
+            }}
+
+            function addChunk(payload) {{
+                decode(payload).then(function(rows) {{
+                    table.rows.add(rows).draw(false);
+                    loaded += 1;
+                    setStatus(
+                        'Loaded ' + table.rows().count().toLocaleString() + ' of ' +
+                        report.totalRows.toLocaleString() + ' differences...'
+                    );
+                    loadNext();
+                }});
+            }}
+
+            function applyFilter(filter) {{
+                var values = selected[filter.index] || [];
+                var pattern = values.length
+                    ? '^(' + values.map($.fn.dataTable.util.escapeRegex).join('|') + ')$'
+                    : '';
+                table.column(filter.index).search(pattern, true, false).draw();
+            }}
+
+            function renderFilters() {{
+                var $panes = $('#filterPanes');
+                report.filters.forEach(function(filter) {{
+                    var $pane = $('<div class="filter-pane"></div>');
+                    var $list = $('<ul class="filter-values"></ul>');
+                    $pane.append($('<div class="filter-title"></div>').text(filter.column));
+
+                    filter.values.forEach(function(entry) {{
+                        var $item = $('<li></li>');
+                        $item.append($('<span></span>').text(entry[0] === '' ? '(empty)' : entry[0]));
+                        $item.append($('<span class="filter-count"></span>').text(entry[1].toLocaleString()));
+                        $item.on('click', function() {{
+                            var values = selected[filter.index] || (selected[filter.index] = []);
+                            var position = values.indexOf(entry[0]);
+                            if (position >= 0) {{
+                                values.splice(position, 1);
+                            }} else {{
+                                values.push(entry[0]);
+                            }}
+                            $item.toggleClass('selected', position < 0);
+                            applyFilter(filter);
+                        }});
+                        $list.append($item);
+                    }});
+                    $pane.append($list);
+
+                    if (filter.distinct > filter.values.length) {{
+                        $pane.append($('<div class="filter-note"></div>').text(
+                            'Top ' + filter.values.length.toLocaleString() + ' of ' +
+                            filter.distinct.toLocaleString() + ' values'
+                        ));
+                    }}
+                    $panes.append($pane);
+                }});
+
+                if (report.filters.length) {{
+                    var $clear = $('<button class="filter-clear">Clear All</button>');
+                    $clear.on('click', function() {{
+                        selected = {{}};
+                        $('.filter-values li').removeClass('selected');
+                        table.columns().search('').draw();
+                    }});
+                    $panes.append($clear);
+                }}
+            }}
+
+            function init() {{
+                table = $('#diffTable').DataTable({{
+                    data: [],
+                    deferRender: true,
+                    pageLength: 50,
+                    order: [],
+                    searchDelay: 400,
+                    dom: 'frtip',
+                    columnDefs: [{{ targets: '_all', render: renderCell }}]
+                }});
+                renderFilters();
+
+                if (typeof DecompressionStream === 'undefined') {{
+                    setStatus('This browser cannot decompress the report data; open it in a current Chrome, Edge, Firefox or Safari');
+                    return;
+                }}
+                loadNext();
+            }}
+
+            return {{ init: init, addChunk: addChunk }};
+        }})();
+
+        $(document).ready(diffReport.init);
+    </script>
+</body>
+</html>
+        """
+
+        output_file.write_text(html, encoding='utf-8')
+        console.print(
+            f"[green]HTML report saved:[/green] {output_file} "
+            f"({total_rows:,} differences in {len(chunk_files)} data chunks)"
+        )
+        return output_file
+
+
+def _write_excel_part(
+    settings_data: Dict[str, Any],
+    output_file: Path,
+    part: pl.DataFrame,
+    summary_rows: List[Tuple[str, Any]]
+):
+    """
+    Process pool entry point: write one part workbook.
+
+    Args:
+        settings_data: ComparisonSettings as a dictionary
+        output_file: Path of the workbook
+        part: Differences of this part
+        summary_rows: (label, value) rows of the summary sheet
+    """
+    writer = ResultWriter(ComparisonSettings.from_dict(settings_data))
+    writer._write_excel_workbook(output_file, part, len(part), summary_rows)
+
+
+def _write_excel_process(
+    settings_data: Dict[str, Any],
+    df: Union[pl.DataFrame, pl.LazyFrame],
+    timestamp: str,
+    summary_rows: List[Tuple[str, Any]]
+) -> List[Path]:
+    """
+    Process pool entry point: write the Excel output.
+
+    Args:
+        settings_data: ComparisonSettings as a dictionary
+        df: Differences (DataFrame or LazyFrame)
+        timestamp: Timestamp for output file names
+        summary_rows: (label, value) rows of the summary sheet
+
+    Returns:
+        List of Excel file paths
+    """
+    writer = ResultWriter(ComparisonSettings.from_dict(settings_data))
+    return writer._write_excel(df, timestamp, summary_rows)
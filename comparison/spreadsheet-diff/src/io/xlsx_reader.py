@@ -0,0 +1,218 @@
+"""
+Streaming reader for XLSX workbooks.
+Parses the first worksheet incrementally with openpyxl's read-only mode, so
+Excel files are chunked with bounded memory instead of loaded whole.
+"""
+
+from datetime import date, datetime, time
+from pathlib import Path
+from typing import Any, Iterator, List, Optional, Sequence
+import polars as pl
+from openpyxl import load_workbook
+
+
+class XlsxStreamReader:
+    """
+    Read the first worksheet of an XLSX/XLSM workbook in chunks.
+
+    The first row is the header. Completely empty rows are skipped. Column
+    dtypes are inferred per chunk from the cell values; a column mixing
+    incompatible value types (e.g. numbers and text) is read as strings.
+    Legacy .xls and binary .xlsb workbooks cannot be streamed.
+    """
+
+    STREAMABLE_EXTENSIONS = {".xlsx", ".xlsm"}
+
+    # Name given to header cells without a value (matches pl.read_excel)
+    UNNAMED_COLUMN = "__UNNAMED__{}"
+
+    # Python value types that can share one Polars column
+    COMPATIBLE_TYPES = [{int, float}, {datetime, date}]
+
+    def __init__(self, filepath: Path):
+        """
+        Initialize XLSX stream reader.
+
+        Args:
+            filepath: Path to XLSX/XLSM file
+        """
+        self.filepath = filepath
+
+    @classmethod
+    def can_stream(cls, filepath: Path) -> bool:
+        """Check if a workbook can be streamed (XLSX/XLSM)."""
+        return filepath.suffix.lower() in cls.STREAMABLE_EXTENSIONS
+
+    def iter_chunks(
+        self,
+        chunk_size: int,
+        max_rows: Optional[int] = None,
+        columns: Optional[List[str]] = None
+    ) -> Iterator[pl.DataFrame]:
+        """
+        Stream the worksheet as DataFrame chunks.
+        Cells of columns outside the projection are dropped as each row is
+        parsed, so they are never buffered or converted.
+
+        Args:
+            chunk_size: Number of rows per chunk
+            max_rows: Stop after this many data rows (None = all rows)
+            columns: Columns to keep, in header order (None = all)
+
+        Yields:
+            DataFrame chunks of chunk_size rows (last chunk may be smaller)
+        """
+        workbook = load_workbook(self.filepath, read_only=True, data_only=True)
+        try:
+            rows = workbook.worksheets[0].iter_rows(values_only=True)
+
+            header = next(rows, None)
+            if header is None:
+                return
+            names = self._column_names(header)
+            positions = [i for i, name in enumerate(names) if columns is None or name in columns]
+            names = [names[i] for i in positions]
+
+            buffer = []
+            rows_read = 0
+
+            for row in rows:
+                if max_rows is not None and rows_read >= max_rows:
+                    break
+                if all(value is None for value in row):
+                    continue
+
+                if columns is not None:
+                    row = tuple(row[i] if i < len(row) else None for i in positions)
+
+                buffer.append(row)
+                rows_read += 1
+
+                if len(buffer) >= chunk_size:
+                    yield self._to_dataframe(buffer, names)
+                    buffer = []
+
+            if buffer:
+                yield self._to_dataframe(buffer, names)
+
+        finally:
+            # Read-only workbooks keep the archive open until closed
+            workbook.close()
+
+    def read_sample(self, n_rows: int) -> pl.DataFrame:
+        """
+        Read the first rows of the worksheet.
+
+        Args:
+            n_rows: Number of data rows to read
+
+        Returns:
+            DataFrame with up to n_rows rows
+        """
+        for chunk in self.iter_chunks(max(n_rows, 1), max_rows=n_rows):
+            return chunk
+        return self._to_dataframe([], self.get_columns())
+
+    def read_all(self, chunk_size: int, columns: Optional[List[str]] = None) -> pl.DataFrame:
+        """
+        Read the whole worksheet with the same per-chunk dtypes as iter_chunks.
+        Chunks whose dtypes differ (e.g. numbers, then text further down) are
+        combined under their common supertype, so no cell is lost to nulls.
+
+        Args:
+            chunk_size: Number of rows parsed per chunk
+            columns: Columns to keep, in header order (None = all)
+
+        Returns:
+            DataFrame with every data row
+        """
+        chunks = list(self.iter_chunks(chunk_size, columns=columns))
+        if not chunks:
+            names = self.get_columns()
+            return self._to_dataframe([], [name for name in names if columns is None or name in columns])
+        return pl.concat(chunks, how="vertical_relaxed")
+
+    def get_columns(self) -> List[str]:
+        """
+        Read the header row only.
+
+        Returns:
+            List of column names (empty for an empty sheet)
+        """
+        workbook = load_workbook(self.filepath, read_only=True, data_only=True)
+        try:
+            header = next(workbook.worksheets[0].iter_rows(values_only=True), None)
+            return self._column_names(header) if header is not None else []
+        finally:
+            workbook.close()
+
+    def count_rows(self) -> int:
+        """
+        Count data rows from the worksheet's dimension element.
+        Workbooks written without one are sized by a row scan that parses
+        cells but builds no DataFrame.
+
+        Returns:
+            Number of rows below the header (may include trailing empty rows)
+        """
+        workbook = load_workbook(self.filepath, read_only=True, data_only=True)
+        try:
+            worksheet = workbook.worksheets[0]
+            worksheet.calculate_dimension(force=True)
+            if not worksheet.max_row:
+                return 0
+            return max(0, worksheet.max_row - worksheet.min_row)
+        finally:
+            workbook.close()
+
+    def _column_names(self, header: Sequence[Any]) -> List[str]:
+        """Build unique column names from the header row."""
+        columns = []
+        seen = set()
+
+        for i, value in enumerate(header):
+            name = self.UNNAMED_COLUMN.format(i) if value is None else str(value)
+            unique_name = name
+            suffix = 1
+            while unique_name in seen:
+                unique_name = f"{name}_{suffix}"
+                suffix += 1
+            seen.add(unique_name)
+            columns.append(unique_name)
+
+        return columns
+
+    def _to_dataframe(self, rows: List[Sequence[Any]], columns: List[str]) -> pl.DataFrame:
+        """
+        Build a DataFrame column by column from row tuples.
+
+        Args:
+            rows: Row values (rows shorter than the header are padded with nulls)
+            columns: Column names
+
+        Returns:
+            DataFrame chunk
+        """
+        width = len(columns)
+        padded = [tuple(row[:width]) + (None,) * (width - len(row)) for row in rows]
+        values_by_column = list(zip(*padded)) if padded else [()] * width
+
+        return pl.DataFrame([
+            self._to_series(name, list(values))
+            for name, values in zip(columns, values_by_column)
+        ])
+
+    def _to_series(self, name: str, values: List[Any]) -> pl.Series:
+        """Build one column, falling back to strings for incompatible value types."""
+        value_types = {type(value) for value in values if value is not None}
+
+        if len(value_types) > 1 and not any(value_types <= types for types in self.COMPATIBLE_TYPES):
+            values = [None if value is None else str(value) for value in values]
+
+        series = pl.Series(name, values, strict=False)
+
+        # Excel stores dates as datetimes; date-only columns read as Date (like pl.read_excel)
+        if series.dtype == pl.Datetime and (series.dt.time().drop_nulls() == time(0)).all():
+            series = series.cast(pl.Date)
+
+        return series
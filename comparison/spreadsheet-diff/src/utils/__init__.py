@@ -2,6 +2,6 @@
 
 from .logger import setup_logger, get_logger
 from .validators import FileValidator
-from .performance import PerformanceMonitor
+from .performance import PerformanceMonitor, Span
 
-__all__ = ["setup_logger", "get_logger", "FileValidator", "PerformanceMonitor"]
+__all__ = ["setup_logger", "get_logger", "FileValidator", "PerformanceMonitor", "Span"]
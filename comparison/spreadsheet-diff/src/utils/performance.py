@@ -1,10 +1,20 @@
 """
 Performance monitoring utilities for tracking memory and time usage.
+Records nested spans (wall/CPU time, rows, bytes, peak RSS) with a background
+RSS sampler, optional cProfile/tracemalloc capture, and exports them as a
+JSON trace or in Chrome trace format (chrome://tracing, Perfetto).
 """
 
+import cProfile
+import json
+import os
+import threading
 import time
+import tracemalloc
 import psutil
-from typing import Optional
+import polars as pl
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from rich.console import Console
@@ -12,6 +22,8 @@ from rich.console import Console
 
 console = Console()
 
+T = TypeVar("T")
+
 
 @dataclass
 class PerformanceMetrics:
@@ -75,17 +87,123 @@ class PerformanceMetrics:
         return "\n".join(summary_parts)
 
 
+@dataclass
+class Span:
+    """A timed section of work, possibly nested inside another span."""
+
+    name: str
+    span_id: int
+    parent_id: Optional[int]
+    thread_id: int
+    start_time: float                  # Seconds since the monitor started
+    start_cpu: float
+    start_memory_mb: float
+    end_time: Optional[float] = None
+    cpu_seconds: float = 0.0           # Process CPU time (includes Polars worker threads)
+    peak_memory_mb: float = 0.0
+    rows: int = 0
+    bytes: int = 0
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration_seconds(self) -> float:
+        """Get wall time in seconds (0 while the span is open)."""
+        if self.end_time is None:
+            return 0.0
+        return self.end_time - self.start_time
+
+    def update_rows(self, count: int):
+        """
+        Add processed rows to the span.
+
+        Args:
+            count: Number of rows processed
+        """
+        self.rows += count
+
+    def add_bytes(self, count: int):
+        """
+        Add processed bytes to the span.
+
+        Args:
+            count: Number of bytes processed
+        """
+        self.bytes += count
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "name": self.name,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "thread_id": self.thread_id,
+            "start_seconds": self.start_time,
+            "duration_seconds": self.duration_seconds,
+            "cpu_seconds": self.cpu_seconds,
+            "start_memory_mb": self.start_memory_mb,
+            "peak_memory_mb": self.peak_memory_mb,
+            "rows": self.rows,
+            "bytes": self.bytes,
+            "attributes": self.attributes
+        }
+
+
+class RssSampler(threading.Thread):
+    """
+    Background thread sampling the process RSS at a fixed interval,
+    so peaks between explicit measurements are not missed.
+    """
+
+    def __init__(self, monitor: "PerformanceMonitor", interval: float):
+        """
+        Initialize RSS sampler.
+
+        Args:
+            monitor: Monitor receiving the samples
+            interval: Seconds between samples
+        """
+        super().__init__(name="rss-sampler", daemon=True)
+        self.monitor = monitor
+        self.interval = interval
+        self._stop_event = threading.Event()
+
+    def run(self):
+        """Sample until stopped."""
+        while not self._stop_event.wait(self.interval):
+            self.monitor._sample_memory()
+
+    def stop(self):
+        """Stop sampling and wait for the thread to exit."""
+        self._stop_event.set()
+        self.join()
+
+
 class PerformanceMonitor:
     """
     Monitor performance metrics during file comparison operations.
     """
 
-    def __init__(self, operation_name: str = "Operation"):
+    # Seconds between background RSS samples
+    DEFAULT_SAMPLE_INTERVAL = 0.1
+
+    # Allocation sites reported when tracemalloc is enabled
+    TRACEMALLOC_TOP_STATS = 25
+
+    def __init__(
+        self,
+        operation_name: str = "Operation",
+        sample_interval: Optional[float] = DEFAULT_SAMPLE_INTERVAL,
+        profile_cpu: bool = False,
+        trace_memory: bool = False
+    ):
         """
         Initialize performance monitor.
 
         Args:
             operation_name: Name of the operation being monitored
+            sample_interval: Seconds between background RSS samples (None = no sampler thread)
+            profile_cpu: Capture a cProfile profile until complete()
+            trace_memory: Trace Python allocations with tracemalloc until complete()
         """
         self.operation_name = operation_name
         self.metrics = PerformanceMetrics(operation_name=operation_name)
@@ -93,6 +211,30 @@ class PerformanceMonitor:
         self._update_memory()
         self.metrics.start_memory_mb = self._get_memory_mb()
 
+        self.spans: List[Span] = []
+        self.memory_samples: List[Tuple[float, float]] = []  # (seconds since start, RSS MB)
+        self._open_spans: Dict[int, Span] = {}
+        self._thread_stacks = threading.local()
+        self._lock = threading.Lock()
+        self._start = time.perf_counter()
+        self._completed = False
+
+        self.profiler: Optional[cProfile.Profile] = None
+        if profile_cpu:
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+
+        self.trace_memory = trace_memory and not tracemalloc.is_tracing()
+        self.tracemalloc_peak_mb: Optional[float] = None
+        self.tracemalloc_top: List[Dict[str, Any]] = []
+        if self.trace_memory:
+            tracemalloc.start()
+
+        self.sampler: Optional[RssSampler] = None
+        if sample_interval:
+            self.sampler = RssSampler(self, sample_interval)
+            self.sampler.start()
+
     def _get_memory_mb(self) -> float:
         """Get current memory usage in MB."""
         try:
@@ -106,6 +248,103 @@ class PerformanceMonitor:
         if current_memory > self.metrics.peak_memory_mb:
             self.metrics.peak_memory_mb = current_memory
 
+    def _sample_memory(self):
+        """Record an RSS sample and raise the peak of every open span."""
+        current_memory = self._get_memory_mb()
+
+        with self._lock:
+            self.memory_samples.append((time.perf_counter() - self._start, current_memory))
+            if current_memory > self.metrics.peak_memory_mb:
+                self.metrics.peak_memory_mb = current_memory
+            for span in self._open_spans.values():
+                if current_memory > span.peak_memory_mb:
+                    span.peak_memory_mb = current_memory
+
+    def _span_stack(self) -> List[Span]:
+        """Get the open spans of the calling thread (innermost last)."""
+        if not hasattr(self._thread_stacks, "stack"):
+            self._thread_stacks.stack = []
+        return self._thread_stacks.stack
+
+    def current_span(self) -> Optional[Span]:
+        """Get the calling thread's innermost open span."""
+        stack = self._span_stack()
+        return stack[-1] if stack else None
+
+    @contextmanager
+    def span(self, name: str, parent: Optional[Span] = None, **attributes) -> Iterator[Span]:
+        """
+        Context manager recording a span nested in the calling thread's current span.
+
+        Args:
+            name: Span name (e.g. read, hash, index, join, diff, write)
+            parent: Span to nest under when the calling thread has no open span
+                (e.g. the span of the thread that started a worker thread)
+            **attributes: Extra values stored with the span
+
+        Yields:
+            Span to add rows and bytes to
+        """
+        stack = self._span_stack()
+        memory_mb = self._get_memory_mb()
+        if stack:
+            parent = stack[-1]
+
+        with self._lock:
+            span = Span(
+                name=name,
+                span_id=len(self.spans),
+                parent_id=parent.span_id if parent else None,
+                thread_id=threading.get_ident(),
+                start_time=time.perf_counter() - self._start,
+                start_cpu=time.process_time(),
+                start_memory_mb=memory_mb,
+                peak_memory_mb=memory_mb,
+                attributes=attributes
+            )
+            self.spans.append(span)
+            self._open_spans[span.span_id] = span
+
+        stack.append(span)
+        try:
+            yield span
+        finally:
+            stack.pop()
+            memory_mb = self._get_memory_mb()
+
+            with self._lock:
+                del self._open_spans[span.span_id]
+                span.end_time = time.perf_counter() - self._start
+                span.cpu_seconds = time.process_time() - span.start_cpu
+                span.peak_memory_mb = max(span.peak_memory_mb, memory_mb)
+                if memory_mb > self.metrics.peak_memory_mb:
+                    self.metrics.peak_memory_mb = memory_mb
+
+    def timed_iter(self, iterable: Iterable[T], name: str, **attributes) -> Iterator[T]:
+        """
+        Iterate, recording each step (the time to produce an item) as a span.
+        Rows and bytes are filled in for DataFrame items.
+
+        Args:
+            iterable: Items to iterate (e.g. chunks from a reader)
+            name: Span name for each step
+            **attributes: Extra values stored with each span
+
+        Yields:
+            Items of the iterable
+        """
+        iterator = iter(iterable)
+        while True:
+            with self.span(name, **attributes) as span:
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+                if hasattr(item, "estimated_size"):
+                    span.update_rows(len(item))
+                    span.add_bytes(item.estimated_size())
+            yield item
+
     def update_rows(self, count: int):
         """
         Update the number of rows processed.
@@ -117,10 +356,32 @@ class PerformanceMonitor:
         self._update_memory()
 
     def complete(self):
-        """Mark operation as complete."""
+        """Mark operation as complete and stop sampling and profiling (idempotent)."""
+        if self._completed:
+            return
+        self._completed = True
+
         self.metrics.end_time = time.time()
+        if self.sampler is not None:
+            self.sampler.stop()
         self._update_memory()
 
+        if self.profiler is not None:
+            self.profiler.disable()
+
+        if self.trace_memory:
+            snapshot = tracemalloc.take_snapshot()
+            self.tracemalloc_peak_mb = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+            tracemalloc.stop()
+            self.tracemalloc_top = [
+                {
+                    "location": str(stat.traceback),
+                    "size_mb": stat.size / (1024 * 1024),
+                    "count": stat.count
+                }
+                for stat in snapshot.statistics("lineno")[:self.TRACEMALLOC_TOP_STATS]
+            ]
+
     def get_metrics(self) -> PerformanceMetrics:
         """Get current metrics."""
         return self.metrics
@@ -130,7 +391,7 @@ class PerformanceMonitor:
         console.print(f"\n[bold green]{self.metrics.summary()}[/bold green]")
 
     @contextmanager
-    def track_operation(self, operation_name: str):
+    def track_operation(self, operation_name: str) -> Iterator[Span]:
         """
         Context manager for tracking sub-operations.
 
@@ -138,13 +399,132 @@ class PerformanceMonitor:
             operation_name: Name of sub-operation
 
         Yields:
-            PerformanceMonitor instance for the sub-operation
+            Span for the sub-operation (kept in spans)
         """
-        sub_monitor = PerformanceMonitor(operation_name)
-        try:
-            yield sub_monitor
-        finally:
-            sub_monitor.complete()
+        with self.span(operation_name) as span:
+            yield span
+
+    def get_phase_timings(self) -> Dict[str, float]:
+        """
+        Get the wall time of top-level spans, summed by name.
+
+        Returns:
+            Dictionary mapping span name to seconds
+        """
+        timings: Dict[str, float] = {}
+        for span in self.spans:
+            if span.parent_id is None:
+                timings[span.name] = timings.get(span.name, 0.0) + span.duration_seconds
+        return timings
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Build the JSON trace: metrics, spans, RSS samples and allocation stats.
+
+        Returns:
+            Trace dictionary
+        """
+        return {
+            "operation": self.operation_name,
+            "pid": os.getpid(),
+            "duration_seconds": self.metrics.duration_seconds,
+            "rows_processed": self.metrics.rows_processed,
+            "start_memory_mb": self.metrics.start_memory_mb,
+            "peak_memory_mb": self.metrics.peak_memory_mb,
+            "phase_timings": self.get_phase_timings(),
+            "spans": [span.to_dict() for span in self.spans],
+            "memory_samples": [
+                {"seconds": seconds, "rss_mb": rss_mb} for seconds, rss_mb in self.memory_samples
+            ],
+            "tracemalloc": {
+                "peak_mb": self.tracemalloc_peak_mb,
+                "top": self.tracemalloc_top
+            } if self.tracemalloc_peak_mb is not None else None
+        }
+
+    def write_trace(self, filepath: Path) -> Path:
+        """
+        Write the JSON trace.
+
+        Args:
+            filepath: Output path
+
+        Returns:
+            Path of the written file
+        """
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        filepath.write_text(json.dumps(self.to_dict(), indent=2, default=str), encoding="utf-8")
+        return filepath
+
+    def write_chrome_trace(self, filepath: Path) -> Path:
+        """
+        Write spans and RSS samples in Chrome trace event format.
+
+        Args:
+            filepath: Output path
+
+        Returns:
+            Path of the written file
+        """
+        pid = os.getpid()
+        events: List[Dict[str, Any]] = [{
+            "name": "process_name",
+            "ph": "M",
+            "pid": pid,
+            "args": {"name": self.operation_name}
+        }]
+
+        for span in self.spans:
+            if span.end_time is None:
+                continue
+            events.append({
+                "name": span.name,
+                "cat": "span",
+                "ph": "X",
+                "pid": pid,
+                "tid": span.thread_id,
+                "ts": span.start_time * 1_000_000,
+                "dur": span.duration_seconds * 1_000_000,
+                "args": {
+                    "cpu_seconds": span.cpu_seconds,
+                    "rows": span.rows,
+                    "bytes": span.bytes,
+                    "peak_memory_mb": span.peak_memory_mb,
+                    **span.attributes
+                }
+            })
+
+        for seconds, rss_mb in self.memory_samples:
+            events.append({
+                "name": "RSS (MB)",
+                "ph": "C",
+                "pid": pid,
+                "ts": seconds * 1_000_000,
+                "args": {"rss_mb": rss_mb}
+            })
+
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        filepath.write_text(
+            json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}, default=str),
+            encoding="utf-8"
+        )
+        return filepath
+
+    def write_profile(self, filepath: Path) -> Optional[Path]:
+        """
+        Write cProfile statistics (readable with pstats or snakeviz).
+
+        Args:
+            filepath: Output path
+
+        Returns:
+            Path of the written file, or None if profiling is disabled
+        """
+        if self.profiler is None:
+            return None
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        self.profiler.dump_stats(str(filepath))
+        return filepath
 
 
 def format_bytes(bytes_value: int) -> str:
@@ -177,20 +557,32 @@ def format_number(number: int) -> str:
     return f"{number:,}"
 
 
-def estimate_memory_required(row_count: int, column_count: int, avg_cell_size: int = 50) -> int:
+def estimate_memory_required(
+    row_count: int,
+    column_count: int,
+    avg_cell_size: int = 50,
+    sample: Optional[pl.DataFrame] = None,
+    overhead: float = 1.5
+) -> float:
     """
     Estimate memory required for processing a dataset.
+    With a sample, the row size is measured from the sample's in-memory
+    (Arrow) size instead of assumed from avg_cell_size.
 
     Args:
         row_count: Number of rows
         column_count: Number of columns
-        avg_cell_size: Average size per cell in bytes
+        avg_cell_size: Average size per cell in bytes (used without a sample)
+        sample: Optional sample rows of the dataset
+        overhead: Multiplier for processing overhead (1.0 = data only)
 
     Returns:
         Estimated memory in MB
     """
-    total_cells = row_count * column_count
-    estimated_bytes = total_cells * avg_cell_size
-    # Add 50% overhead for processing
-    estimated_bytes = int(estimated_bytes * 1.5)
-    return estimated_bytes // (1024 * 1024)
+    if sample is not None and len(sample) > 0:
+        bytes_per_row = sample.estimated_size() / len(sample)
+    else:
+        bytes_per_row = column_count * avg_cell_size
+
+    estimated_bytes = row_count * bytes_per_row * overhead
+    return estimated_bytes / (1024 * 1024)
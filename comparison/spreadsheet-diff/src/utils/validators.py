@@ -41,7 +41,7 @@ class FileValidator:
     @staticmethod
     def validate_file_format(filepath: Path) -> Tuple[bool, Optional[str]]:
         """
-        Validate file format is supported (CSV or Excel).
+        Validate file format is supported (CSV, Excel, Parquet or Arrow IPC).
 
         Args:
             filepath: Path to file
@@ -55,8 +55,10 @@ class FileValidator:
         if FileFormat.is_excel(filepath):
             return True, None
 
-        supported = FileFormat.CSV_EXTENSIONS | FileFormat.EXCEL_EXTENSIONS
-        return False, f"Unsupported file format '{filepath.suffix}'. Supported: {supported}"
+        if FileFormat.is_parquet(filepath) or FileFormat.is_arrow(filepath):
+            return True, None
+
+        return False, f"Unsupported file format '{filepath.suffix}'. Supported: {FileFormat.describe_supported()}"
 
     @staticmethod
     def validate_key_column(